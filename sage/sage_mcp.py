@@ -5,7 +5,7 @@ Main SageMCP class - integrates all services for secure API key management and p
 import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List
+from typing import Callable, Dict, Any, Optional, List, Tuple
 
 from .services.key_manager import KeyManager
 from .services.authorization_engine import AuthorizationEngine
@@ -13,10 +13,17 @@ from .services.policy_engine import PolicyEngine
 from .services.logging_service import LoggingService
 from .services.proxy_service import ProxyService
 from .services.mcp_interface import MCPInterface, CoralErrorResponse
+from .models.privacy_audit_log import PrivacyAuditLog
 
 
 logger = logging.getLogger(__name__)
 
+# Most (owner_session, key_id) entries SageMCP keeps from list_keys calls
+_LISTED_KEYS_MAXSIZE = 4096
+
+# MCP methods that add or remove stored keys
+_KEY_CHANGING_METHODS = frozenset({"add_key", "revoke_key"})
+
 
 class SageMCP:
     """
@@ -56,6 +63,19 @@ class SageMCP:
             proxy_service=self.proxy_service
         )
         
+        # Key metadata by (owner_session, key_id), filled by list_keys and
+        # invalidated on revoke
+        self._listed_keys: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        
+        # Optional non-blocking sink for successful proxy_call audit logs. When
+        # set (e.g. to an asyncio.Queue's put_nowait), proxy_call hands it the
+        # validated PrivacyAuditLog instead of writing the log inline.
+        self.enqueue_log: Optional[Callable[[PrivacyAuditLog], None]] = None
+        
+        # Optional callback run with the owner session after a key is added or
+        # revoked, so callers can drop key lists they have memoized.
+        self.on_keys_changed: Optional[Callable[[str], None]] = None
+        
         logger.info("SageMCP initialized with all services")
     
     async def add_key(self, key_name: str, api_key: str, owner_session: str) -> str:
@@ -101,6 +121,9 @@ class SageMCP:
                 logger.warning(f"Failed to log add_key operation: {log_error}")
                 # Don't fail the operation due to logging errors
             
+            if self.on_keys_changed is not None:
+                self.on_keys_changed(owner_session)
+            
             logger.info(f"Successfully added key '{key_name}' for owner {owner_id}")
             return key_id
             
@@ -281,16 +304,27 @@ class SageMCP:
                 response_time=response_time
             )
             
-            # Log the successful API call
-            await self.logging_service.log_proxy_call(
+            # Log the successful API call; the entry is validated here so bad
+            # input fails this call rather than a later queued batch
+            log_entry = self.logging_service._new_log_entry(
                 caller_id=caller_id,
                 key_id=key_id,
+                action="proxy_call",
                 method=method,
                 endpoint=endpoint,
                 payload_size=payload_size,
                 response_time=response_time,
                 response_code=response_data.get("status_code", 200)
             )
+            queued = False
+            if self.enqueue_log is not None:
+                try:
+                    self.enqueue_log(log_entry)
+                    queued = True
+                except asyncio.QueueFull:
+                    pass  # Fall back to writing the log inline
+            if not queued:
+                await self.logging_service.write_log_entries([log_entry])
             
             # Return response without exposing key details
             result = {
@@ -421,6 +455,10 @@ class SageMCP:
             success = await self.key_manager.revoke_key(key_id, owner_id)
             
             if success:
+                self._listed_keys.pop((owner_session, key_id), None)
+                if self.on_keys_changed is not None:
+                    self.on_keys_changed(owner_session)
+                
                 # Revoke all grants for this key
                 await self.authorization_engine.revoke_grants_for_key(key_id, owner_id)
                 
@@ -446,12 +484,13 @@ class SageMCP:
             logger.error(f"Error revoking key {key_id}: {e}")
             return False
     
-    async def list_keys(self, owner_session: str) -> List[Dict[str, Any]]:
+    async def list_keys(self, owner_session: str, raise_errors: bool = False) -> List[Dict[str, Any]]:
         """
         List all keys for an owner (metadata only)
         
         Args:
             owner_session: Coral session ID of the key owner
+            raise_errors: Re-raise failures instead of returning an empty list
             
         Returns:
             List of key metadata dictionaries
@@ -462,14 +501,32 @@ class SageMCP:
             
             # Get keys from key manager
             keys = await self.key_manager.list_keys(owner_id)
+            if len(self._listed_keys) + len(keys) > _LISTED_KEYS_MAXSIZE:
+                self._listed_keys.clear()
+            self._listed_keys.update(((owner_session, key["key_id"]), key) for key in keys)
             
             logger.info(f"Listed {len(keys)} keys for owner {owner_id}")
             return keys
             
         except Exception as e:
             logger.error(f"Error listing keys: {e}")
+            if raise_errors:
+                raise
             return []
     
+    def get_cached_key(self, key_id: str, owner_session: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up key metadata seen by a previous list_keys call for this owner
+        
+        Args:
+            key_id: ID of the key
+            owner_session: Coral session ID of the key owner
+            
+        Returns:
+            Key metadata dictionary, or None if the owner has not listed the key
+        """
+        return self._listed_keys.get((owner_session, key_id))
+    
     async def get_usage_stats(self, key_id: str, owner_session: str, 
                             days: int = 7) -> Dict[str, Any]:
         """
@@ -545,4 +602,8 @@ class SageMCP:
         Returns:
             MCP response dictionary
         """
-        return await self.mcp_interface.handle_mcp_request(request)
\ No newline at end of file
+        response = await self.mcp_interface.handle_mcp_request(request)
+        if (self.on_keys_changed is not None and response.get("success")
+                and request.get("method") in _KEY_CHANGING_METHODS):
+            self.on_keys_changed(request.get("session_id", ""))
+        return response
\ No newline at end of file
@@ -14,6 +14,40 @@ from ..models.access_grant import AccessGrant
 
 logger = logging.getLogger(__name__)
 
+_INSERT_GRANT_SQL = """
+    INSERT OR REPLACE INTO access_grants 
+    (grant_id, key_id, caller_id, permissions, created_at, 
+     expires_at, is_active, granted_by)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _validate_grant_inputs(key_id: str, caller_id: str, owner_id: str, permissions: Dict[str, Any],
+                           expires_at: datetime, allow_past_expiry: bool) -> None:
+    """Validate create_grant arguments, raising ValueError on the first failure"""
+    if not key_id or not key_id.strip():
+        raise ValueError("Key ID cannot be empty")
+    
+    if not caller_id or not caller_id.strip():
+        raise ValueError("Caller ID cannot be empty")
+    
+    if not owner_id or not owner_id.strip():
+        raise ValueError("Owner ID cannot be empty")
+    
+    if not isinstance(permissions, dict):
+        raise ValueError("Permissions must be a dictionary")
+    
+    if not allow_past_expiry and expires_at <= datetime.utcnow():
+        raise ValueError("Expiry time must be in the future")
+    
+    # Validate required permissions
+    if 'max_calls_per_day' not in permissions:
+        raise ValueError("Permissions must include max_calls_per_day")
+    
+    max_calls = permissions['max_calls_per_day']
+    if not isinstance(max_calls, int) or max_calls <= 0:
+        raise ValueError("max_calls_per_day must be a positive integer")
+
 
 class AuthorizationEngine:
     """
@@ -21,12 +55,17 @@ class AuthorizationEngine:
     Handles grant creation, validation, expiration, and cleanup processes
     """
     
+    # Stored in PRAGMA user_version once the schema below has been created;
+    # bump it whenever the DDL in _init_database changes
+    _SCHEMA_VERSION = 1
+    
     def __init__(self, db_path: str = "sage_grants.db"):
         """
         Initialize authorization engine with SQLite storage
         
         Args:
-            db_path: Path to SQLite database file for grants
+            db_path: Path to SQLite database file for grants, or a "file:" URI
+                     (e.g. a shared in-memory database)
         """
         self.db_path = db_path
         self._init_database()
@@ -34,6 +73,10 @@ class AuthorizationEngine:
     def _init_database(self) -> None:
         """Initialize SQLite database with required tables"""
         with self._get_connection() as conn:
+            # Skip the DDL entirely for databases already at the current schema
+            if conn.execute("PRAGMA user_version").fetchone()[0] == self._SCHEMA_VERSION:
+                return
+            
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS access_grants (
                     grant_id TEXT PRIMARY KEY,
@@ -64,18 +107,34 @@ class AuthorizationEngine:
                 ON access_grants(granted_by)
             """)
             
+            conn.execute(f"PRAGMA user_version = {self._SCHEMA_VERSION}")
             conn.commit()
     
     @contextmanager
     def _get_connection(self):
         """Context manager for database connections"""
-        conn = sqlite3.connect(self.db_path)
+        conn = sqlite3.connect(self.db_path, uri=self.db_path.startswith("file:"))
         conn.row_factory = sqlite3.Row  # Enable column access by name
         try:
             yield conn
         finally:
             conn.close()
     
+    def _grant_row(self, grant: AccessGrant) -> tuple:
+        """Convert AccessGrant instance to an access_grants row for _INSERT_GRANT_SQL"""
+        import json
+        
+        return (
+            grant.grant_id,
+            grant.key_id,
+            grant.caller_id,
+            json.dumps(grant.permissions),
+            grant.created_at.isoformat(),
+            grant.expires_at.isoformat(),
+            1 if grant.is_active else 0,
+            grant.granted_by
+        )
+    
     def _row_to_access_grant(self, row) -> AccessGrant:
         """Convert database row to AccessGrant instance"""
         import json
@@ -111,27 +170,7 @@ class AuthorizationEngine:
             RuntimeError: If grant creation fails
         """
         # Validate inputs
-        if not key_id or not key_id.strip():
-            raise ValueError("Key ID cannot be empty")
-        
-        if not caller_id or not caller_id.strip():
-            raise ValueError("Caller ID cannot be empty")
-        
-        if not owner_id or not owner_id.strip():
-            raise ValueError("Owner ID cannot be empty")
-        
-        if not isinstance(permissions, dict):
-            raise ValueError("Permissions must be a dictionary")
-        
-        if not _allow_past_expiry and expires_at <= datetime.utcnow():
-            raise ValueError("Expiry time must be in the future")
-        
-        # Validate required permissions
-        if 'max_calls_per_day' not in permissions:
-            raise ValueError("Permissions must include max_calls_per_day")
-        
-        if not isinstance(permissions['max_calls_per_day'], int) or permissions['max_calls_per_day'] <= 0:
-            raise ValueError("max_calls_per_day must be a positive integer")
+        _validate_grant_inputs(key_id, caller_id, owner_id, permissions, expires_at, _allow_past_expiry)
         
         try:
             # Create new grant
@@ -144,23 +183,8 @@ class AuthorizationEngine:
             )
             
             # Store in database
-            import json
             with self._get_connection() as conn:
-                conn.execute("""
-                    INSERT OR REPLACE INTO access_grants 
-                    (grant_id, key_id, caller_id, permissions, created_at, 
-                     expires_at, is_active, granted_by)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    grant.grant_id,
-                    grant.key_id,
-                    grant.caller_id,
-                    json.dumps(grant.permissions),
-                    grant.created_at.isoformat(),
-                    grant.expires_at.isoformat(),
-                    1 if grant.is_active else 0,
-                    grant.granted_by
-                ))
+                conn.execute(_INSERT_GRANT_SQL, self._grant_row(grant))
                 conn.commit()
             
             logger.info(f"Created grant {grant.grant_id} for caller {caller_id} on key {key_id}")
@@ -170,6 +194,50 @@ class AuthorizationEngine:
             logger.error(f"Failed to create grant for caller {caller_id} on key {key_id}: {str(e)}")
             raise RuntimeError(f"Grant creation failed: {str(e)}")
     
+    async def create_grants_bulk(self, grants: List[Dict[str, Any]]) -> List[str]:
+        """
+        Create several access grants in a single transaction
+        
+        Args:
+            grants: List of dicts with key_id, caller_id, permissions, expires_at
+                    and owner_id, as accepted by create_grant
+            
+        Returns:
+            List of grant_ids in the same order as the input
+            
+        Raises:
+            ValueError: If any grant's parameters are invalid (nothing is stored)
+            RuntimeError: If grant creation fails
+        """
+        # Validate everything up front so a bad entry stores nothing
+        for spec in grants:
+            _validate_grant_inputs(spec['key_id'], spec['caller_id'], spec['owner_id'],
+                                   spec['permissions'], spec['expires_at'], False)
+        
+        try:
+            new_grants = [
+                AccessGrant.create_new(
+                    key_id=spec['key_id'],
+                    caller_id=spec['caller_id'],
+                    permissions=spec['permissions'],
+                    expires_at=spec['expires_at'],
+                    granted_by=spec['owner_id']
+                )
+                for spec in grants
+            ]
+            
+            # One executemany and one commit instead of a transaction per grant
+            with self._get_connection() as conn:
+                conn.executemany(_INSERT_GRANT_SQL, [self._grant_row(grant) for grant in new_grants])
+                conn.commit()
+            
+            logger.info(f"Created {len(new_grants)} grants in bulk")
+            return [grant.grant_id for grant in new_grants]
+            
+        except Exception as e:
+            logger.error(f"Failed to create {len(grants)} grants in bulk: {str(e)}")
+            raise RuntimeError(f"Grant creation failed: {str(e)}")
+    
     async def check_authorization(self, key_id: str, caller_session: str) -> bool:
         """
         Check if a caller is authorized to use a specific key
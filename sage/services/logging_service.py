@@ -15,6 +15,15 @@ from ..models.privacy_audit_log import PrivacyAuditLog
 
 logger = logging.getLogger(__name__)
 
+_INSERT_AUDIT_LOG_SQL = """
+    INSERT INTO audit_logs 
+    (log_id, timestamp, caller_id, key_id, action, method, 
+     endpoint, payload_size, response_time, response_code, error_message)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_LOG_SEQUENCE_SQL = "INSERT INTO log_sequence (log_id) VALUES (?)"
+
 
 class LoggingService:
     """
@@ -156,6 +165,53 @@ class LoggingService:
             error_message=error_message
         )
     
+    async def log_proxy_calls(self, calls: List[Dict[str, Any]]) -> List[str]:
+        """
+        Log a batch of proxy calls in a single transaction
+        
+        Args:
+            calls: One dict of log_proxy_call keyword arguments per call
+            
+        Returns:
+            List of log_ids, in the order of calls
+            
+        Raises:
+            ValueError: If any entry's parameters are invalid (nothing is written)
+            RuntimeError: If logging operation fails
+        """
+        return await self.write_log_entries(
+            [self._new_log_entry(action="proxy_call", **call) for call in calls]
+        )
+    
+    async def write_log_entries(self, log_entries: List[PrivacyAuditLog]) -> List[str]:
+        """
+        Write already validated log entries (from _new_log_entry) in a single transaction
+        
+        Args:
+            log_entries: Unsaved log entries
+            
+        Returns:
+            List of log_ids, in the order of log_entries
+            
+        Raises:
+            RuntimeError: If logging operation fails (nothing is written)
+        """
+        if not log_entries:
+            return []
+        
+        try:
+            with self._get_connection() as conn:
+                conn.executemany(_INSERT_AUDIT_LOG_SQL, [self._log_entry_row(entry) for entry in log_entries])
+                conn.executemany(_INSERT_LOG_SEQUENCE_SQL, [(entry.log_id,) for entry in log_entries])
+                conn.commit()
+            
+            logger.debug(f"Created {len(log_entries)} audit logs")
+            return [entry.log_id for entry in log_entries]
+            
+        except Exception as e:
+            logger.error(f"Failed to create {len(log_entries)} audit logs: {str(e)}")
+            raise RuntimeError(f"Audit logging failed: {str(e)}")
+    
     async def log_grant_access(self, caller_id: str, key_id: str, granted_to: str,
                              permissions: Dict[str, Any]) -> str:
         """
@@ -242,30 +298,15 @@ class LoggingService:
             error_message=reason
         )
     
-    async def _create_log_entry(self, caller_id: str, key_id: str, action: str,
-                              method: str, endpoint: str, payload_size: int,
-                              response_time: float, response_code: int,
-                              error_message: Optional[str] = None) -> str:
+    def _new_log_entry(self, caller_id: str, key_id: str, action: str,
+                       method: str, endpoint: str, payload_size: int,
+                       response_time: float, response_code: int,
+                       error_message: Optional[str] = None) -> PrivacyAuditLog:
         """
-        Internal method to create a log entry with tamper-resistant storage
+        Validate log fields and create a new (unsaved) log entry
         
-        Args:
-            caller_id: Coral ID of the caller
-            key_id: ID of the key
-            action: Action being logged
-            method: HTTP method
-            endpoint: Target endpoint
-            payload_size: Payload size in bytes
-            response_time: Response time in milliseconds
-            response_code: HTTP response code
-            error_message: Optional error message
-            
-        Returns:
-            log_id: Unique identifier for the created log entry
-            
         Raises:
             ValueError: If parameters are invalid
-            RuntimeError: If logging operation fails
         """
         # Validate inputs
         if not caller_id or not caller_id.strip():
@@ -289,46 +330,79 @@ class LoggingService:
         if response_time < 0:
             raise ValueError("Response time cannot be negative")
         
-        try:
-            # Create log entry
-            log_entry = PrivacyAuditLog.create_new(
-                caller_id=caller_id,
-                key_id=key_id,
-                action=action,
-                method=method,
-                endpoint=endpoint,
-                payload_size=payload_size,
-                response_time=response_time,
-                response_code=response_code,
-                error_message=error_message
-            )
+        return PrivacyAuditLog.create_new(
+            caller_id=caller_id,
+            key_id=key_id,
+            action=action,
+            method=method,
+            endpoint=endpoint,
+            payload_size=payload_size,
+            response_time=response_time,
+            response_code=response_code,
+            error_message=error_message
+        )
+    
+    def _log_entry_row(self, log_entry: PrivacyAuditLog) -> tuple:
+        """Convert a log entry to the parameter tuple for _INSERT_AUDIT_LOG_SQL"""
+        return (
+            log_entry.log_id,
+            log_entry.timestamp.isoformat(),
+            log_entry.caller_id,
+            log_entry.key_id,
+            log_entry.action,
+            log_entry.method,
+            log_entry.endpoint,
+            log_entry.payload_size,
+            log_entry.response_time,
+            log_entry.response_code,
+            log_entry.error_message
+        )
+    
+    async def _create_log_entry(self, caller_id: str, key_id: str, action: str,
+                              method: str, endpoint: str, payload_size: int,
+                              response_time: float, response_code: int,
+                              error_message: Optional[str] = None) -> str:
+        """
+        Internal method to create a log entry with tamper-resistant storage
+        
+        Args:
+            caller_id: Coral ID of the caller
+            key_id: ID of the key
+            action: Action being logged
+            method: HTTP method
+            endpoint: Target endpoint
+            payload_size: Payload size in bytes
+            response_time: Response time in milliseconds
+            response_code: HTTP response code
+            error_message: Optional error message
             
+        Returns:
+            log_id: Unique identifier for the created log entry
+            
+        Raises:
+            ValueError: If parameters are invalid
+            RuntimeError: If logging operation fails
+        """
+        log_entry = self._new_log_entry(
+            caller_id=caller_id,
+            key_id=key_id,
+            action=action,
+            method=method,
+            endpoint=endpoint,
+            payload_size=payload_size,
+            response_time=response_time,
+            response_code=response_code,
+            error_message=error_message
+        )
+        
+        try:
             # Store in database with tamper-resistant design
             with self._get_connection() as conn:
                 # Insert into main audit_logs table
-                conn.execute("""
-                    INSERT INTO audit_logs 
-                    (log_id, timestamp, caller_id, key_id, action, method, 
-                     endpoint, payload_size, response_time, response_code, error_message)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    log_entry.log_id,
-                    log_entry.timestamp.isoformat(),
-                    log_entry.caller_id,
-                    log_entry.key_id,
-                    log_entry.action,
-                    log_entry.method,
-                    log_entry.endpoint,
-                    log_entry.payload_size,
-                    log_entry.response_time,
-                    log_entry.response_code,
-                    log_entry.error_message
-                ))
+                conn.execute(_INSERT_AUDIT_LOG_SQL, self._log_entry_row(log_entry))
                 
                 # Insert into sequence table for chronological ordering
-                conn.execute("""
-                    INSERT INTO log_sequence (log_id) VALUES (?)
-                """, (log_entry.log_id,))
+                conn.execute(_INSERT_LOG_SEQUENCE_SQL, (log_entry.log_id,))
                 
                 conn.commit()
             
@@ -69,6 +69,14 @@ class MCPInterface:
         self.policy_engine = policy_engine or PolicyEngine()
         self.logging_service = logging_service or LoggingService()
         self.proxy_service = proxy_service or ProxyService()
+        
+        # MCP method name -> handler
+        self._handlers = {
+            "add_key": self._handle_add_key,
+            "grant_access": self._handle_grant_access,
+            "proxy_call": self._handle_proxy_call,
+            "list_logs": self._handle_list_logs,
+        }
     
     async def validate_coral_session(self, session_id: str, wallet_id: Optional[str] = None) -> str:
         """
@@ -127,16 +135,10 @@ class MCPInterface:
                 return self._error_response("AUTH_FAILED", str(e), session_id)
             
             # Route to appropriate handler
-            if method == "add_key":
-                return await self._handle_add_key(params, caller_id, session_id)
-            elif method == "grant_access":
-                return await self._handle_grant_access(params, caller_id, session_id)
-            elif method == "proxy_call":
-                return await self._handle_proxy_call(params, caller_id, session_id)
-            elif method == "list_logs":
-                return await self._handle_list_logs(params, caller_id, session_id)
-            else:
+            handler = self._handlers.get(method)
+            if handler is None:
                 return self._error_response("UNKNOWN_METHOD", f"Unknown method: {method}", session_id)
+            return await handler(params, caller_id, session_id)
                 
         except Exception as e:
             logger.error(f"Unexpected error handling MCP request: {e}")
@@ -7,9 +7,11 @@ import asyncio
 import json
 import logging
 import time
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, Optional, Tuple, Union
 from urllib.parse import urlparse
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 
@@ -18,30 +20,44 @@ class ProxyService:
     HTTP client for external API calls with key injection and performance tracking
     """
     
-    def __init__(self, timeout: int = 30):
+    def __init__(self, timeout: int = 30, max_connections: int = 200,
+                 max_connections_per_host: int = 100):
         """
         Initialize proxy service
         
         Args:
             timeout: Request timeout in seconds
+            max_connections: Maximum pooled connections across all hosts
+            max_connections_per_host: Maximum pooled connections to a single host
         """
         self.timeout = timeout
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
         self._session = None
     
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create HTTP session"""
         if self._session is None or self._session.closed:
-            timeout = aiohttp.ClientTimeout(total=self.timeout)
-            self._session = aiohttp.ClientSession(timeout=timeout)
+            timeout = aiohttp.ClientTimeout(total=self.timeout, connect=5)
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.max_connections_per_host,
+                ttl_dns_cache=300
+            )
+            self._session = aiohttp.ClientSession(timeout=timeout, connector=connector)
         return self._session
     
+    async def open(self):
+        """Create the pooled HTTP session up front instead of on the first call"""
+        await self._get_session()
+    
     async def close(self):
         """Close HTTP session"""
         if self._session and not self._session.closed:
             await self._session.close()
     
     async def make_proxied_call(self, target_url: str, method: str, headers: Optional[Dict[str, str]] = None,
-                               body: Optional[Dict[str, Any]] = None, api_key: str = None) -> Tuple[Dict[str, Any], float, int]:
+                               body: Optional[Union[Dict[str, Any], bytes]] = None, api_key: str = None) -> Tuple[Dict[str, Any], float, int]:
         """
         Make a proxied HTTP call with key injection and performance tracking
         
@@ -49,7 +65,7 @@ class ProxyService:
             target_url: Target API URL
             method: HTTP method (GET, POST, etc.)
             headers: Request headers
-            body: Request body
+            body: Request body (a dict is JSON-encoded, raw bytes are forwarded untouched)
             api_key: API key to inject
             
         Returns:
@@ -78,8 +94,13 @@ class ProxyService:
         request_body = None
         if body:
             if method.upper() in ['POST', 'PUT', 'PATCH']:
-                request_body = json.dumps(body) if isinstance(body, dict) else str(body)
-                payload_size = len(request_body.encode('utf-8'))
+                if isinstance(body, bytes):
+                    request_body = body
+                elif isinstance(body, dict):
+                    request_body = orjson.dumps(body)
+                else:
+                    request_body = str(body).encode('utf-8')
+                payload_size = len(request_body)
                 if 'content-type' not in [h.lower() for h in request_headers.keys()]:
                     request_headers['Content-Type'] = 'application/json'
         
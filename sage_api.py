@@ -4,45 +4,242 @@ Sage MCP FastAPI Service
 
 This FastAPI service exposes Sage MCP functionality as REST endpoints.
 It can be used directly or wrapped as an MCP server for Coral integration.
+
+All route handlers, dependencies and exception handlers MUST be `async def`:
+FastAPI runs plain `def` callables on the limited AnyIO threadpool, which
+adds a thread hop per request and caps throughput under load.
 """
 
-from fastapi import FastAPI, HTTPException, Depends, Header
+from fastapi import APIRouter, FastAPI, HTTPException, Depends, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
-from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel, Field
-from typing import Dict, Any, List, Optional
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Dict, Any, List, Mapping, Optional, Tuple
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from contextvars import ContextVar
+from types import MappingProxyType
 import asyncio
 import logging
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
 import os
 
+import orjson
+
 from sage.sage_mcp import SageMCP
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+# Pre-encoded health check bodies, refreshed once per second
+_health_body = b""
+_mcp_health_body = b""
+
+
+def _refresh_health_bodies():
+    """Re-encode the health check bodies with the current timestamp"""
+    global _health_body, _mcp_health_body
+    timestamp = datetime.utcnow().isoformat()
+    _health_body = orjson.dumps({"status": "healthy", "timestamp": timestamp})
+    _mcp_health_body = orjson.dumps({"status": "healthy", "service": "sage_mcp", "timestamp": timestamp})
+
+
+async def _refresh_health_loop():
+    """Keep the health check timestamps current while the app is running"""
+    while True:
+        _refresh_health_bodies()
+        await asyncio.sleep(1)
+
+
+_refresh_health_bodies()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create the SageMCP instance on startup and close it on shutdown"""
+    app.state.sage = SageMCP()
+    app.state.sage.on_keys_changed = _invalidate_keys_cache
+    # Open the proxy's pooled upstream connections once for the app's lifetime
+    await app.state.sage.proxy_service.open()
+    health_task = asyncio.create_task(_refresh_health_loop())
+    logger.info("Sage MCP API service started successfully")
+    try:
+        yield
+    finally:
+        health_task.cancel()
+        await app.state.sage.close()
+        logger.info("Sage MCP API service shut down successfully")
+
+
+# Request start time, set once per request by CoralSessionMiddleware
+_NOW: ContextVar[datetime] = ContextVar("now")
+
+# Session used when a request carries no Coral session headers (demo mode)
+_DEFAULT_SESSION = "coral_demo_session_default"
+_BEARER_PREFIX = b"Bearer "
+_BEARER_PREFIX_LEN = len(_BEARER_PREFIX)
+
+# With SAGE_STRICT_AUTH=1, requests without session headers are rejected
+STRICT_AUTH = os.getenv("SAGE_STRICT_AUTH") == "1"
+
+
+class CoralSessionMiddleware:
+    """
+    Pure ASGI middleware that extracts the Coral session ID from headers
+    and records the request start time in _NOW
+    
+    The session is read from X-Coral-Session first, then from an
+    Authorization Bearer token, and falls back to default_session when
+    neither header is present. The result is stored in the request state as
+    coral_session (None if an Authorization header without a Bearer token
+    was supplied, or if no headers were sent and default_session is None).
+    """
+    
+    def __init__(self, app, default_session: Optional[str] = _DEFAULT_SESSION):
+        self.app = app
+        self.default_session = default_session
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            x_coral_session = None
+            authorization = None
+            for name, value in scope["headers"]:
+                if name == b"x-coral-session":
+                    x_coral_session = value
+                elif name == b"authorization":
+                    authorization = value
+            
+            if x_coral_session:
+                session = x_coral_session.decode("latin-1")
+            elif not authorization:
+                session = self.default_session
+            elif authorization.startswith(_BEARER_PREFIX):
+                session = authorization[_BEARER_PREFIX_LEN:].decode("latin-1")
+            else:
+                session = None
+            
+            scope.setdefault("state", {})["coral_session"] = session
+            _NOW.set(datetime.utcnow())
+        
+        await self.app(scope, receive, send)
+
+
+# API docs (and the OpenAPI schema build) are skipped in production unless
+# explicitly requested with SAGE_ENABLE_DOCS=1
+_default_docs = "0" if os.getenv("ENVIRONMENT") == "production" else "1"
+ENABLE_DOCS = os.getenv("SAGE_ENABLE_DOCS", _default_docs) == "1"
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Sage MCP API",
     description="Secure API Key Management and Proxying Service",
     version="1.0.0",
-    docs_url="/docs",
-    redoc_url="/redoc"
+    docs_url="/docs" if ENABLE_DOCS else None,
+    redoc_url="/redoc" if ENABLE_DOCS else None,
+    openapi_url="/openapi.json" if ENABLE_DOCS else None,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
+)
+app.router.redirect_slashes = False
+
+# Extract the Coral session ID once per request
+app.add_middleware(CoralSessionMiddleware, default_session=None if STRICT_AUTH else _DEFAULT_SESSION)
+
+# Frontend origins allowed by CORS (comma-separated CORS_ORIGINS overrides the defaults)
+CORS_ORIGINS = tuple(
+    origin.strip()
+    for origin in os.getenv(
+        "CORS_ORIGINS", "http://localhost:8080,http://127.0.0.1:8080,http://localhost:8001"
+    ).split(",")
+    if origin.strip()
 )
 
-# Add CORS middleware
+# Add CORS middleware (Starlette pre-joins the allow-* header values once at init)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["http://localhost:8080", "http://127.0.0.1:8080", "http://localhost:8001", "*"],  # Allow frontend origins
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-    allow_headers=["*"],
+    allow_methods=("GET", "POST", "PUT", "DELETE", "OPTIONS"),
+    allow_headers=("content-type", "authorization", "x-coral-session"),
+)
+
+# Compress large responses (logs, proxied payloads); small bodies pass through
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# Details of the fixed-message errors; each raise builds a fresh HTTPException
+# so no request's traceback outlives it
+_MISSING_SESSION_DETAIL = (
+    "Missing Coral session ID. Provide X-Coral-Session header or Authorization Bearer token."
 )
+_KEY_NOT_FOUND_DETAIL = "Key not found or access denied"
+_UI_KEY_NOT_FOUND_DETAIL = "Key not found"
+_INVALID_EXPIRY_DATE_DETAIL = "Invalid expiry date format. Use YYYY-MM-DD"
+_EXPIRY_IN_PAST_DETAIL = "Expiry date must be in the future"
+_GRANT_FAILED_DETAIL = "Failed to create grant"
+_GRANT_ACCESS_FAILED_DETAIL = "Failed to grant access"
+
+# Pre-encoded error bodies for the fixed-message errors, keyed by detail
+_ERROR_BODIES = {
+    detail: orjson.dumps({"success": False, "error": detail})
+    for detail in (
+        _MISSING_SESSION_DETAIL,
+        _KEY_NOT_FOUND_DETAIL,
+        _UI_KEY_NOT_FOUND_DETAIL,
+        _INVALID_EXPIRY_DATE_DETAIL,
+        _EXPIRY_IN_PAST_DETAIL,
+        _GRANT_FAILED_DETAIL,
+        _GRANT_ACCESS_FAILED_DETAIL,
+    )
+}
+_500_BYTES = orjson.dumps({"success": False, "error": "Internal server error"})
+
+
+@lru_cache(maxsize=256)
+def _encode_error(detail: str) -> bytes:
+    """Encode an error body for a string HTTPException detail"""
+    return orjson.dumps({"success": False, "error": detail})
+
+
+class _ErrorSampler:
+    """Rate-limit error logging to at most max_per_second lines per route"""
+    
+    def __init__(self, max_per_second: int = 10):
+        self.max_per_second = max_per_second
+        self._windows: Dict[str, List] = {}
+    
+    def allow(self, route: str) -> bool:
+        """Return True if an error for this route may be logged now"""
+        now = time.monotonic()
+        window = self._windows.get(route)
+        if window is None or now - window[0] >= 1.0:
+            self._windows[route] = [now, 1]
+            return True
+        window[1] += 1
+        return window[1] <= self.max_per_second
+
 
-# Global SageMCP instance
-sage_instance: Optional[SageMCP] = None
+# Error log sampler for endpoints reachable by unauthenticated scanners
+_error_sampler = _ErrorSampler()
+
+# Shared read-only default for omitted headers/body/filters
+_EMPTY_MAP: Mapping[str, Any] = MappingProxyType({})
+
+# Worker processes started by __main__: one per core in production
+_WORKERS = (os.cpu_count() or 1) if os.getenv("ENVIRONMENT") == "production" else 1
+
+# Per-session list_keys results, reused for _KEYS_CACHE_TTL seconds. The memo
+# and its invalidation are per process, so it is off when several workers
+# serve the API: a key added or revoked through one would go unseen by others.
+_KEYS_CACHE_TTL = 30.0 if _WORKERS == 1 else 0.0
+_KEYS_CACHE_MAXSIZE = 1024
+_KEYS_CACHE: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+
+# Number of log rows encoded per chunk when streaming /logs
+_LOG_STREAM_CHUNK = 64
 
 
 # Pydantic models for request/response validation
@@ -50,16 +247,17 @@ class AddKeyRequest(BaseModel):
     key_name: str = Field(..., description="Human-readable name for the API key")
     api_key: str = Field(..., description="The API key to store securely")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "key_name": "openai_production_key",
-                "api_key": "sk-1234567890abcdef"
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "key_name": "openai_production_key",
+            "api_key": "sk-1234567890abcdef"
         }
+    })
 
 
 class AddKeyResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    
     success: bool
     key_id: str = Field(..., description="Unique identifier for the stored key")
     message: str
@@ -71,18 +269,19 @@ class GrantAccessRequest(BaseModel):
     permissions: Dict[str, Any] = Field(..., description="Permission settings")
     expiry_hours: int = Field(24, description="Grant expiry in hours")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "key_id": "12345678-1234-1234-1234-123456789abc",
-                "caller_id": "coral_agent_bob_session_456",
-                "permissions": {"max_calls_per_day": 100},
-                "expiry_hours": 24
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "key_id": "12345678-1234-1234-1234-123456789abc",
+            "caller_id": "coral_agent_bob_session_456",
+            "permissions": {"max_calls_per_day": 100},
+            "expiry_hours": 24
         }
+    })
 
 
 class GrantAccessResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    
     success: bool
     message: str
 
@@ -91,25 +290,26 @@ class ProxyCallRequest(BaseModel):
     key_id: str = Field(..., description="ID of the key to use for the API call")
     target_url: str = Field(..., description="Target API URL")
     method: str = Field("GET", description="HTTP method")
-    headers: Optional[Dict[str, str]] = Field(default_factory=dict, description="Request headers")
-    body: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Request body")
+    headers: Optional[Dict[str, str]] = Field(None, description="Request headers")
+    body: Optional[Dict[str, Any]] = Field(None, description="Request body")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "key_id": "12345678-1234-1234-1234-123456789abc",
-                "target_url": "https://api.openai.com/v1/chat/completions",
-                "method": "POST",
-                "headers": {"Content-Type": "application/json"},
-                "body": {
-                    "model": "gpt-3.5-turbo",
-                    "messages": [{"role": "user", "content": "Hello!"}]
-                }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "key_id": "12345678-1234-1234-1234-123456789abc",
+            "target_url": "https://api.openai.com/v1/chat/completions",
+            "method": "POST",
+            "headers": {"Content-Type": "application/json"},
+            "body": {
+                "model": "gpt-3.5-turbo",
+                "messages": [{"role": "user", "content": "Hello!"}]
             }
         }
+    })
 
 
 class ProxyCallResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    
     success: bool
     status_code: Optional[int] = None
     headers: Optional[Dict[str, str]] = None
@@ -120,95 +320,104 @@ class ProxyCallResponse(BaseModel):
 
 class ListLogsRequest(BaseModel):
     key_id: str = Field(..., description="ID of the key to get logs for")
-    filters: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Log filters")
-    
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "key_id": "12345678-1234-1234-1234-123456789abc",
-                "filters": {
-                    "limit": 50,
-                    "start_date": "2024-01-01T00:00:00",
-                    "caller_id": "coral_agent_bob_session_456"
-                }
+    filters: Optional[Dict[str, Any]] = Field(None, description="Log filters")
+    
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "key_id": "12345678-1234-1234-1234-123456789abc",
+            "filters": {
+                "limit": 50,
+                "start_date": "2024-01-01T00:00:00",
+                "caller_id": "coral_agent_bob_session_456"
             }
         }
+    })
 
 
 class ListLogsResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    
     success: bool
     logs: List[Dict[str, Any]]
     count: int
 
 
 class ErrorResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    
     success: bool = False
     error: str
     details: Optional[Dict[str, Any]] = None
 
 
-# Dependency to get Coral session ID from headers
-async def get_coral_session(
-    x_coral_session: Optional[str] = Header(None, alias="X-Coral-Session"),
-    authorization: Optional[str] = Header(None)
-) -> str:
-    """Extract Coral session ID from headers"""
-    
-    # Try X-Coral-Session header first
-    if x_coral_session:
-        return x_coral_session
+def _coral_session(request: Request) -> str:
+    """Return the Coral session ID set by CoralSessionMiddleware"""
+    session = request.state.coral_session
+    if session is None:
+        raise HTTPException(status_code=401, detail=_MISSING_SESSION_DETAIL)
+    return session
+
+
+async def _list_keys_cached(sage: SageMCP, coral_session: str) -> List[Dict[str, Any]]:
+    """Return sage.list_keys(coral_session), memoized per session for a short TTL
     
-    # Try Authorization header (Bearer token format)
-    if authorization and authorization.startswith("Bearer "):
-        return authorization[7:]  # Remove "Bearer " prefix
+    A failed lookup returns an empty list, as sage.list_keys does, but is not
+    memoized.
+    """
+    if not _KEYS_CACHE_TTL:
+        return await sage.list_keys(coral_session)
     
-    # Default for testing/demo
-    if not x_coral_session and not authorization:
-        return "coral_demo_session_default"
+    now = time.monotonic()
+    cached = _KEYS_CACHE.get(coral_session)
+    if cached is not None and cached[0] > now:
+        return cached[1]
     
-    raise HTTPException(
-        status_code=401,
-        detail="Missing Coral session ID. Provide X-Coral-Session header or Authorization Bearer token."
-    )
+    try:
+        keys = await sage.list_keys(coral_session, raise_errors=True)
+    except Exception:
+        return []
+    if len(_KEYS_CACHE) >= _KEYS_CACHE_MAXSIZE:
+        _KEYS_CACHE.clear()
+    _KEYS_CACHE[coral_session] = (now + _KEYS_CACHE_TTL, keys)
+    return keys
 
 
-# Startup and shutdown events
-@app.on_event("startup")
-async def startup_event():
-    """Initialize Sage MCP on startup"""
-    global sage_instance
-    sage_instance = SageMCP()
-    logger.info("Sage MCP API service started successfully")
+def _invalidate_keys_cache(coral_session: str):
+    """Drop the memoized key list; SageMCP calls this after a key is added or revoked"""
+    _KEYS_CACHE.pop(coral_session, None)
 
 
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Cleanup on shutdown"""
-    global sage_instance
-    if sage_instance:
-        await sage_instance.close()
-        logger.info("Sage MCP API service shut down successfully")
+# Dependency to get the SageMCP instance created by the lifespan handler
+async def get_sage(request: Request) -> SageMCP:
+    """Return the application's SageMCP instance"""
+    return request.app.state.sage
+
+
+# Routes are grouped by URL area and mounted on the app once they are all defined
+mcp_router = APIRouter(prefix="/mcp")
+ui_router = APIRouter(prefix="/api/v1", tags=["UI API"])
+core_router = APIRouter()
 
 
 # Health check endpoint
-@app.get("/health", tags=["Health"])
+@core_router.get("/health", tags=["Health"])
 async def health_check():
     """Health check endpoint"""
-    return {"status": "healthy", "timestamp": datetime.utcnow().isoformat()}
+    return Response(content=_health_body, media_type="application/json")
 
 
 # UI Endpoints - Keep minimal for API testing only
-@app.get("/ui", tags=["UI"])
+@core_router.get("/ui", tags=["UI"])
 async def serve_ui():
     """Basic UI endpoint for API testing"""
     return {"message": "Sage API is running", "ui_location": "Serve frontend separately on port 8080"}
 
 # MCP-specific endpoints (no auth required for MCP protocol)
-@app.post("/mcp/add_key", response_model=AddKeyResponse, tags=["MCP"])
-async def mcp_add_key(request: AddKeyRequest):
+@mcp_router.post("/add_key", response_model=AddKeyResponse, tags=["MCP"])
+async def mcp_add_key(request: AddKeyRequest, sage: SageMCP = Depends(get_sage)):
     """MCP: Store a new API key securely"""
     try:
-        key_id = await sage_instance.add_key(
+        key_id = await sage.add_key(
             key_name=request.key_name,
             api_key=request.api_key,
             owner_session="mcp_session"  # Use default session for MCP
@@ -219,13 +428,14 @@ async def mcp_add_key(request: AddKeyRequest):
             message=f"Key '{request.key_name}' stored successfully"
         )
     except Exception as e:
-        logger.error(f"Error adding key via MCP: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+        if _error_sampler.allow("mcp_add_key"):
+            logger.error("Error adding key via MCP: %s", e)
+        raise HTTPException(status_code=500, detail=str(e)) from e
 
-@app.get("/mcp/health", tags=["MCP"])
+@mcp_router.get("/health", tags=["MCP"])
 async def mcp_health_check():
     """MCP: Health check endpoint"""
-    return {"status": "healthy", "service": "sage_mcp", "timestamp": datetime.utcnow().isoformat()}
+    return Response(content=_mcp_health_body, media_type="application/json")
 
 
 # UI-specific models for better frontend integration
@@ -235,6 +445,8 @@ class UIKeyCreate(BaseModel):
     environment: str = Field(..., description="Environment (staging or prod)")
 
 class UIKeyResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    
     key_id: str
     key_name: str
     environment: str
@@ -249,6 +461,8 @@ class UIGrantCreate(BaseModel):
     expiry_date: str = Field(..., description="Grant expiry date (YYYY-MM-DD)")
 
 class UIGrantResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    
     grant_id: str
     key_id: str
     key_name: str
@@ -260,14 +474,14 @@ class UIGrantResponse(BaseModel):
     is_active: bool
 
 # API v1 Endpoints for UI
-@app.post("/api/v1/keys", response_model=UIKeyResponse, tags=["UI API"])
-async def ui_add_key(request: UIKeyCreate):
+@ui_router.post("/keys", response_model=UIKeyResponse)
+async def ui_add_key(request: UIKeyCreate, sage: SageMCP = Depends(get_sage)):
     """UI: Add a new API key"""
     try:
         # Use a default session for UI operations
         coral_session = "coral_ui_session_default"
         
-        key_id = await sage_instance.add_key(
+        key_id = await sage.add_key(
             key_name=request.key_name,
             api_key=request.api_key,
             owner_session=coral_session
@@ -277,22 +491,23 @@ async def ui_add_key(request: UIKeyCreate):
             key_id=key_id,
             key_name=request.key_name,
             environment=request.environment,
-            created_at=datetime.utcnow(),
+            created_at=_NOW.get(),
             is_active=True,
             grant_count=0
         )
         
     except Exception as e:
-        logger.error(f"Error adding key via UI: {e}")
-        raise HTTPException(status_code=422, detail=str(e))
+        if _error_sampler.allow("ui_add_key"):
+            logger.error("Error adding key via UI: %s", e)
+        raise HTTPException(status_code=422, detail=str(e)) from e
 
 
-@app.get("/api/v1/keys", response_model=List[UIKeyResponse], tags=["UI API"])
-async def ui_list_keys():
+@ui_router.get("/keys", response_model=List[UIKeyResponse], response_class=ORJSONResponse)
+async def ui_list_keys(sage: SageMCP = Depends(get_sage)):
     """UI: List all keys"""
     try:
         coral_session = "coral_ui_session_default"
-        keys = await sage_instance.list_keys(coral_session)
+        keys = await _list_keys_cached(sage, coral_session)
         
         # Get grants to calculate grant counts per key
         grants_data = []
@@ -305,16 +520,14 @@ async def ui_list_keys():
         
         # Transform to UI format
         ui_keys = []
+        now = _NOW.get()
         for key in keys:
             # Parse the created_at timestamp
-            created_at_str = key.get("created_at", datetime.utcnow().isoformat())
+            created_at_str = key.get("created_at")
             try:
-                if created_at_str.endswith('Z'):
-                    created_at = datetime.fromisoformat(created_at_str[:-1])
-                else:
-                    created_at = datetime.fromisoformat(created_at_str)
+                created_at = datetime.fromisoformat(created_at_str.rstrip("Z")) if created_at_str else now
             except ValueError:
-                created_at = datetime.utcnow()
+                created_at = now
             
             # Calculate grant count for this key (mock implementation)
             grant_count = 0
@@ -333,31 +546,33 @@ async def ui_list_keys():
         return ui_keys
         
     except Exception as e:
-        logger.error(f"Error listing keys via UI: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
+        if _error_sampler.allow("ui_list_keys"):
+            logger.error("Error listing keys via UI: %s", e)
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
 
-@app.delete("/api/v1/keys/{key_id}", tags=["UI API"])
-async def ui_delete_key(key_id: str):
+@ui_router.delete("/keys/{key_id}")
+async def ui_delete_key(key_id: str, sage: SageMCP = Depends(get_sage)):
     """UI: Delete a key"""
     try:
         coral_session = "coral_ui_session_default"
-        success = await sage_instance.revoke_key(key_id, coral_session)
+        success = await sage.revoke_key(key_id, coral_session)
         
         if success:
             return {"success": True, "message": "Key deleted successfully"}
         else:
-            raise HTTPException(status_code=404, detail="Key not found")
+            raise HTTPException(status_code=404, detail=_UI_KEY_NOT_FOUND_DETAIL)
             
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error deleting key via UI: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
+        if _error_sampler.allow("ui_delete_key"):
+            logger.error("Error deleting key via UI: %s", e)
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
 
-@app.get("/api/v1/grants", response_model=List[UIGrantResponse], tags=["UI API"])
-async def ui_list_grants(key_id: Optional[str] = None):
+@ui_router.get("/grants", response_model=List[UIGrantResponse])
+async def ui_list_grants(key_id: Optional[str] = None, sage: SageMCP = Depends(get_sage)):
     """UI: List all grants, optionally filtered by key_id"""
     try:
         coral_session = "coral_ui_session_default"
@@ -368,7 +583,8 @@ async def ui_list_grants(key_id: Optional[str] = None):
         
         # If we have keys, we can create some mock grants for testing
         try:
-            keys = await sage_instance.list_keys(coral_session)
+            keys = await _list_keys_cached(sage, coral_session)
+            now = _NOW.get()
             for i, key in enumerate(keys[:2]):  # Create mock grants for first 2 keys
                 mock_grants.append(UIGrantResponse(
                     grant_id=f"grant_{i+1}_{key.get('key_id', '')[:8]}",
@@ -377,8 +593,8 @@ async def ui_list_grants(key_id: Optional[str] = None):
                     caller_id=f"test_agent_{i+1}",
                     max_calls_per_day=100 * (i + 1),
                     current_usage=25 * (i + 1),
-                    expires_at=datetime.utcnow().replace(day=datetime.utcnow().day + 7 + i),
-                    created_at=datetime.utcnow().replace(day=datetime.utcnow().day - i),
+                    expires_at=now + timedelta(days=7 + i),
+                    created_at=now - timedelta(days=i),
                     is_active=True
                 ))
         except Exception:
@@ -391,30 +607,33 @@ async def ui_list_grants(key_id: Optional[str] = None):
         return mock_grants
         
     except Exception as e:
-        logger.error(f"Error listing grants via UI: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
+        if _error_sampler.allow("ui_list_grants"):
+            logger.error("Error listing grants via UI: %s", e)
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
 
-@app.post("/api/v1/grants", response_model=UIGrantResponse, tags=["UI API"])
-async def ui_create_grant(request: UIGrantCreate):
+@ui_router.post("/grants", response_model=UIGrantResponse)
+async def ui_create_grant(request: UIGrantCreate, sage: SageMCP = Depends(get_sage)):
     """UI: Create a new access grant"""
     try:
         coral_session = "coral_ui_session_default"
         
         # Parse expiry date
-        from datetime import datetime
         try:
             expiry_date = datetime.fromisoformat(request.expiry_date)
         except ValueError:
-            raise HTTPException(status_code=422, detail="Invalid expiry date format. Use YYYY-MM-DD")
+            expiry_date = None
+        if expiry_date is None:
+            raise HTTPException(status_code=422, detail=_INVALID_EXPIRY_DATE_DETAIL)
         
         # Calculate expiry hours from now
-        expiry_hours = int((expiry_date - datetime.utcnow()).total_seconds() / 3600)
+        now = _NOW.get()
+        expiry_hours = int((expiry_date - now).total_seconds() / 3600)
         if expiry_hours <= 0:
-            raise HTTPException(status_code=422, detail="Expiry date must be in the future")
+            raise HTTPException(status_code=422, detail=_EXPIRY_IN_PAST_DETAIL)
         
         # Create grant using existing grant_access method
-        success = await sage_instance.grant_access(
+        success = await sage.grant_access(
             key_id=request.key_id,
             caller_id=request.caller_agent_id,
             permissions={"max_calls_per_day": request.max_calls_per_day},
@@ -423,21 +642,20 @@ async def ui_create_grant(request: UIGrantCreate):
         )
         
         if not success:
-            raise HTTPException(status_code=400, detail="Failed to create grant")
+            raise HTTPException(status_code=400, detail=_GRANT_FAILED_DETAIL)
         
-        # Get key name for response
-        key_name = "Unknown Key"
-        try:
-            keys = await sage_instance.list_keys(coral_session)
-            for key in keys:
-                if key.get('key_id') == request.key_id:
-                    key_name = key.get('key_name', 'Unknown Key')
-                    break
-        except Exception:
-            pass
+        # Get key name for response, listing keys only on a lookup miss
+        key = sage.get_cached_key(request.key_id, coral_session)
+        if key is None:
+            try:
+                await sage.list_keys(coral_session)
+            except Exception:
+                pass
+            key = sage.get_cached_key(request.key_id, coral_session)
+        key_name = (key or {}).get('key_name', 'Unknown Key')
         
         # Return the created grant
-        grant_id = f"grant_{datetime.utcnow().timestamp()}_{request.key_id[:8]}"
+        grant_id = f"grant_{now.timestamp()}_{request.key_id[:8]}"
         
         return UIGrantResponse(
             grant_id=grant_id,
@@ -447,18 +665,19 @@ async def ui_create_grant(request: UIGrantCreate):
             max_calls_per_day=request.max_calls_per_day,
             current_usage=0,
             expires_at=expiry_date,
-            created_at=datetime.utcnow(),
+            created_at=now,
             is_active=True
         )
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error creating grant via UI: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
+        if _error_sampler.allow("ui_create_grant"):
+            logger.error("Error creating grant via UI: %s", e)
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
 
-@app.delete("/api/v1/grants/{grant_id}", tags=["UI API"])
+@ui_router.delete("/grants/{grant_id}")
 async def ui_revoke_grant(grant_id: str):
     """UI: Revoke an access grant"""
     try:
@@ -466,16 +685,17 @@ async def ui_revoke_grant(grant_id: str):
         
         # For now, just return success since we don't have grant revocation implemented
         # TODO: Implement actual grant revocation in SageMCP
-        logger.info(f"Revoking grant {grant_id} for session {coral_session}")
+        logger.info("Revoking grant %s for session %s", grant_id, coral_session)
         
         return {"success": True, "message": "Grant revoked successfully"}
         
     except Exception as e:
-        logger.error(f"Error revoking grant via UI: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
+        if _error_sampler.allow("ui_revoke_grant"):
+            logger.error("Error revoking grant via UI: %s", e)
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
 
-@app.get("/api/v1/logs", tags=["UI API"])
+@ui_router.get("/logs")
 async def ui_get_logs(key_id: Optional[str] = None, time_filter: str = "24h"):
     """UI: Get usage logs"""
     try:
@@ -486,6 +706,7 @@ async def ui_get_logs(key_id: Optional[str] = None, time_filter: str = "24h"):
         mock_logs = []
         
         # Create some mock log entries
+        now = _NOW.get()
         for i in range(5):
             mock_logs.append({
                 "log_id": f"log_{i+1}",
@@ -495,22 +716,24 @@ async def ui_get_logs(key_id: Optional[str] = None, time_filter: str = "24h"):
                 "target_url": "https://api.openai.com/v1/chat/completions",
                 "status_code": 200,
                 "response_time": 1200 + (i * 100),
-                "timestamp": datetime.utcnow().replace(hour=datetime.utcnow().hour - i),
+                "timestamp": now - timedelta(hours=i),
                 "success": True
             })
         
         return {"success": True, "logs": mock_logs, "count": len(mock_logs)}
         
     except Exception as e:
-        logger.error(f"Error getting logs via UI: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
+        if _error_sampler.allow("ui_get_logs"):
+            logger.error("Error getting logs via UI: %s", e)
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
 
 # Original API Key Management Endpoints (keep for backward compatibility)
-@app.post("/keys", response_model=AddKeyResponse, tags=["Key Management"])
+@core_router.post("/keys", response_model=AddKeyResponse, tags=["Key Management"])
 async def add_key(
     request: AddKeyRequest,
-    coral_session: str = Depends(get_coral_session)
+    http_request: Request,
+    sage: SageMCP = Depends(get_sage)
 ):
     """
     Store a new API key securely
@@ -518,8 +741,10 @@ async def add_key(
     - **key_name**: Human-readable name for the key
     - **api_key**: The actual API key to encrypt and store
     """
+    coral_session = _coral_session(http_request)
+    
     try:
-        key_id = await sage_instance.add_key(
+        key_id = await sage.add_key(
             key_name=request.key_name,
             api_key=request.api_key,
             owner_session=coral_session
@@ -532,48 +757,57 @@ async def add_key(
         )
         
     except Exception as e:
-        logger.error(f"Error adding key: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
+        logger.error("Error adding key: %s", e)
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
 
-@app.get("/keys", tags=["Key Management"])
-async def list_keys(coral_session: str = Depends(get_coral_session)):
+@core_router.get("/keys", tags=["Key Management"])
+async def list_keys(
+    request: Request,
+    sage: SageMCP = Depends(get_sage)
+):
     """List all keys for the authenticated user (metadata only)"""
+    coral_session = _coral_session(request)
+    
     try:
-        keys = await sage_instance.list_keys(coral_session)
+        keys = await _list_keys_cached(sage, coral_session)
         return {"success": True, "keys": keys, "count": len(keys)}
         
     except Exception as e:
-        logger.error(f"Error listing keys: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
+        logger.error("Error listing keys: %s", e)
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
 
-@app.delete("/keys/{key_id}", tags=["Key Management"])
+@core_router.delete("/keys/{key_id}", tags=["Key Management"])
 async def revoke_key(
     key_id: str,
-    coral_session: str = Depends(get_coral_session)
+    request: Request,
+    sage: SageMCP = Depends(get_sage)
 ):
     """Revoke a key and all associated grants"""
+    coral_session = _coral_session(request)
+    
     try:
-        success = await sage_instance.revoke_key(key_id, coral_session)
+        success = await sage.revoke_key(key_id, coral_session)
         
         if success:
             return {"success": True, "message": "Key revoked successfully"}
         else:
-            raise HTTPException(status_code=404, detail="Key not found or access denied")
+            raise HTTPException(status_code=404, detail=_KEY_NOT_FOUND_DETAIL)
             
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error revoking key: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
+        logger.error("Error revoking key: %s", e)
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
 
 # Access Grant Management Endpoints
-@app.post("/grants", response_model=GrantAccessResponse, tags=["Access Management"])
+@core_router.post("/grants", response_model=GrantAccessResponse, tags=["Access Management"])
 async def grant_access(
     request: GrantAccessRequest,
-    coral_session: str = Depends(get_coral_session)
+    http_request: Request,
+    sage: SageMCP = Depends(get_sage)
 ):
     """
     Grant access to an API key for another agent
@@ -583,8 +817,10 @@ async def grant_access(
     - **permissions**: Permission settings (e.g., max_calls_per_day)
     - **expiry_hours**: Grant expiry in hours
     """
+    coral_session = _coral_session(http_request)
+    
     try:
-        success = await sage_instance.grant_access(
+        success = await sage.grant_access(
             key_id=request.key_id,
             caller_id=request.caller_id,
             permissions=request.permissions,
@@ -598,20 +834,21 @@ async def grant_access(
                 message="Access granted successfully"
             )
         else:
-            raise HTTPException(status_code=400, detail="Failed to grant access")
+            raise HTTPException(status_code=400, detail=_GRANT_ACCESS_FAILED_DETAIL)
             
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error granting access: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
+        logger.error("Error granting access: %s", e)
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
 
 # Proxy Call Endpoint
-@app.post("/proxy", response_model=ProxyCallResponse, tags=["Proxy Calls"])
+@core_router.post("/proxy", response_model=ProxyCallResponse, response_model_exclude_unset=True, tags=["Proxy Calls"])
 async def proxy_call(
     request: ProxyCallRequest,
-    coral_session: str = Depends(get_coral_session)
+    http_request: Request,
+    sage: SageMCP = Depends(get_sage)
 ):
     """
     Make a proxied API call using a stored key
@@ -622,14 +859,16 @@ async def proxy_call(
     - **headers**: Request headers
     - **body**: Request body
     """
+    coral_session = _coral_session(http_request)
+    
     try:
-        response = await sage_instance.proxy_call(
+        response = await sage.proxy_call(
             key_id=request.key_id,
             target_url=request.target_url,
             payload={
                 "method": request.method,
-                "headers": request.headers,
-                "body": request.body
+                "headers": request.headers or _EMPTY_MAP,
+                "body": request.body or _EMPTY_MAP
             },
             caller_session=coral_session
         )
@@ -643,7 +882,62 @@ async def proxy_call(
         )
         
     except Exception as e:
-        logger.error(f"Error in proxy call: {e}")
+        if _error_sampler.allow("proxy_call"):
+            logger.error("Error in proxy call: %s", e)
+        return ProxyCallResponse(
+            success=False,
+            error=str(e)
+        )
+
+
+@core_router.post("/proxy/raw", response_model=ProxyCallResponse, response_model_exclude_unset=True, tags=["Proxy Calls"])
+async def proxy_call_raw(
+    request: Request,
+    key_id: str = Query(..., description="ID of the key to use for the API call"),
+    target_url: str = Query(..., description="Target API URL"),
+    method: str = Query("POST", description="HTTP method"),
+    sage: SageMCP = Depends(get_sage)
+):
+    """
+    Make a proxied API call, forwarding the request body untouched
+    
+    The body is never decoded here, which avoids a full JSON parse and
+    re-encode for large payloads such as chat completions.
+    
+    - **key_id**: ID of the key to use for the API call (query)
+    - **target_url**: Target API URL (query)
+    - **method**: HTTP method (query, defaults to POST)
+    """
+    coral_session = _coral_session(request)
+    
+    try:
+        headers = {}
+        content_type = request.headers.get("content-type")
+        if content_type:
+            headers["Content-Type"] = content_type
+        
+        response = await sage.proxy_call(
+            key_id=key_id,
+            target_url=target_url,
+            payload={
+                "method": method,
+                "headers": headers,
+                "body": await request.body()
+            },
+            caller_session=coral_session
+        )
+        
+        return ProxyCallResponse(
+            success=response.get("success", True),
+            status_code=response.get("status_code"),
+            headers=response.get("headers"),
+            data=response.get("data"),
+            response_time_ms=response.get("response_time_ms")
+        )
+        
+    except Exception as e:
+        if _error_sampler.allow("proxy_call_raw"):
+            logger.error("Error in raw proxy call: %s", e)
         return ProxyCallResponse(
             success=False,
             error=str(e)
@@ -651,10 +945,22 @@ async def proxy_call(
 
 
 # Audit and Logging Endpoints
-@app.post("/logs", response_model=ListLogsResponse, tags=["Audit & Logging"])
+async def _stream_logs(logs: List[Dict[str, Any]]):
+    """Yield a ListLogsResponse body as JSON, encoding the rows in chunks"""
+    yield b'{"success":true,"count":%d,"logs":[' % len(logs)
+    for start in range(0, len(logs), _LOG_STREAM_CHUNK):
+        if start:
+            yield b","
+        # Strip the enclosing brackets so chunks join into a single array
+        yield orjson.dumps(logs[start:start + _LOG_STREAM_CHUNK])[1:-1]
+    yield b"]}"
+
+
+@core_router.post("/logs", response_model=ListLogsResponse, tags=["Audit & Logging"])
 async def list_logs(
     request: ListLogsRequest,
-    coral_session: str = Depends(get_coral_session)
+    http_request: Request,
+    sage: SageMCP = Depends(get_sage)
 ):
     """
     Get audit logs for a specific key
@@ -662,33 +968,34 @@ async def list_logs(
     - **key_id**: ID of the key to get logs for
     - **filters**: Optional filters (limit, start_date, end_date, caller_id, action)
     """
+    coral_session = _coral_session(http_request)
+    
     try:
-        logs = await sage_instance.list_logs(
+        logs = await sage.list_logs(
             key_id=request.key_id,
-            filters=request.filters,
+            filters=request.filters or _EMPTY_MAP,
             owner_session=coral_session
         )
         
-        return ListLogsResponse(
-            success=True,
-            logs=logs,
-            count=len(logs)
-        )
+        return StreamingResponse(_stream_logs(logs), media_type="application/json")
         
     except Exception as e:
-        logger.error(f"Error listing logs: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
+        logger.error("Error listing logs: %s", e)
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
 
-@app.get("/stats/{key_id}", tags=["Audit & Logging"])
+@core_router.get("/stats/{key_id}", tags=["Audit & Logging"])
 async def get_usage_stats(
+    request: Request,
     key_id: str,
     days: int = 7,
-    coral_session: str = Depends(get_coral_session)
+    sage: SageMCP = Depends(get_sage)
 ):
     """Get usage statistics for a key"""
+    coral_session = _coral_session(request)
+    
     try:
-        stats = await sage_instance.get_usage_stats(
+        stats = await sage.get_usage_stats(
             key_id=key_id,
             owner_session=coral_session,
             days=days
@@ -697,76 +1004,158 @@ async def get_usage_stats(
         return {"success": True, "stats": stats}
         
     except Exception as e:
-        logger.error(f"Error getting usage stats: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
+        logger.error("Error getting usage stats: %s", e)
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+
+def _parse_mcp_body(body: bytes) -> Dict[str, Any]:
+    """Parse an MCP request body, raising ValueError if it is not a JSON object"""
+    # orjson.JSONDecodeError is a ValueError
+    mcp_request = orjson.loads(body)
+    if not isinstance(mcp_request, dict):
+        raise ValueError("Request must be a JSON object")
+    return mcp_request
+
+
+def _mcp_error(error_code: str, error_message: str, session_id: str = "") -> Dict[str, Any]:
+    """Build an MCP error response body"""
+    return {
+        "success": False,
+        "error": {
+            "error_code": error_code,
+            "error_message": error_message,
+            "coral_session_id": session_id
+        }
+    }
 
 
 # MCP Protocol Endpoint (for direct MCP integration)
-@app.post("/mcp", tags=["MCP Protocol"])
-async def handle_mcp_request(request: Dict[str, Any]):
+@mcp_router.post("", tags=["MCP Protocol"])
+async def handle_mcp_request(request: Request, sage: SageMCP = Depends(get_sage)):
     """
     Handle MCP protocol requests directly
     
     This endpoint accepts MCP-formatted requests and returns MCP-formatted responses.
-    Useful for direct MCP integration or testing.
+    Useful for direct MCP integration or testing. The body is parsed once with
+    orjson and passed straight to SageMCP. High-volume clients should POST the
+    same payload to /mcp/fast, which also skips FastAPI's response handling.
     """
     try:
-        response = await sage_instance.handle_mcp_request(request)
+        mcp_request = _parse_mcp_body(await request.body())
+    except ValueError as e:
+        return ORJSONResponse(_mcp_error("INVALID_REQUEST", str(e)), status_code=400)
+    
+    try:
+        response = await sage.handle_mcp_request(mcp_request)
         return response
         
     except Exception as e:
-        logger.error(f"Error handling MCP request: {e}")
-        return {
-            "success": False,
-            "error": {
-                "error_code": "INTERNAL_ERROR",
-                "error_message": str(e),
-                "coral_session_id": request.get("session_id", "")
-            }
-        }
+        logger.error("Error handling MCP request: %s", e)
+        return _mcp_error("INTERNAL_ERROR", str(e), mcp_request.get("session_id", ""))
+
+
+class FastMCPEndpoint:
+    """
+    Raw ASGI endpoint for high-volume MCP traffic
+    
+    Reads the body, parses it once with orjson and writes the MCP response
+    bytes directly, skipping FastAPI's validation and response-model layers.
+    """
+    
+    async def __call__(self, scope, receive, send):
+        body = b""
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+        
+        try:
+            mcp_request = _parse_mcp_body(body)
+        except ValueError as e:
+            response = _mcp_error("INVALID_REQUEST", str(e))
+            status = 400
+        else:
+            try:
+                response = await scope["app"].state.sage.handle_mcp_request(mcp_request)
+                status = 200
+            except Exception as e:
+                logger.error("Error handling fast MCP request: %s", e)
+                response = _mcp_error("INTERNAL_ERROR", str(e), mcp_request.get("session_id", ""))
+                status = 500
+        
+        content = orjson.dumps(response)
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(content)).encode("latin-1")),
+            ],
+        })
+        await send({"type": "http.response.body", "body": content})
+
+
+app.add_route("/mcp/fast", FastMCPEndpoint(), methods=["POST"], include_in_schema=False)
 
 
 # Admin/Maintenance Endpoints
-@app.post("/admin/cleanup", tags=["Administration"])
-async def cleanup_expired_grants():
+@core_router.post("/admin/cleanup", tags=["Administration"])
+async def cleanup_expired_grants(sage: SageMCP = Depends(get_sage)):
     """Cleanup expired grants (admin operation)"""
     try:
-        count = await sage_instance.cleanup_expired_grants()
+        count = await sage.cleanup_expired_grants()
         return {"success": True, "cleaned_grants": count}
         
     except Exception as e:
-        logger.error(f"Error during cleanup: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        logger.error("Error during cleanup: %s", e)
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+app.include_router(mcp_router)
+app.include_router(ui_router)
+app.include_router(core_router)
 
 
 # Error handlers
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request, exc):
     """Custom HTTP exception handler"""
-    return JSONResponse(
-        status_code=exc.status_code,
-        content={"success": False, "error": exc.detail}
-    )
+    if not isinstance(exc.detail, str):
+        return ORJSONResponse(
+            status_code=exc.status_code,
+            content={"success": False, "error": exc.detail}
+        )
+    body = _ERROR_BODIES.get(exc.detail)
+    if body is None:
+        body = _encode_error(exc.detail)
+    return Response(content=body, status_code=exc.status_code, media_type="application/json")
 
 
 @app.exception_handler(Exception)
 async def general_exception_handler(request, exc):
     """General exception handler"""
-    logger.error(f"Unhandled exception: {exc}")
-    return JSONResponse(
-        status_code=500,
-        content={"success": False, "error": "Internal server error"}
-    )
+    logger.error("Unhandled exception: %s", exc)
+    return Response(content=_500_BYTES, status_code=500, media_type="application/json")
 
 
 if __name__ == "__main__":
     import uvicorn
     
+    # Production: one worker per core on uvloop + httptools, no reload or access log
+    production = os.getenv("ENVIRONMENT") == "production"
+    
     # Run the FastAPI server
     uvicorn.run(
         "sage_api:app",
         host="0.0.0.0",
         port=8001,
-        reload=True,
-        log_level="info"
+        reload=not production,
+        workers=_WORKERS,
+        loop="uvloop" if production else "auto",
+        http="httptools" if production else "auto",
+        access_log=not production,
+        log_level="warning" if production else "info",
+        # Listen on a Unix socket instead of TCP when co-located with the MCP server
+        uds=os.getenv("SAGE_API_SOCKET")
     )
\ No newline at end of file
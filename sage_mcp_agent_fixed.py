@@ -1,60 +1,151 @@
 import os
-import json
+import sys
+import queue
 import asyncio
-import traceback
+import threading
+import logging
+import logging.handlers
+import orjson
 from dotenv import load_dotenv
-from langchain.chat_models import init_chat_model
-from langchain.prompts import ChatPromptTemplate
-from langchain_mcp_adapters.client import MultiServerMCPClient
-from langchain.agents import create_tool_calling_agent, AgentExecutor
 
-load_dotenv()
+# LangChain and the MCP adapters are imported where they are used: they are
+# slow to import and not needed on early exits
+
+logger = logging.getLogger("sage-agent")
+
+def start_logging():
+    # Console writes happen on a listener thread so the event loop never
+    # blocks on stdout
+    log_queue = queue.Queue(-1)
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, console)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    listener.start()
+    return listener
+
+# Escapes braces so tool schemas survive ChatPromptTemplate formatting
+_BRACE_ESCAPE = str.maketrans({"{": "{{", "}": "}}"})
+
+# The MCP tool list is static once loaded, so its description is built once
+# per distinct set of tools
+_tools_description_cache = {}
 
 def get_tools_description(tools):
-    return "\n".join(
-        f"Tool: {tool.name}, Schema: {json.dumps(tool.args).replace('{', '{{').replace('}', '}}')}"
+    # The schema is part of the key: a tool can change its arguments while
+    # keeping its name and description
+    cache_key = tuple(
+        (tool.name, tool.description, orjson.dumps(tool.args))
         for tool in tools
     )
+    description = _tools_description_cache.get(cache_key)
+    if description is None:
+        description = "\n".join(
+            f"Tool: {name}, Schema: {schema.decode().translate(_BRACE_ESCAPE)}"
+            for name, _, schema in cache_key
+        )
+        _tools_description_cache[cache_key] = description
+    return description
+
+# Static parts of the system prompt. Providers cache prompts by their longest
+# common prefix, so the prompt must stay first and identical across runs;
+# anything dynamic (such as the tool descriptions) goes in a later message.
+_AGENT_PROMPT_HEADER = """You are the Sage API Key Management agent. You MUST use the available tools to complete user requests.
+
+When a user asks you to:
+"""
+
+_AGENT_PROMPT_FOOTER = """
+ALWAYS use the appropriate tool for the user's request. Do not just provide generic responses.
+If you need parameters for a tool, ask the user for the required information.
+"""
+
+# Prompt for the tools served by the Sage MCP server over SSE
+AGENT_SYSTEM_PROMPT = _AGENT_PROMPT_HEADER + """- "add api key" or "add key" -> Use the add_key tool
+- "grant access" -> Use the grant_access tool  
+- "proxy call" or "make api call" -> Use the proxy_call tool
+- "check health" or "health check" -> Use the health_check tool
+- "list logs" or "show logs" -> Use the list_logs tool
+- "cleanup" or "clean expired" -> Use the cleanup_expired_grants tool
+""" + _AGENT_PROMPT_FOOTER
+
+# Prompt for the in-process SageMCPServer tools (SAGE_INPROC=1), which have
+# their own names
+AGENT_SYSTEM_PROMPT_INPROC = _AGENT_PROMPT_HEADER + """- "add api key" or "add key" -> Use the store_api_key tool
+- "grant access" -> Use the grant_key_access tool
+- "proxy call" or "make api call" -> Use the proxy_api_call tool
+- "list keys" or "show my keys" -> Use the list_my_keys tool
+- "list logs" or "show logs" -> Use the view_audit_logs tool
+- "usage" or "statistics" -> Use the get_usage_statistics tool
+- "revoke key" or "delete key" -> Use the revoke_api_key tool
+- several independent requests at once -> Use the batch tool
+""" + _AGENT_PROMPT_FOOTER
+
+def get_system_prefix(model_provider, system_prompt=AGENT_SYSTEM_PROMPT):
+    from langchain_core.messages import SystemMessage
+    
+    if model_provider == "anthropic":
+        # Anthropic only caches blocks explicitly marked as a cache breakpoint;
+        # OpenAI caches long shared prefixes automatically
+        return SystemMessage(content=[{
+            "type": "text",
+            "text": system_prompt,
+            "cache_control": {"type": "ephemeral"},
+        }])
+    return SystemMessage(content=system_prompt)
 
-async def create_agent(agent_tools):
+async def create_agent(agent_tools, system_prompt=AGENT_SYSTEM_PROMPT):
+    from langchain.chat_models import init_chat_model
+    from langchain.prompts import ChatPromptTemplate
+    from langchain.agents import create_tool_calling_agent, AgentExecutor
+    
     agent_tools_description = get_tools_description(agent_tools)
+    model_provider = os.getenv("MODEL_PROVIDER", "openai")
     
     prompt = ChatPromptTemplate.from_messages([
-        (
-            "system",
-            f"""You are the Sage API Key Management agent. You MUST use the available tools to complete user requests.
-
-            Available tools: {agent_tools_description}
-            
-            When a user asks you to:
-            - "add api key" or "add key" -> Use the add_key tool
-            - "grant access" -> Use the grant_access tool  
-            - "proxy call" or "make api call" -> Use the proxy_call tool
-            - "check health" or "health check" -> Use the health_check tool
-            - "list logs" or "show logs" -> Use the list_logs tool
-            - "cleanup" or "clean expired" -> Use the cleanup_expired_grants tool
-            
-            ALWAYS use the appropriate tool for the user's request. Do not just provide generic responses.
-            If you need parameters for a tool, ask the user for the required information.
-            """
-        ),
+        get_system_prefix(model_provider, system_prompt),
+        ("system", f"Available tools:\n{agent_tools_description}"),
         ("human", "{input}"),
         ("placeholder", "{agent_scratchpad}")
     ])
 
     model = init_chat_model(
         model=os.getenv("MODEL_NAME", "gpt-4o-mini"),
-        model_provider=os.getenv("MODEL_PROVIDER", "openai"),
+        model_provider=model_provider,
         api_key=os.getenv("OPENAI_API_KEY"),
         temperature=float(os.getenv("MODEL_TEMPERATURE", "0.1")),
         max_tokens=int(os.getenv("MODEL_TOKEN", "8000")),
     )
     
     agent = create_tool_calling_agent(model, agent_tools, prompt)
-    return AgentExecutor(agent=agent, tools=agent_tools, verbose=True)
+    return AgentExecutor(agent=agent, tools=agent_tools, verbose=os.getenv("SAGE_VERBOSE", "0") == "1")
 
-async def main():
-    print("Starting Sage MCP Agent...")
+def get_inproc_tools(sage_server):
+    from langchain_core.tools import StructuredTool
+    
+    def make_tool(tool):
+        async def call_tool(**arguments):
+            result = await sage_server._dispatch(tool.name, arguments)
+            return "\n".join(block.text for block in result.content)
+        
+        return StructuredTool.from_function(
+            coroutine=call_tool,
+            name=tool.name,
+            description=tool.description,
+            args_schema=tool.inputSchema,
+        )
+    
+    return [make_tool(tool) for tool in sage_server._tool_list]
+
+async def create_agent_inproc(sage_server):
+    # Tools call SageMCPServer._dispatch directly: no SSE hop or MCP framing
+    # per tool call when the agent and the server share a process
+    return await create_agent(get_inproc_tools(sage_server), AGENT_SYSTEM_PROMPT_INPROC)
+
+async def load_sse_tools():
+    from langchain_mcp_adapters.client import MultiServerMCPClient
     
     # Connect only to your Sage MCP server
     client = MultiServerMCPClient(
@@ -67,7 +158,7 @@ async def main():
         }
     )
 
-    print("Connected to Sage MCP Server")
+    logger.info("Connected to Sage MCP Server")
     
     # Get tools from your Sage server with proper error handling
     try:
@@ -75,57 +166,122 @@ async def main():
         try:
             agent_tools = await client.get_tools()
         except TypeError as e:
-            print(f"Async call failed, trying sync: {e}")
+            logger.info("Async call failed, trying sync: %s", e)
             # If await fails, try without await (newer MCP client versions)
             agent_tools = client.get_tools()
         
-        print(f"Loaded {len(agent_tools)} tools from Sage MCP server")
+        logger.info("Loaded %d tools from Sage MCP server", len(agent_tools))
         
         # List available tools with more detail
         if agent_tools:
-            print("\nAvailable tools:")
+            logger.info("\nAvailable tools:")
             for tool in agent_tools:
-                print(f"- {tool.name}: {tool.description}")
-                print(f"  Args: {tool.args}")
+                logger.info("- %s: %s", tool.name, tool.description)
+                logger.info("  Args: %s", tool.args)
         else:
-            print("WARNING: No tools loaded!")
-            return
+            logger.warning("WARNING: No tools loaded!")
+            return None
             
-    except Exception as e:
-        print(f"Error loading tools: {e}")
-        print(traceback.format_exc())
-        return
+    except Exception:
+        logger.exception("Error loading tools")
+        return None
     
-    # Create the agent
-    agent_executor = await create_agent(agent_tools)
+    return agent_tools
+
+async def read_input(prompt):
+    # input() runs on a daemon thread rather than the default executor:
+    # asyncio.run waits for executor threads on shutdown, so after Ctrl-C it
+    # would hang until the pending input() returned
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
     
-    print("\nSage Agent is ready! You can now interact with it.")
-    print("Available commands:")
-    print("- Add API key")
-    print("- Grant access")
-    print("- Proxy API calls")
-    print("- Check health")
-    print("- View logs")
-    print("- Cleanup expired grants")
+    def deliver(setter, value):
+        if not future.done():
+            setter(value)
     
-    # Interactive mode
-    while True:
+    def read():
         try:
-            user_input = input("\nWhat would you like me to do? (or 'quit' to exit): ")
-            if user_input.lower() in ['quit', 'exit', 'q']:
-                break
+            line = input(prompt)
+        except BaseException as e:
+            callback = (deliver, future.set_exception, e)
+        else:
+            callback = (deliver, future.set_result, line)
+        try:
+            loop.call_soon_threadsafe(*callback)
+        except RuntimeError:
+            pass  # The loop has already closed
+    
+    threading.Thread(target=read, daemon=True).start()
+    return await future
+
+async def main():
+    logger.info("Starting Sage MCP Agent...")
+    
+    sage_server = None
+    if os.getenv("SAGE_INPROC") == "1":
+        from sage_mcp_server import SageMCPServer
+        
+        sage_server = SageMCPServer()
+        await sage_server.start()
+        logger.info("Using in-process Sage MCP server")
+        agent_executor = await create_agent_inproc(sage_server)
+    else:
+        agent_tools = await load_sse_tools()
+        if not agent_tools:
+            return
+        
+        # Create the agent
+        agent_executor = await create_agent(agent_tools)
+    
+    try:
+        # User-facing output is printed directly; going through the logging
+        # thread could land it after the next input() prompt
+        print("\nSage Agent is ready! You can now interact with it.")
+        print("Available commands:")
+        print("- Add API key")
+        print("- Grant access")
+        print("- Proxy API calls")
+        print("- Check health")
+        print("- View logs")
+        print("- Cleanup expired grants")
+        
+        # Interactive mode
+        while True:
+            try:
+                # Read off the loop so the MCP connection keeps running while waiting
+                user_input = await read_input("\nWhat would you like me to do? (or 'quit' to exit): ")
+                if user_input.lower() in ['quit', 'exit', 'q']:
+                    break
+                    
+                logger.info("Processing: %s", user_input)
+                result = await agent_executor.ainvoke({"input": user_input})
+                print(f"\nResult: {result.get('output', 'No output')}")
                 
-            print(f"\nProcessing: {user_input}")
-            result = await agent_executor.ainvoke({"input": user_input})
-            print(f"\nResult: {result.get('output', 'No output')}")
-            
-        except KeyboardInterrupt:
-            print("\nExiting...")
-            break
-        except Exception as e:
-            print(f"Error: {str(e)}")
-            print(traceback.format_exc())
-            await asyncio.sleep(1)
+            except (KeyboardInterrupt, asyncio.CancelledError):
+                # asyncio.run turns Ctrl-C into a cancellation of this task
+                print("\nExiting...")
+                break
+            except Exception:
+                logger.exception("Error")
+                await asyncio.sleep(1)
+    finally:
+        if sage_server is not None:
+            await sage_server.cleanup()
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # Run on uvloop when it is installed (it is not available on Windows)
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    
+    load_dotenv()
+    listener = start_logging()
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        # Re-raised by asyncio.run after main() handled the cancellation
+        pass
+    finally:
+        listener.stop()
\ No newline at end of file
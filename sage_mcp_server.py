@@ -12,12 +12,19 @@ The server will start and listen for MCP connections from Coral agents.
 """
 
 import asyncio
-import json
+import functools
+import inspect
 import logging
+import os
 import sys
-from typing import Any, Dict, List, Optional, Sequence
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from contextlib import asynccontextmanager
 
+import fastjsonschema
+import orjson
+
 # MCP server imports
 from mcp.server import Server
 from mcp.server.models import InitializationOptions
@@ -26,6 +33,7 @@ from mcp.types import (
     CallToolRequest,
     CallToolResult,
     ListToolsRequest,
+    Resource,
     TextContent,
     Tool,
     INVALID_PARAMS,
@@ -34,6 +42,7 @@ from mcp.types import (
 
 # Sage imports
 from sage.sage_mcp import SageMCP
+from sage.models.privacy_audit_log import PrivacyAuditLog
 
 
 # Configure logging
@@ -43,494 +52,659 @@ logging.basicConfig(
 )
 logger = logging.getLogger("sage-mcp-server")
 
+# Tool results are pretty-printed for agents and humans reading them;
+# SAGE_COMPACT_JSON=1 drops the indentation to save bytes on the wire
+_JSON_OPTIONS = 0 if os.getenv("SAGE_COMPACT_JSON") == "1" else orjson.OPT_INDENT_2
+
+
+def _json(obj: Any) -> str:
+    """Serialize a tool result to JSON text"""
+    return orjson.dumps(obj, option=_JSON_OPTIONS).decode()
+
+
+# Results of read-only tools are reused for SAGE_READ_TTL seconds, until the
+# next write tool call
+_READ_CACHE_TTL = float(os.getenv("SAGE_READ_TTL", "30"))
+_READ_CACHE_MAXSIZE = 4096
+
+# Tools that change keys, grants, usage counters or audit logs
+_WRITE_TOOLS = frozenset({"store_api_key", "grant_key_access", "proxy_api_call", "revoke_api_key"})
+
+
+# Pending audit log writes; proxy_call logs inline when the queue is full
+_AUDIT_QUEUE_MAXSIZE = 10000
+_AUDIT_BATCH_SIZE = 100
+
+# Tool results larger than SAGE_INLINE_MAX_BYTES are returned as a link to an
+# MCP resource plus a short preview (0 disables this). Only the most recent
+# _RESULT_RESOURCES_MAXSIZE results are kept for reading.
+_INLINE_MAX_BYTES = int(os.getenv("SAGE_INLINE_MAX_BYTES", "0"))
+_RESULT_RESOURCES_MAXSIZE = 256
+_RESULT_PREVIEW_BYTES = 512
+
+
+def _tool_handler(fn):
+    """Wrap a tool handler's result dict, or the error it raises, in a CallToolResult"""
+    @functools.wraps(fn)
+    async def wrapper(self, args: Dict[str, Any]) -> CallToolResult:
+        try:
+            result = await fn(self, args)
+        except Exception as e:
+            logger.exception("Error in %s", fn.__name__)
+            return CallToolResult(
+                content=[TextContent(type="text", text=_json({"success": False, "error": str(e)}))],
+                isError=True
+            )
+        body = orjson.dumps(result, option=_JSON_OPTIONS)
+        if _INLINE_MAX_BYTES and len(body) > _INLINE_MAX_BYTES:
+            return self._result_link(body)
+        return CallToolResult(content=[TextContent(type="text", text=body.decode())])
+    return wrapper
+
+
+class _ResultLink(CallToolResult):
+    """A CallToolResult pointing at a stored result resource (see SageMCPServer._result_link)"""
+
+
+def _cached_read(fn):
+    """Serve repeated identical calls of a read-only tool handler from the read cache"""
+    @functools.wraps(fn)
+    async def wrapper(self, args: Dict[str, Any]) -> CallToolResult:
+        try:
+            cache_key = (fn.__name__, self._read_generation, frozenset(args.items()))
+        except TypeError:
+            # Unhashable argument values; skip the cache
+            return await fn(self, args)
+        
+        now = time.monotonic()
+        cached = self._read_cache.get(cache_key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        
+        result = await fn(self, args)
+        # Links are not cached: their resource may be evicted before the entry expires
+        if not result.isError and not isinstance(result, _ResultLink):
+            if len(self._read_cache) >= _READ_CACHE_MAXSIZE:
+                self._read_cache.clear()
+            self._read_cache[cache_key] = (now + _READ_CACHE_TTL, result)
+        return result
+    return wrapper
+
+
+# Tool input schemas, built once at import
+_STORE_API_KEY_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "key_name": {
+            "type": "string",
+            "description": "Human-readable name for the API key"
+        },
+        "api_key": {
+            "type": "string",
+            "description": "The API key to store securely"
+        },
+        "owner_session": {
+            "type": "string",
+            "description": "Coral session ID of the key owner"
+        }
+    },
+    "required": ["key_name", "api_key", "owner_session"]
+}
+
+_GRANT_KEY_ACCESS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "key_id": {
+            "type": "string",
+            "description": "ID of the key to grant access to"
+        },
+        "caller_id": {
+            "type": "string",
+            "description": "Coral session ID of the agent to grant access to"
+        },
+        "max_calls_per_day": {
+            "type": "integer",
+            "description": "Maximum number of API calls per day",
+            "minimum": 1,
+            "maximum": 10000
+        },
+        "expiry_hours": {
+            "type": "integer",
+            "description": "Hours until the grant expires",
+            "minimum": 1,
+            "maximum": 8760
+        },
+        "owner_session": {
+            "type": "string",
+            "description": "Coral session ID of the key owner"
+        }
+    },
+    "required": ["key_id", "caller_id", "max_calls_per_day", "expiry_hours", "owner_session"]
+}
+
+_PROXY_API_CALL_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "key_id": {
+            "type": "string",
+            "description": "ID of the key to use for the API call"
+        },
+        "target_url": {
+            "type": "string",
+            "description": "Target API URL to call"
+        },
+        "method": {
+            "type": "string",
+            "description": "HTTP method (GET, POST, PUT, DELETE, etc.)",
+            "enum": ["GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS"]
+        },
+        "headers": {
+            "type": "object",
+            "description": "HTTP headers to include (API key will be injected automatically)",
+            "additionalProperties": {"type": "string"}
+        },
+        "body": {
+            "type": "object",
+            "description": "Request body for POST/PUT requests"
+        },
+        "caller_session": {
+            "type": "string",
+            "description": "Coral session ID of the calling agent"
+        }
+    },
+    "required": ["key_id", "target_url", "caller_session"]
+}
+
+_LIST_MY_KEYS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "owner_session": {
+            "type": "string",
+            "description": "Coral session ID of the key owner"
+        }
+    },
+    "required": ["owner_session"]
+}
+
+_VIEW_AUDIT_LOGS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "key_id": {
+            "type": "string",
+            "description": "ID of the key to view logs for"
+        },
+        "owner_session": {
+            "type": "string",
+            "description": "Coral session ID of the key owner"
+        },
+        "limit": {
+            "type": "integer",
+            "description": "Maximum number of log entries to return",
+            "minimum": 1,
+            "maximum": 1000,
+            "default": 50
+        },
+        "caller_id": {
+            "type": "string",
+            "description": "Filter logs by specific caller (optional)"
+        },
+        "action": {
+            "type": "string",
+            "description": "Filter logs by action type (optional)",
+            "enum": ["proxy_call", "grant_access", "rate_limit_blocked", "authorization_failed"]
+        }
+    },
+    "required": ["key_id", "owner_session"]
+}
+
+_GET_USAGE_STATISTICS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "key_id": {
+            "type": "string",
+            "description": "ID of the key to get statistics for"
+        },
+        "owner_session": {
+            "type": "string",
+            "description": "Coral session ID of the key owner"
+        },
+        "days": {
+            "type": "integer",
+            "description": "Number of days to include in statistics",
+            "minimum": 1,
+            "maximum": 365,
+            "default": 7
+        }
+    },
+    "required": ["key_id", "owner_session"]
+}
+
+_REVOKE_API_KEY_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "key_id": {
+            "type": "string",
+            "description": "ID of the key to revoke"
+        },
+        "owner_session": {
+            "type": "string",
+            "description": "Coral session ID of the key owner"
+        }
+    },
+    "required": ["key_id", "owner_session"]
+}
+
+_BATCH_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "invocations": {
+            "type": "array",
+            "description": "Tool calls to run; they must not depend on each other's results",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "tool_name": {
+                        "type": "string",
+                        "description": "Name of the tool to call"
+                    },
+                    "arguments": {
+                        "type": "object",
+                        "description": "Arguments for the tool call"
+                    }
+                },
+                "required": ["tool_name", "arguments"]
+            },
+            "minItems": 1
+        }
+    },
+    "required": ["invocations"]
+}
+
 
 class SageMCPServer:
     """MCP Server wrapper for Sage functionality"""
     
     def __init__(self):
         self.sage = SageMCP()
+        self._bind_sage_methods()
         self.server = Server("sage-mcp-server")
+        # Caps how many batched tool calls hit the Sage backend at once
+        self._batch_semaphore = asyncio.Semaphore(int(os.getenv("SAGE_BATCH_CONCURRENCY", "8")))
+        self._tool_list = self._build_tool_list()
+        
+        # Argument validators compiled once from the tool schemas; they also
+        # fill in schema defaults such as limit and days
+        self._validators = {
+            tool.name: fastjsonschema.compile(tool.inputSchema) for tool in self._tool_list
+        }
+        
+        # Read-only tool results, keyed by (handler, write generation, arguments).
+        # Each completed write bumps the generation so older entries are never hit.
+        self._read_cache: Dict[tuple, Tuple[float, CallToolResult]] = {}
+        self._read_generation = 0
+        
+        # Successful proxy_call audit logs, written off the request path by
+        # _audit_worker once start() has run
+        self._audit_queue: asyncio.Queue = asyncio.Queue(maxsize=_AUDIT_QUEUE_MAXSIZE)
+        self._audit_task: Optional[asyncio.Task] = None
+        
+        # Large tool results by resource URI, oldest first
+        self._result_resources: Dict[str, bytes] = {}
+        
+        # Tool name -> handler
+        self._handlers = {
+            "store_api_key": self._handle_store_api_key,
+            "grant_key_access": self._handle_grant_key_access,
+            "proxy_api_call": self._handle_proxy_api_call,
+            "list_my_keys": self._handle_list_my_keys,
+            "view_audit_logs": self._handle_view_audit_logs,
+            "get_usage_statistics": self._handle_get_usage_statistics,
+            "revoke_api_key": self._handle_revoke_api_key,
+            "batch": self._handle_batch,
+        }
         self._setup_tools()
     
+    def _bind_sage_methods(self):
+        """Bind SageMCP methods as awaitables, moving any synchronous ones off the event loop"""
+        for method_name in ("add_key", "grant_access", "proxy_call", "list_keys",
+                            "list_logs", "get_usage_stats", "revoke_key", "close"):
+            fn = getattr(self.sage, method_name)
+            if not inspect.iscoroutinefunction(fn):
+                fn = functools.partial(asyncio.to_thread, fn)
+            setattr(self, "_sage_" + method_name, fn)
+    
+    def _build_tool_list(self) -> List[Tool]:
+        """Build the static list of tools exposed by this server"""
+        return [
+            Tool(
+                name="store_api_key",
+                description="Securely store an API key with encryption",
+                inputSchema=_STORE_API_KEY_SCHEMA
+            ),
+            Tool(
+                name="grant_key_access",
+                description="Grant another agent access to use your API key",
+                inputSchema=_GRANT_KEY_ACCESS_SCHEMA
+            ),
+            Tool(
+                name="proxy_api_call",
+                description="Make an API call using a shared key with rate limiting and audit logging",
+                inputSchema=_PROXY_API_CALL_SCHEMA
+            ),
+            Tool(
+                name="list_my_keys",
+                description="List all API keys you own (metadata only, no actual keys)",
+                inputSchema=_LIST_MY_KEYS_SCHEMA
+            ),
+            Tool(
+                name="view_audit_logs",
+                description="View audit logs for your API keys",
+                inputSchema=_VIEW_AUDIT_LOGS_SCHEMA
+            ),
+            Tool(
+                name="get_usage_statistics",
+                description="Get usage statistics for your API keys",
+                inputSchema=_GET_USAGE_STATISTICS_SCHEMA
+            ),
+            Tool(
+                name="revoke_api_key",
+                description="Revoke an API key and all associated grants",
+                inputSchema=_REVOKE_API_KEY_SCHEMA
+            ),
+            Tool(
+                name="batch",
+                description="Run several independent tool calls concurrently and return all of their results",
+                inputSchema=_BATCH_SCHEMA
+            )
+        ]
+    
     def _setup_tools(self):
         """Register MCP tools with the server"""
         
-        # Tool 1: Store API Key
         @self.server.list_tools()
         async def list_tools() -> List[Tool]:
             """List available tools"""
+            return self._tool_list
+        
+        @self.server.list_resources()
+        async def list_resources() -> List[Resource]:
+            """List stored large tool results"""
             return [
-                Tool(
-                    name="store_api_key",
-                    description="Securely store an API key with encryption",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "key_name": {
-                                "type": "string",
-                                "description": "Human-readable name for the API key"
-                            },
-                            "api_key": {
-                                "type": "string",
-                                "description": "The API key to store securely"
-                            },
-                            "owner_session": {
-                                "type": "string",
-                                "description": "Coral session ID of the key owner"
-                            }
-                        },
-                        "required": ["key_name", "api_key", "owner_session"]
-                    }
-                ),
-                Tool(
-                    name="grant_key_access",
-                    description="Grant another agent access to use your API key",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "key_id": {
-                                "type": "string",
-                                "description": "ID of the key to grant access to"
-                            },
-                            "caller_id": {
-                                "type": "string",
-                                "description": "Coral session ID of the agent to grant access to"
-                            },
-                            "max_calls_per_day": {
-                                "type": "integer",
-                                "description": "Maximum number of API calls per day",
-                                "minimum": 1,
-                                "maximum": 10000
-                            },
-                            "expiry_hours": {
-                                "type": "integer",
-                                "description": "Hours until the grant expires",
-                                "minimum": 1,
-                                "maximum": 8760
-                            },
-                            "owner_session": {
-                                "type": "string",
-                                "description": "Coral session ID of the key owner"
-                            }
-                        },
-                        "required": ["key_id", "caller_id", "max_calls_per_day", "expiry_hours", "owner_session"]
-                    }
-                ),
-                Tool(
-                    name="proxy_api_call",
-                    description="Make an API call using a shared key with rate limiting and audit logging",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "key_id": {
-                                "type": "string",
-                                "description": "ID of the key to use for the API call"
-                            },
-                            "target_url": {
-                                "type": "string",
-                                "description": "Target API URL to call"
-                            },
-                            "method": {
-                                "type": "string",
-                                "description": "HTTP method (GET, POST, PUT, DELETE, etc.)",
-                                "enum": ["GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS"]
-                            },
-                            "headers": {
-                                "type": "object",
-                                "description": "HTTP headers to include (API key will be injected automatically)",
-                                "additionalProperties": {"type": "string"}
-                            },
-                            "body": {
-                                "type": "object",
-                                "description": "Request body for POST/PUT requests"
-                            },
-                            "caller_session": {
-                                "type": "string",
-                                "description": "Coral session ID of the calling agent"
-                            }
-                        },
-                        "required": ["key_id", "target_url", "caller_session"]
-                    }
-                ),
-                Tool(
-                    name="list_my_keys",
-                    description="List all API keys you own (metadata only, no actual keys)",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "owner_session": {
-                                "type": "string",
-                                "description": "Coral session ID of the key owner"
-                            }
-                        },
-                        "required": ["owner_session"]
-                    }
-                ),
-                Tool(
-                    name="view_audit_logs",
-                    description="View audit logs for your API keys",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "key_id": {
-                                "type": "string",
-                                "description": "ID of the key to view logs for"
-                            },
-                            "owner_session": {
-                                "type": "string",
-                                "description": "Coral session ID of the key owner"
-                            },
-                            "limit": {
-                                "type": "integer",
-                                "description": "Maximum number of log entries to return",
-                                "minimum": 1,
-                                "maximum": 1000,
-                                "default": 50
-                            },
-                            "caller_id": {
-                                "type": "string",
-                                "description": "Filter logs by specific caller (optional)"
-                            },
-                            "action": {
-                                "type": "string",
-                                "description": "Filter logs by action type (optional)",
-                                "enum": ["proxy_call", "grant_access", "rate_limit_blocked", "authorization_failed"]
-                            }
-                        },
-                        "required": ["key_id", "owner_session"]
-                    }
-                ),
-                Tool(
-                    name="get_usage_statistics",
-                    description="Get usage statistics for your API keys",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "key_id": {
-                                "type": "string",
-                                "description": "ID of the key to get statistics for"
-                            },
-                            "owner_session": {
-                                "type": "string",
-                                "description": "Coral session ID of the key owner"
-                            },
-                            "days": {
-                                "type": "integer",
-                                "description": "Number of days to include in statistics",
-                                "minimum": 1,
-                                "maximum": 365,
-                                "default": 7
-                            }
-                        },
-                        "required": ["key_id", "owner_session"]
-                    }
-                ),
-                Tool(
-                    name="revoke_api_key",
-                    description="Revoke an API key and all associated grants",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "key_id": {
-                                "type": "string",
-                                "description": "ID of the key to revoke"
-                            },
-                            "owner_session": {
-                                "type": "string",
-                                "description": "Coral session ID of the key owner"
-                            }
-                        },
-                        "required": ["key_id", "owner_session"]
-                    }
-                )
+                Resource(uri=uri, name=uri.rsplit("/", 1)[-1], mimeType="application/json")
+                for uri in self._result_resources
             ]
         
+        @self.server.read_resource()
+        async def read_resource(uri) -> str:
+            """Return the full body of a stored tool result"""
+            body = self._result_resources.get(str(uri))
+            if body is None:
+                raise ValueError(f"Unknown or expired resource: {uri}")
+            return body.decode()
+        
         # Tool implementations
         @self.server.call_tool()
         async def call_tool(name: str, arguments: Dict[str, Any]) -> CallToolResult:
             """Handle tool calls from Coral agents"""
+            return await self._dispatch(name, arguments)
+    
+    async def _dispatch(self, name: str, arguments: Dict[str, Any]) -> CallToolResult:
+        """Route a tool call to its handler"""
+        try:
+            handler = self._handlers.get(name)
+            if handler is None:
+                return CallToolResult(
+                    content=[TextContent(
+                        type="text",
+                        text=f"Unknown tool: {name}"
+                    )],
+                    isError=True
+                )
             
             try:
-                if name == "store_api_key":
-                    return await self._handle_store_api_key(arguments)
-                elif name == "grant_key_access":
-                    return await self._handle_grant_key_access(arguments)
-                elif name == "proxy_api_call":
-                    return await self._handle_proxy_api_call(arguments)
-                elif name == "list_my_keys":
-                    return await self._handle_list_my_keys(arguments)
-                elif name == "view_audit_logs":
-                    return await self._handle_view_audit_logs(arguments)
-                elif name == "get_usage_statistics":
-                    return await self._handle_get_usage_statistics(arguments)
-                elif name == "revoke_api_key":
-                    return await self._handle_revoke_api_key(arguments)
-                else:
-                    return CallToolResult(
-                        content=[TextContent(
-                            type="text",
-                            text=f"Unknown tool: {name}"
-                        )],
-                        isError=True
-                    )
-                    
-            except Exception as e:
-                logger.error(f"Error in tool {name}: {e}")
+                arguments = self._validators[name](arguments)
+            except fastjsonschema.JsonSchemaValueException as e:
                 return CallToolResult(
                     content=[TextContent(
                         type="text",
-                        text=f"Error executing {name}: {str(e)}"
+                        text=_json({
+                            "success": False,
+                            "error": f"Invalid arguments for {name}: {e.message}"
+                        })
                     )],
                     isError=True
                 )
-    
-    async def _handle_store_api_key(self, args: Dict[str, Any]) -> CallToolResult:
-        """Handle store_api_key tool call"""
-        try:
-            key_id = await self.sage.add_key(
-                key_name=args["key_name"],
-                api_key=args["api_key"],
-                owner_session=args["owner_session"]
-            )
-            
-            result = {
-                "success": True,
-                "key_id": key_id,
-                "message": f"API key '{args['key_name']}' stored successfully"
-            }
-            
-            return CallToolResult(
-                content=[TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2)
-                )]
-            )
             
+            if name not in _WRITE_TOOLS:
+                return await handler(arguments)
+            try:
+                return await handler(arguments)
+            finally:
+                self._read_generation += 1
+                
         except Exception as e:
+            logger.error(f"Error in tool {name}: {e}")
             return CallToolResult(
                 content=[TextContent(
                     type="text",
-                    text=json.dumps({
-                        "success": False,
-                        "error": str(e)
-                    }, indent=2)
+                    text=f"Error executing {name}: {str(e)}"
                 )],
                 isError=True
             )
     
-    async def _handle_grant_key_access(self, args: Dict[str, Any]) -> CallToolResult:
-        """Handle grant_key_access tool call"""
-        try:
-            permissions = {"max_calls_per_day": args["max_calls_per_day"]}
-            
-            success = await self.sage.grant_access(
-                key_id=args["key_id"],
-                caller_id=args["caller_id"],
-                permissions=permissions,
-                expiry=args["expiry_hours"],
-                owner_session=args["owner_session"]
-            )
-            
-            result = {
-                "success": success,
-                "message": f"Access granted to {args['caller_id']}" if success else "Failed to grant access"
-            }
-            
-            return CallToolResult(
-                content=[TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2)
-                )]
-            )
-            
-        except Exception as e:
-            return CallToolResult(
-                content=[TextContent(
+    def _result_link(self, body: bytes) -> _ResultLink:
+        """Store a large tool result as a resource and return a link to it with a preview"""
+        uri = f"sage://results/{uuid.uuid4().hex}"
+        if len(self._result_resources) >= _RESULT_RESOURCES_MAXSIZE:
+            self._result_resources.pop(next(iter(self._result_resources)))
+        self._result_resources[uri] = body
+        
+        return _ResultLink(
+            content=[TextContent(
+                type="text",
+                text=_json({
+                    "resource": uri,
+                    "bytes": len(body),
+                    "preview": body[:_RESULT_PREVIEW_BYTES].decode(errors="ignore")
+                })
+            )]
+        )
+    
+    async def _handle_batch(self, args: Dict[str, Any]) -> CallToolResult:
+        """Handle batch tool call by running the invocations concurrently"""
+        invocations = args["invocations"]
+        
+        async def run(invocation: Dict[str, Any]) -> CallToolResult:
+            tool_name = invocation["tool_name"]
+            if tool_name == "batch":
+                raise ValueError("batch calls cannot be nested")
+            async with self._batch_semaphore:
+                return await self._dispatch(tool_name, invocation.get("arguments", {}))
+        
+        results = await asyncio.gather(*(run(invocation) for invocation in invocations),
+                                       return_exceptions=True)
+        
+        content = []
+        failed = 0
+        for invocation, result in zip(invocations, results):
+            if isinstance(result, BaseException):
+                failed += 1
+                content.append(TextContent(
                     type="text",
-                    text=json.dumps({
+                    text=_json({
                         "success": False,
-                        "error": str(e)
-                    }, indent=2)
-                )],
-                isError=True
-            )
+                        "tool_name": invocation.get("tool_name"),
+                        "error": str(result)
+                    })
+                ))
+            else:
+                failed += bool(result.isError)
+                content.extend(result.content)
+        
+        return CallToolResult(content=content, isError=failed == len(invocations))
+    
+    @_tool_handler
+    async def _handle_store_api_key(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle store_api_key tool call"""
+        key_id = await self._sage_add_key(
+            key_name=args["key_name"],
+            api_key=args["api_key"],
+            owner_session=args["owner_session"]
+        )
+        
+        return {
+            "success": True,
+            "key_id": key_id,
+            "message": f"API key '{args['key_name']}' stored successfully"
+        }
     
-    async def _handle_proxy_api_call(self, args: Dict[str, Any]) -> CallToolResult:
+    @_tool_handler
+    async def _handle_grant_key_access(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle grant_key_access tool call"""
+        permissions = {"max_calls_per_day": args["max_calls_per_day"]}
+        
+        success = await self._sage_grant_access(
+            key_id=args["key_id"],
+            caller_id=args["caller_id"],
+            permissions=permissions,
+            expiry=args["expiry_hours"],
+            owner_session=args["owner_session"]
+        )
+        
+        return {
+            "success": success,
+            "message": f"Access granted to {args['caller_id']}" if success else "Failed to grant access"
+        }
+    
+    @_tool_handler
+    async def _handle_proxy_api_call(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Handle proxy_api_call tool call"""
-        try:
-            payload = {
-                "method": args.get("method", "GET"),
-                "headers": args.get("headers", {}),
-                "body": args.get("body", {})
-            }
-            
-            response = await self.sage.proxy_call(
-                key_id=args["key_id"],
-                target_url=args["target_url"],
-                payload=payload,
-                caller_session=args["caller_session"]
-            )
-            
-            return CallToolResult(
-                content=[TextContent(
-                    type="text",
-                    text=json.dumps(response, indent=2)
-                )]
-            )
-            
-        except Exception as e:
-            return CallToolResult(
-                content=[TextContent(
-                    type="text",
-                    text=json.dumps({
-                        "success": False,
-                        "error": str(e)
-                    }, indent=2)
-                )],
-                isError=True
-            )
+        payload = {
+            "method": args.get("method", "GET"),
+            "headers": args.get("headers", {}),
+            "body": args.get("body", {})
+        }
+        
+        return await self._sage_proxy_call(
+            key_id=args["key_id"],
+            target_url=args["target_url"],
+            payload=payload,
+            caller_session=args["caller_session"]
+        )
     
-    async def _handle_list_my_keys(self, args: Dict[str, Any]) -> CallToolResult:
+    @_cached_read
+    @_tool_handler
+    async def _handle_list_my_keys(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Handle list_my_keys tool call"""
-        try:
-            keys = await self.sage.list_keys(args["owner_session"])
-            
-            result = {
-                "success": True,
-                "keys": keys,
-                "count": len(keys)
-            }
-            
-            return CallToolResult(
-                content=[TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2)
-                )]
-            )
-            
-        except Exception as e:
-            return CallToolResult(
-                content=[TextContent(
-                    type="text",
-                    text=json.dumps({
-                        "success": False,
-                        "error": str(e)
-                    }, indent=2)
-                )],
-                isError=True
-            )
+        keys = await self._sage_list_keys(args["owner_session"])
+        
+        return {
+            "success": True,
+            "keys": keys,
+            "count": len(keys)
+        }
     
-    async def _handle_view_audit_logs(self, args: Dict[str, Any]) -> CallToolResult:
+    @_cached_read
+    @_tool_handler
+    async def _handle_view_audit_logs(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Handle view_audit_logs tool call"""
-        try:
-            filters = {
-                "limit": args.get("limit", 50)
-            }
-            
-            if "caller_id" in args:
-                filters["caller_id"] = args["caller_id"]
-            if "action" in args:
-                filters["action"] = args["action"]
-            
-            logs = await self.sage.list_logs(
-                key_id=args["key_id"],
-                filters=filters,
-                owner_session=args["owner_session"]
-            )
-            
-            result = {
-                "success": True,
-                "logs": logs,
-                "count": len(logs)
-            }
-            
-            return CallToolResult(
-                content=[TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2)
-                )]
-            )
-            
-        except Exception as e:
-            return CallToolResult(
-                content=[TextContent(
-                    type="text",
-                    text=json.dumps({
-                        "success": False,
-                        "error": str(e)
-                    }, indent=2)
-                )],
-                isError=True
-            )
+        filters = {
+            "limit": args["limit"]
+        }
+        
+        if "caller_id" in args:
+            filters["caller_id"] = args["caller_id"]
+        if "action" in args:
+            filters["action"] = args["action"]
+        
+        logs = await self._sage_list_logs(
+            key_id=args["key_id"],
+            filters=filters,
+            owner_session=args["owner_session"]
+        )
+        
+        return {
+            "success": True,
+            "logs": logs,
+            "count": len(logs)
+        }
     
-    async def _handle_get_usage_statistics(self, args: Dict[str, Any]) -> CallToolResult:
+    @_cached_read
+    @_tool_handler
+    async def _handle_get_usage_statistics(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Handle get_usage_statistics tool call"""
-        try:
-            stats = await self.sage.get_usage_stats(
-                key_id=args["key_id"],
-                owner_session=args["owner_session"],
-                days=args.get("days", 7)
-            )
-            
-            result = {
-                "success": True,
-                "statistics": stats
-            }
-            
-            return CallToolResult(
-                content=[TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2)
-                )]
-            )
-            
-        except Exception as e:
-            return CallToolResult(
-                content=[TextContent(
-                    type="text",
-                    text=json.dumps({
-                        "success": False,
-                        "error": str(e)
-                    }, indent=2)
-                )],
-                isError=True
-            )
+        stats = await self._sage_get_usage_stats(
+            key_id=args["key_id"],
+            owner_session=args["owner_session"],
+            days=args["days"]
+        )
+        
+        return {
+            "success": True,
+            "statistics": stats
+        }
     
-    async def _handle_revoke_api_key(self, args: Dict[str, Any]) -> CallToolResult:
+    @_tool_handler
+    async def _handle_revoke_api_key(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Handle revoke_api_key tool call"""
+        success = await self._sage_revoke_key(
+            key_id=args["key_id"],
+            owner_session=args["owner_session"]
+        )
+        
+        return {
+            "success": success,
+            "message": "API key revoked successfully" if success else "Failed to revoke key"
+        }
+    
+    async def _audit_worker(self):
+        """Write queued proxy_call audit logs in batches"""
+        while True:
+            batch = [await self._audit_queue.get()]
+            while len(batch) < _AUDIT_BATCH_SIZE and not self._audit_queue.empty():
+                batch.append(self._audit_queue.get_nowait())
+            try:
+                await self._write_audit_batch(batch)
+            finally:
+                # Cached audit log and usage reads may predate these rows
+                self._read_generation += 1
+                for _ in batch:
+                    self._audit_queue.task_done()
+    
+    async def _write_audit_batch(self, batch: List[PrivacyAuditLog]):
+        """Write a batch of audit log entries, one at a time if the batch write fails"""
+        write_log_entries = self.sage.logging_service.write_log_entries
         try:
-            success = await self.sage.revoke_key(
-                key_id=args["key_id"],
-                owner_session=args["owner_session"]
-            )
-            
-            result = {
-                "success": success,
-                "message": "API key revoked successfully" if success else "Failed to revoke key"
-            }
-            
-            return CallToolResult(
-                content=[TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2)
-                )]
-            )
-            
-        except Exception as e:
-            return CallToolResult(
-                content=[TextContent(
-                    type="text",
-                    text=json.dumps({
-                        "success": False,
-                        "error": str(e)
-                    }, indent=2)
-                )],
-                isError=True
-            )
+            await write_log_entries(batch)
+            return
+        except Exception:
+            logger.exception("Failed to write %d audit logs as a batch; retrying one at a time", len(batch))
+        
+        for entry in batch:
+            try:
+                await write_log_entries([entry])
+            except Exception:
+                logger.exception("Dropping audit log %s", entry.log_id)
+    
+    async def start(self):
+        """Open the pooled upstream HTTP session and start the audit log writer"""
+        await self.sage.proxy_service.open()
+        self._audit_task = asyncio.create_task(self._audit_worker())
+        self.sage.enqueue_log = self._audit_queue.put_nowait
     
     async def cleanup(self):
         """Cleanup resources"""
-        await self.sage.close()
+        self.sage.enqueue_log = None
+        if self._audit_task is not None:
+            # Flush queued audit logs before shutting down
+            await self._audit_queue.join()
+            self._audit_task.cancel()
+            try:
+                await self._audit_task
+            except asyncio.CancelledError:
+                pass
+            self._audit_task = None
+        await self._sage_close()
 
 
 async def main():
@@ -540,6 +714,8 @@ async def main():
     sage_server = SageMCPServer()
     
     try:
+        await sage_server.start()
+        
         # Run the MCP server using stdio transport
         async with stdio_server() as (read_stream, write_stream):
             logger.info("Sage MCP Server is running and ready for connections")
@@ -565,4 +741,11 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Run on uvloop when it is installed (it is not available on Windows)
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    
     asyncio.run(main())
\ No newline at end of file
@@ -6,21 +6,49 @@ This creates a proper MCP server that exposes tools and calls your existing
 FastAPI endpoints. This bypasses the fastapi-mcp issues.
 """
 
+import os
 import asyncio
-import json
-import aiohttp
-from typing import Dict, Any, List
+import orjson
+from typing import TYPE_CHECKING, AsyncIterator, Dict, Any, List, Optional, Union
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from fastapi.responses import StreamingResponse
-import uvicorn
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, Field
 
-app = FastAPI(title="Sage MCP Server", version="1.0.0")
+if TYPE_CHECKING:
+    import aiohttp
+
+# Optional Unix domain socket the Sage API listens on (see SAGE_API_SOCKET in sage_api.py)
+SAGE_API_SOCKET = os.getenv("SAGE_API_SOCKET")
+
+# Base URL for your Sage API (the host is ignored when talking over the Unix socket)
+SAGE_API_BASE = os.getenv("SAGE_API_BASE", "http://localhost" if SAGE_API_SOCKET else "http://localhost:8001")
+
+# Request headers are shared across calls; aiohttp copies them rather than mutating them
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_CORAL_HEADERS = {"X-Coral-Session": "mcp_session", "Content-Type": "application/json"}
+
+class MCPRequest(BaseModel):
+    """JSON-RPC request body accepted by the /mcp endpoint"""
+    jsonrpc: str = "2.0"
+    method: str
+    params: Dict[str, Any] = Field(default_factory=dict)
+    id: Optional[Union[int, str]] = None
 
-# Base URL for your Sage API
-SAGE_API_BASE = "http://localhost:8001"
 
 class MCPServer:
+    # Tool name -> (HTTP method, Sage API path, request headers)
+    _DISPATCH = {
+        "add_key": ("POST", "/mcp/add_key", _JSON_HEADERS),
+        "health_check": ("GET", "/mcp/health", None),
+        "grant_access": ("POST", "/grants", _CORAL_HEADERS),
+        "proxy_call": ("POST", "/proxy", _CORAL_HEADERS),
+        "list_logs": ("POST", "/logs", _CORAL_HEADERS),
+        "cleanup_expired_grants": ("POST", "/admin/cleanup", _JSON_HEADERS),
+    }
+    
     def __init__(self):
+        self._session = None
         self.tools = [
             {
                 "name": "add_key",
@@ -93,135 +121,162 @@ class MCPServer:
             }
         ]
     
-    async def call_tool(self, name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
-        """Call a tool by making HTTP requests to your Sage API"""
+    async def _get_session(self) -> "aiohttp.ClientSession":
+        """Get or create the pooled HTTP session for Sage API calls"""
+        if self._session is None or self._session.closed:
+            # Imported here so loading the module (and /health-only use) skips aiohttp
+            import aiohttp
+            
+            if SAGE_API_SOCKET:
+                # Same-host deployments skip the TCP loopback stack entirely
+                connector = aiohttp.UnixConnector(path=SAGE_API_SOCKET, limit=100, keepalive_timeout=30)
+            else:
+                connector = aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=20,
+                    keepalive_timeout=30,
+                    ttl_dns_cache=300
+                )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+    
+    async def open(self):
+        """Create the pooled HTTP session up front instead of on the first call"""
+        await self._get_session()
+    
+    async def close(self):
+        """Close the pooled HTTP session"""
+        if self._session and not self._session.closed:
+            await self._session.close()
+    
+    async def call_tool(self, name: str, arguments: Dict[str, Any]) -> bytes:
+        """Call a tool by making HTTP requests to your Sage API
         
-        async with aiohttp.ClientSession() as session:
-            try:
-                if name == "add_key":
-                    async with session.post(f"{SAGE_API_BASE}/mcp/add_key", json=arguments) as response:
-                        return await response.json()
-                
-                elif name == "health_check":
-                    async with session.get(f"{SAGE_API_BASE}/mcp/health") as response:
-                        return await response.json()
-                
-                elif name == "grant_access":
-                    headers = {"X-Coral-Session": "mcp_session"}
-                    async with session.post(f"{SAGE_API_BASE}/grants", json=arguments, headers=headers) as response:
-                        return await response.json()
-                
-                elif name == "proxy_call":
-                    headers = {"X-Coral-Session": "mcp_session"}
-                    async with session.post(f"{SAGE_API_BASE}/proxy", json=arguments, headers=headers) as response:
-                        return await response.json()
-                
-                elif name == "list_logs":
-                    headers = {"X-Coral-Session": "mcp_session"}
-                    async with session.post(f"{SAGE_API_BASE}/logs", json=arguments, headers=headers) as response:
-                        return await response.json()
-                
-                elif name == "cleanup_expired_grants":
-                    async with session.post(f"{SAGE_API_BASE}/admin/cleanup") as response:
-                        return await response.json()
+        Returns the raw JSON response body so it can be passed on without re-parsing.
+        """
+        
+        spec = self._DISPATCH.get(name)
+        if spec is None:
+            return orjson.dumps({"error": f"Unknown tool: {name}"})
+        method, path, headers = spec
+        
+        # Encode with orjson here so aiohttp does not re-encode with stdlib json
+        body = orjson.dumps(arguments) if method != "GET" else None
+        
+        session = await self._get_session()
+        try:
+            async with session.request(method, SAGE_API_BASE + path, data=body, headers=headers) as response:
+                return await response.read()
                 
-                else:
-                    return {"error": f"Unknown tool: {name}"}
-                    
-            except Exception as e:
-                return {"error": str(e)}
+        except Exception as e:
+            return orjson.dumps({"error": str(e)})
 
 mcp_server = MCPServer()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the shared Sage API session on startup and close it on shutdown"""
+    await mcp_server.open()
+    yield
+    await mcp_server.close()
+
+
+app = FastAPI(title="Sage MCP Server", version="1.0.0", default_response_class=ORJSONResponse,
+              lifespan=lifespan)
+
+# The SSE handshake frames never change, so they are encoded once at import
+_INIT_FRAME = b"data: " + orjson.dumps({
+    "jsonrpc": "2.0",
+    "method": "notifications/initialized",
+    "params": {
+        "protocolVersion": "2024-11-05",
+        "capabilities": {
+            "tools": {}
+        },
+        "serverInfo": {
+            "name": "sage-mcp-server",
+            "version": "1.0.0"
+        }
+    }
+}) + b"\n\n"
+
+_TOOLS_FRAME = b"data: " + orjson.dumps({
+    "jsonrpc": "2.0",
+    "method": "notifications/tools/list_changed",
+    "params": {
+        "tools": mcp_server.tools
+    }
+}) + b"\n\n"
+
+# mcp_server.tools is fixed for the process lifetime, so the discovery payload is encoded once too
+_TOOLS_LIST_BYTES = orjson.dumps({"tools": mcp_server.tools})
+
+_HEARTBEAT_FRAME = b'data: {"type":"heartbeat","timestamp":%f}\n\n'
+
 @app.get("/sse")
 async def sse_endpoint():
     """SSE endpoint for MCP protocol"""
     
-    async def event_stream():
-        # Send MCP initialization
-        init_msg = {
-            "jsonrpc": "2.0",
-            "method": "notifications/initialized",
-            "params": {
-                "protocolVersion": "2024-11-05",
-                "capabilities": {
-                    "tools": {}
-                },
-                "serverInfo": {
-                    "name": "sage-mcp-server",
-                    "version": "1.0.0"
-                }
-            }
-        }
-        yield f"data: {json.dumps(init_msg)}\n\n"
-        
-        # Send tools list immediately
-        tools_msg = {
-            "jsonrpc": "2.0",
-            "method": "notifications/tools/list_changed",
-            "params": {
-                "tools": mcp_server.tools
-            }
-        }
-        yield f"data: {json.dumps(tools_msg)}\n\n"
+    async def event_stream() -> AsyncIterator[bytes]:
+        # Send MCP initialization and the tools list immediately
+        yield _INIT_FRAME
+        yield _TOOLS_FRAME
         
         # Keep connection alive
+        loop = asyncio.get_running_loop()
         while True:
-            yield f"data: {json.dumps({'type': 'heartbeat', 'timestamp': asyncio.get_event_loop().time()})}\n\n"
+            yield _HEARTBEAT_FRAME % loop.time()
             await asyncio.sleep(30)
     
     return StreamingResponse(event_stream(), media_type="text/event-stream")
 
+def _json_response(payload: Dict[str, Any]) -> Response:
+    """Encode a JSON-RPC reply once with orjson and return it as-is"""
+    return Response(content=orjson.dumps(payload), media_type="application/json")
+
 @app.post("/mcp")
-async def handle_mcp_request(request: Dict[str, Any]):
+async def handle_mcp_request(request: MCPRequest):
     """Handle MCP protocol requests"""
     
-    method = request.get("method")
-    params = request.get("params", {})
-    request_id = request.get("id")
+    method = request.method
+    params = request.params
+    request_id = request.id
     
+    # Responses are encoded here so FastAPI skips jsonable_encoder on the nested payloads
     if method == "tools/list":
-        return {
-            "jsonrpc": "2.0",
-            "id": request_id,
-            "result": {
-                "tools": mcp_server.tools
-            }
-        }
+        return Response(
+            content=b'{"jsonrpc":"2.0","id":%s,"result":%s}' % (orjson.dumps(request_id), _TOOLS_LIST_BYTES),
+            media_type="application/json"
+        )
     
     elif method == "tools/call":
         tool_name = params.get("name")
         arguments = params.get("arguments", {})
         
-        result = await mcp_server.call_tool(tool_name, arguments)
+        raw = await mcp_server.call_tool(tool_name, arguments)
         
-        return {
-            "jsonrpc": "2.0",
-            "id": request_id,
-            "result": {
-                "content": [
-                    {
-                        "type": "text",
-                        "text": json.dumps(result, indent=2)
-                    }
-                ]
-            }
-        }
+        # The upstream body is already JSON text; it only needs escaping once as a string
+        return Response(
+            content=b'{"jsonrpc":"2.0","id":%s,"result":{"content":[{"type":"text","text":%s}]}}'
+                    % (orjson.dumps(request_id), orjson.dumps(raw.decode())),
+            media_type="application/json"
+        )
     
     else:
-        return {
+        return _json_response({
             "jsonrpc": "2.0",
             "id": request_id,
             "error": {
                 "code": -32601,
                 "message": f"Method not found: {method}"
             }
-        }
+        })
 
 @app.get("/mcp/tools")
 async def list_tools():
     """List available MCP tools"""
-    return {"tools": mcp_server.tools}
+    return Response(content=_TOOLS_LIST_BYTES, media_type="application/json")
 
 @app.get("/health")
 async def health():
@@ -229,14 +284,22 @@ async def health():
     return {"status": "healthy", "service": "sage_mcp_server"}
 
 if __name__ == "__main__":
+    import uvicorn
+    
     print("🚀 Starting Working Sage MCP Server...")
     print("📡 MCP Server available at: http://localhost:8002")
     print("🔌 SSE endpoint: http://localhost:8002/sse")
     print("🛠️ Tools endpoint: http://localhost:8002/mcp/tools")
     
+    production = os.getenv("ENVIRONMENT") == "production"
+    
+    # Workers need the import string rather than the app object
     uvicorn.run(
-        app,
+        "sage_mcp_server_working:app",
         host="0.0.0.0",
         port=8002,  # Different port to avoid conflicts
+        workers=(os.cpu_count() or 1) if production else 1,
+        loop="uvloop" if production else "auto",
+        http="httptools" if production else "auto",
         log_level="info"
     )
\ No newline at end of file
@@ -37,11 +37,16 @@ if __name__ == "__main__":
     print("🔍 MCP Tools: http://localhost:8000/mcp/tools")
     print("\n✨ Server starting...")
     
+    production = os.getenv("ENVIRONMENT") == "production"
+    
     # Run with uvicorn
     uvicorn.run(
         "sage_mcp_simple:app",
         host="0.0.0.0",
         port=8000,
         reload=False,
+        workers=(os.cpu_count() or 1) if production else 1,
+        loop="uvloop" if production else "auto",
+        http="httptools" if production else "auto",
         log_level="info"
     )
\ No newline at end of file
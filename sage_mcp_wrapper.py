@@ -9,6 +9,7 @@ compatible with the MCP protocol and Coral agents.
 from fastapi import FastAPI
 from fastapi_mcp import FastApiMCP
 import uvicorn
+import os
 
 # Import your existing FastAPI app
 from sage_api import app as sage_app
@@ -37,13 +38,19 @@ def main():
     print("📖 API documentation at: http://localhost:8001/docs")
     print("🔍 MCP tools documentation at: http://localhost:8001/mcp/tools")
     
+    production = os.getenv("ENVIRONMENT") == "production"
+    
     # Run the server without reload to avoid the warning
     # Use the module string format for reload compatibility
+    # (workers > 1 also needs the import string, and is only allowed with reload off)
     uvicorn.run(
         "sage_mcp_wrapper:create_mcp_server",
         host="0.0.0.0",
         port=8001,  # Changed to 8001 to avoid conflicts
         reload=False,  # Disable reload to avoid import string warning
+        workers=(os.cpu_count() or 1) if production else 1,
+        loop="uvloop" if production else "auto",
+        http="httptools" if production else "auto",
         log_level="info",
         factory=True  # Tell uvicorn this is a factory function
     )
@@ -5,13 +5,22 @@ Setup script for Sage MCP Server
 This script helps you set up and test the Sage MCP server for use with Coral agents.
 """
 
-import asyncio
-import json
+import importlib.util
 import os
+import shutil
 import subprocess
 import sys
+import tempfile
 from pathlib import Path
 
+# Importable module name -> pip requirement for the MCP server dependencies
+MCP_REQUIREMENTS = {
+    "mcp": "mcp",
+    "pydantic": "pydantic>=2.0.0",
+    "anyio": "anyio>=4.0.0",
+    "orjson": "orjson>=3.9.0",
+}
+
 
 def print_header(title: str):
     """Print a formatted header"""
@@ -54,12 +63,26 @@ def install_dependencies():
     """Install required dependencies"""
     print_step("1", "Installing MCP dependencies")
     
+    # Only spawn pip for packages that are not importable yet
+    missing = [req for module, req in MCP_REQUIREMENTS.items() if importlib.util.find_spec(module) is None]
+    if not missing:
+        print_success("MCP dependencies already installed")
+        return True
+    
+    # Prefer uv's resolver when it is on PATH, targeting this interpreter; otherwise use pip
+    uv_path = shutil.which("uv")
+    if uv_path:
+        cmd = [uv_path, "pip", "install", "--python", sys.executable, "-q", *missing]
+    else:
+        cmd = [
+            sys.executable, "-m", "pip", "install",
+            "--no-input", "--disable-pip-version-check", "-q",
+            *missing
+        ]
+    
     try:
         # Install MCP package
-        subprocess.run([
-            sys.executable, "-m", "pip", "install", 
-            "mcp", "pydantic>=2.0.0", "anyio>=4.0.0"
-        ], check=True, capture_output=True)
+        subprocess.run(cmd, check=True, capture_output=True)
         
         print_success("MCP dependencies installed successfully")
         return True
@@ -67,7 +90,7 @@ def install_dependencies():
     except subprocess.CalledProcessError as e:
         print_error(f"Failed to install dependencies: {e}")
         print("You may need to install manually:")
-        print("  pip install mcp pydantic anyio")
+        print("  pip install mcp pydantic anyio orjson")
         return False
 
 
@@ -109,9 +132,19 @@ def create_mcp_config():
         }
     }
     
+    tmp_path = None
     try:
-        with open(config_path, 'w') as f:
-            json.dump(config, f, indent=2)
+        import orjson
+        
+        # Write to a temp file in the same directory and rename it into place,
+        # so an interrupted run never leaves a half-written config behind
+        fd, tmp_path = tempfile.mkstemp(dir=config_path.absolute().parent, suffix=".tmp")
+        with os.fdopen(fd, 'wb') as f:
+            f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+        # mkstemp creates the file owner-only; keep the usual permissions of a plain open()
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, config_path)
+        tmp_path = None
         
         print_success(f"MCP configuration created: {config_path}")
         return True
@@ -119,6 +152,10 @@ def create_mcp_config():
     except Exception as e:
         print_error(f"Failed to create MCP configuration: {e}")
         return False
+    
+    finally:
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
 
 
 def test_mcp_server():
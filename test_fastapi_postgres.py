@@ -5,8 +5,7 @@ Test FastAPI app with PostgreSQL - Start server and test endpoints
 
 import os
 import sys
-import time
-import requests
+import asyncio
 import subprocess
 import signal
 from dotenv import load_dotenv
@@ -14,8 +13,10 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
-def test_fastapi_with_postgres():
+async def test_fastapi_with_postgres():
     """Test FastAPI app with PostgreSQL connection"""
+    import httpx
+    
     print("🚀 Testing FastAPI with PostgreSQL")
     print("=" * 50)
     
@@ -34,44 +35,65 @@ def test_fastapi_with_postgres():
         "--host", "0.0.0.0", "--port", "8001", "--reload"
     ], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
     
-    # Wait for server to start
-    print("⏳ Waiting for server to start...")
-    time.sleep(5)
+    # One client for the readiness probe and all endpoint checks, so the connection is reused
+    base_url = "http://localhost:8001"
+    client = httpx.AsyncClient(base_url=base_url, timeout=10)
     
     try:
-        # Test endpoints
-        base_url = "http://localhost:8001"
+        # Wait for server to start: poll health with a short backoff instead of a fixed sleep
+        print("⏳ Waiting for server to start...")
+        for delay in (0.1, 0.2, 0.4, 0.8, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0):
+            try:
+                await client.get("/api/v1/health", timeout=1)
+                break
+            except httpx.TransportError:
+                await asyncio.sleep(delay)
+        else:
+            print("❌ Server did not become ready")
+            return False
         
+        # Test endpoints
         print("\n📡 Testing API endpoints...")
         
+        # The three checks are independent, so issue them concurrently
+        health, keys_response, docs = await asyncio.gather(
+            client.get("/api/v1/health"),
+            client.get("/api/v1/keys"),
+            client.get("/docs"),
+            return_exceptions=True
+        )
+        
         # Test health endpoint
         try:
-            response = requests.get(f"{base_url}/api/v1/health", timeout=10)
-            print(f"Health check: {response.status_code}")
-            if response.status_code == 200:
-                print(f"✅ Health check passed: {response.json()}")
+            if isinstance(health, Exception):
+                raise health
+            print(f"Health check: {health.status_code}")
+            if health.status_code == 200:
+                print(f"✅ Health check passed: {health.json()}")
             else:
-                print(f"❌ Health check failed: {response.text}")
+                print(f"❌ Health check failed: {health.text}")
         except Exception as e:
             print(f"❌ Health check error: {e}")
         
         # Test keys endpoint
         try:
-            response = requests.get(f"{base_url}/api/v1/keys", timeout=10)
-            print(f"Keys endpoint: {response.status_code}")
-            if response.status_code == 200:
-                keys = response.json()
+            if isinstance(keys_response, Exception):
+                raise keys_response
+            print(f"Keys endpoint: {keys_response.status_code}")
+            if keys_response.status_code == 200:
+                keys = keys_response.json()
                 print(f"✅ Keys endpoint passed: {len(keys.get('keys', []))} keys found")
             else:
-                print(f"❌ Keys endpoint failed: {response.text}")
+                print(f"❌ Keys endpoint failed: {keys_response.text}")
         except Exception as e:
             print(f"❌ Keys endpoint error: {e}")
         
         # Test API docs
         try:
-            response = requests.get(f"{base_url}/docs", timeout=10)
-            print(f"API docs: {response.status_code}")
-            if response.status_code == 200:
+            if isinstance(docs, Exception):
+                raise docs
+            print(f"API docs: {docs.status_code}")
+            if docs.status_code == 200:
                 print("✅ API docs accessible")
             else:
                 print("❌ API docs not accessible")
@@ -85,6 +107,8 @@ def test_fastapi_with_postgres():
         return False
     
     finally:
+        await client.aclose()
+        
         # Stop the server
         print("\n🛑 Stopping FastAPI server...")
         process.terminate()
@@ -92,7 +116,7 @@ def test_fastapi_with_postgres():
         print("✅ Server stopped")
 
 if __name__ == "__main__":
-    success = test_fastapi_with_postgres()
+    success = asyncio.run(test_fastapi_with_postgres())
     
     if success:
         print("\n🎉 FastAPI with PostgreSQL test completed!")
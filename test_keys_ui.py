@@ -4,15 +4,26 @@ Test script for Keys UI functionality
 """
 
 import asyncio
-import json
+import orjson
+from typing import Optional
 from sage.sage_mcp import SageMCP
 
+# Shared SageMCP instance, created on first use and closed once at exit
+_SAGE: Optional[SageMCP] = None
+
+def _get_sage() -> SageMCP:
+    """Return the shared SageMCP instance, initializing it only once"""
+    global _SAGE
+    if _SAGE is None:
+        _SAGE = SageMCP()
+    return _SAGE
+
 async def test_keys_functionality():
     """Test the keys management functionality"""
     print("🧪 Testing Keys Management Functionality")
     
     # Initialize SageMCP
-    sage = SageMCP()
+    sage = _get_sage()
     
     try:
         # Test adding a key
@@ -27,14 +38,15 @@ async def test_keys_functionality():
         # Test listing keys
         print("\n2. Testing list_keys...")
         keys = await sage.list_keys("coral_ui_session_default")
-        print(f"✅ Found {len(keys)} keys:")
-        for key in keys:
-            print(f"   - {key['key_name']} ({key['key_id']})")
+        # Build the listing once and write it in a single call
+        lines = [f"✅ Found {len(keys)} keys:"]
+        lines.extend(f"   - {key['key_name']} ({key['key_id']})" for key in keys)
+        print("\n".join(lines))
         
         # Test key data structure
         if keys:
             print("\n3. Key data structure:")
-            print(json.dumps(keys[0], indent=2, default=str))
+            print(orjson.dumps(keys[0], option=orjson.OPT_INDENT_2, default=str).decode())
         
         print("\n✅ All tests passed!")
         
@@ -42,10 +54,15 @@ async def test_keys_functionality():
         print(f"❌ Test failed: {e}")
         import traceback
         traceback.print_exc()
-    
+
+async def main():
+    """Run the checks, then close the shared SageMCP instance"""
+    try:
+        await test_keys_functionality()
     finally:
         # Cleanup
-        await sage.close()
+        if _SAGE is not None:
+            await _SAGE.close()
 
 if __name__ == "__main__":
-    asyncio.run(test_keys_functionality())
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
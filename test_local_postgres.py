@@ -5,35 +5,65 @@ Test FastAPI app locally with PostgreSQL connection
 
 import os
 import sys
+import asyncio
+from contextlib import ExitStack
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-def test_postgres_connection():
+# Shared TestClient; its lifespan is entered once and closed by _exit_stack at exit
+_client = None
+_exit_stack = ExitStack()
+
+def _get_client():
+    """Return the shared TestClient, running the app's startup only on first use"""
+    global _client
+    if _client is None:
+        from fastapi.testclient import TestClient
+        from sage_api import app
+        _client = _exit_stack.enter_context(TestClient(app))
+    return _client
+
+async def test_postgres_connection():
     """Test PostgreSQL connection"""
     print("🔍 Testing PostgreSQL Connection...")
     
     try:
-        from sage.config.database import db_config, is_postgres, get_db_connection
+        from sage.config.database import db_config, is_postgres
         
+        use_pg = is_postgres()
         print(f"Environment: {os.getenv('ENVIRONMENT')}")
-        print(f"Using PostgreSQL: {is_postgres()}")
+        print(f"Using PostgreSQL: {use_pg}")
         
-        if is_postgres():
+        if use_pg:
             print("✅ PostgreSQL configuration detected")
             
-            # Test connection
-            with get_db_connection('keys') as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT COUNT(*) FROM sage_keys_stored_keys")
-                count = cursor.fetchone()[0]
+            # Test connection (asyncpg is only needed by this script)
+            import asyncpg
+            
+            params = db_config.get_connection_params()
+            async with asyncpg.create_pool(
+                host=params['host'],
+                port=params['port'],
+                database=params['database'],
+                user=params['user'],
+                password=params['password'],
+                min_size=1,
+                max_size=4
+            ) as pool:
+                # Count and sample keys in one round-trip; the LEFT JOIN keeps the
+                # count row even when the table is empty
+                rows = await pool.fetch(
+                    "WITH c AS (SELECT COUNT(*) AS n FROM sage_keys_stored_keys) "
+                    "SELECT c.n, k.key_name FROM c "
+                    "LEFT JOIN (SELECT key_name FROM sage_keys_stored_keys LIMIT 3) k ON TRUE"
+                )
+                count = rows[0][0]
                 print(f"✅ Connected to PostgreSQL - Found {count} keys")
                 
                 # Test a simple query
-                cursor.execute("SELECT key_name FROM sage_keys_stored_keys LIMIT 3")
-                keys = cursor.fetchall()
-                print(f"Sample keys: {[key[0] for key in keys]}")
+                print(f"Sample keys: {[row[1] for row in rows if row[1] is not None]}")
                 
         else:
             print("❌ Not using PostgreSQL - check your .env file")
@@ -50,11 +80,9 @@ def test_fastapi_endpoints():
     print("\n🚀 Testing FastAPI Endpoints...")
     
     try:
-        import uvicorn
-        from fastapi.testclient import TestClient
-        from sage_api import app
+        import orjson
         
-        client = TestClient(app)
+        client = _get_client()
         
         # Test health endpoint
         response = client.get("/api/v1/health")
@@ -64,7 +92,7 @@ def test_fastapi_endpoints():
         response = client.get("/api/v1/keys")
         print(f"Keys endpoint: {response.status_code}")
         if response.status_code == 200:
-            keys = response.json()
+            keys = orjson.loads(response.content)
             print(f"Found {len(keys.get('keys', []))} keys")
         
         return True
@@ -78,17 +106,18 @@ if __name__ == "__main__":
     print("=" * 50)
     
     # Test 1: Database connection
-    if test_postgres_connection():
+    if asyncio.run(test_postgres_connection()):
         print("✅ Database connection test passed")
     else:
         print("❌ Database connection test failed")
         sys.exit(1)
     
     # Test 2: FastAPI endpoints
-    if test_fastapi_endpoints():
-        print("✅ FastAPI endpoints test passed")
-    else:
-        print("❌ FastAPI endpoints test failed")
-        sys.exit(1)
+    with _exit_stack:
+        if test_fastapi_endpoints():
+            print("✅ FastAPI endpoints test passed")
+        else:
+            print("❌ FastAPI endpoints test failed")
+            sys.exit(1)
     
     print("\n🎉 All tests passed! Your app is ready for PostgreSQL.")
\ No newline at end of file
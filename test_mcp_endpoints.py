@@ -3,15 +3,21 @@
 Test script to check MCP endpoints
 """
 
-import requests
+import asyncio
+import aiohttp
 import json
 
-def test_endpoints():
+async def _probe(session: aiohttp.ClientSession, url: str):
+    """GET a URL and return its status code and body text"""
+    async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as response:
+        return response.status, await response.text()
+
+async def test_endpoints():
     base_url = "http://localhost:8000"
     
     endpoints_to_test = [
         "/health",
-        "/docs", 
+        "/docs",
         "/mcp",
         "/mcp/tools",
         "/mcp/list_tools",
@@ -21,37 +27,52 @@ def test_endpoints():
     print("🔍 Testing Sage MCP Endpoints...")
     print("=" * 50)
     
-    for endpoint in endpoints_to_test:
-        url = f"{base_url}{endpoint}"
-        try:
-            response = requests.get(url, timeout=5)
-            print(f"✅ {endpoint}: {response.status_code}")
-            
-            if endpoint == "/mcp" and response.status_code == 200:
-                print(f"   Response: {response.text[:100]}...")
-                
-        except requests.exceptions.RequestException as e:
-            print(f"❌ {endpoint}: Error - {e}")
+    # One pooled session; every probe and the OpenAPI fetch go out concurrently
+    async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=16)) as session:
+        results = await asyncio.gather(
+            *(_probe(session, f"{base_url}{endpoint}") for endpoint in endpoints_to_test),
+            _probe(session, f"{base_url}/openapi.json"),
+            return_exceptions=True
+        )
+    
+    # Collect the report lines and write them once instead of printing per probe
+    lines = []
+    for endpoint, result in zip(endpoints_to_test, results):
+        if isinstance(result, Exception):
+            lines.append(f"❌ {endpoint}: Error - {result}")
+            continue
+        
+        status, text = result
+        lines.append(f"✅ {endpoint}: {status}")
+        
+        if endpoint == "/mcp" and status == 200:
+            lines.append(f"   Response: {text[:100]}...")
+    print("\n".join(lines))
     
     print("\n" + "=" * 50)
     print("🔍 Checking FastAPI docs for all available routes...")
     
     try:
         # Get OpenAPI spec to see all routes
-        response = requests.get(f"{base_url}/openapi.json")
-        if response.status_code == 200:
-            openapi_spec = response.json()
+        result = results[-1]
+        if isinstance(result, Exception):
+            raise result
+        
+        status, text = result
+        if status == 200:
+            openapi_spec = json.loads(text)
             paths = openapi_spec.get("paths", {})
             
-            print(f"📋 Found {len(paths)} API endpoints:")
+            lines = [f"📋 Found {len(paths)} API endpoints:"]
             for path in sorted(paths.keys()):
                 methods = list(paths[path].keys())
-                print(f"   {path} ({', '.join(methods).upper()})")
+                lines.append(f"   {path} ({', '.join(methods).upper()})")
+            print("\n".join(lines))
         else:
             print("❌ Could not get OpenAPI spec")
-            
+    
     except Exception as e:
         print(f"❌ Error getting API spec: {e}")
 
 if __name__ == "__main__":
-    test_endpoints()
\ No newline at end of file
+    asyncio.run(test_endpoints())
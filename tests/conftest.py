@@ -0,0 +1,52 @@
+"""
+Shared pytest configuration for the Sage test suite
+"""
+
+import asyncio
+
+import pytest
+
+# Run async tests on uvloop when it is installed (it is not available on Windows)
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
+
+def _point_keys_db(mp, path):
+    """Force the shared db_config onto SQLite, with the 'keys' database at path
+    
+    Patching use_postgres keeps a developer's .env (ENVIRONMENT=production and
+    DATABASE_URL) from pointing the key tests at a real PostgreSQL database.
+    """
+    from sage.config.database import db_config
+    
+    mp.setattr(db_config, "use_postgres", False)
+    params = {
+        'type': 'sqlite',
+        'keys_db': str(path),
+        'grants_db': 'sage_grants.db',
+        'policy_db': 'sage_policy.db',
+        'audit_db': 'sage_audit_logs.db'
+    }
+    mp.setattr(db_config, "get_connection_params", lambda: dict(params))
+
+
+@pytest.fixture(scope="module")
+def keys_db_path(tmp_path_factory):
+    """One keys database file per test module; tests empty it instead of recreating it
+    
+    The db_config patch is undone when the module finishes, so later modules
+    see the configuration from the environment again.
+    """
+    path = tmp_path_factory.mktemp("db") / "keys.db"
+    with pytest.MonkeyPatch.context() as mp:
+        _point_keys_db(mp, path)
+        yield path
+
+
+@pytest.fixture
+def use_keys_db(monkeypatch):
+    """Return a callable that points the keys database at a fresh path for a single test"""
+    return lambda path: _point_keys_db(monkeypatch, path)
@@ -1,17 +1,25 @@
 """
 Unit tests for AuthorizationEngine
+
+Every test gets its own uniquely named database, so the module can run in
+parallel with pytest-xdist: pytest -n auto tests/test_authorization_engine.py
 """
 
 import pytest
 import asyncio
 import os
+import sqlite3
 import tempfile
+import uuid
 from datetime import datetime, timedelta
 from unittest.mock import patch
 
 from sage.services.authorization_engine import AuthorizationEngine
 from sage.models.access_grant import AccessGrant
 
+# One reference time for the whole module; expiries are offset by an hour or more
+NOW = datetime.utcnow()
+
 
 class TestAuthorizationEngine:
     """Test suite for AuthorizationEngine"""
@@ -27,9 +35,19 @@ class TestAuthorizationEngine:
             os.unlink(path)
     
     @pytest.fixture
-    def auth_engine(self, temp_db):
-        """Create AuthorizationEngine instance with temporary database"""
-        return AuthorizationEngine(db_path=temp_db)
+    def memory_db(self):
+        """Create a shared in-memory database for testing"""
+        uri = f"file:auth_{uuid.uuid4().hex}?mode=memory&cache=shared"
+        # A shared in-memory database lives only while a connection is open,
+        # so hold one for the duration of the test
+        keeper = sqlite3.connect(uri, uri=True)
+        yield uri
+        keeper.close()
+    
+    @pytest.fixture
+    def auth_engine(self, memory_db):
+        """Create AuthorizationEngine instance with in-memory database"""
+        return AuthorizationEngine(db_path=memory_db)
     
     @pytest.fixture
     def sample_permissions(self):
@@ -39,9 +57,8 @@ class TestAuthorizationEngine:
     @pytest.fixture
     def future_expiry(self):
         """Future expiry time for testing"""
-        return datetime.utcnow() + timedelta(days=1)
+        return NOW + timedelta(days=1)
     
-    @pytest.mark.asyncio
     async def test_create_grant_success(self, auth_engine, sample_permissions, future_expiry):
         """Test successful grant creation"""
         key_id = "test-key-123"
@@ -60,7 +77,6 @@ class TestAuthorizationEngine:
         assert isinstance(grant_id, str)
         assert len(grant_id) > 0
     
-    @pytest.mark.asyncio
     async def test_create_grant_invalid_inputs(self, auth_engine, sample_permissions, future_expiry):
         """Test grant creation with invalid inputs"""
         # Empty key_id
@@ -80,7 +96,7 @@ class TestAuthorizationEngine:
             await auth_engine.create_grant("key", "caller", "invalid", future_expiry, "owner")
         
         # Past expiry time
-        past_time = datetime.utcnow() - timedelta(hours=1)
+        past_time = NOW - timedelta(hours=1)
         with pytest.raises(ValueError, match="Expiry time must be in the future"):
             await auth_engine.create_grant("key", "caller", sample_permissions, past_time, "owner")
         
@@ -94,7 +110,6 @@ class TestAuthorizationEngine:
         with pytest.raises(ValueError, match="max_calls_per_day must be a positive integer"):
             await auth_engine.create_grant("key", "caller", invalid_permissions, future_expiry, "owner")
     
-    @pytest.mark.asyncio
     async def test_check_authorization_success(self, auth_engine, sample_permissions, future_expiry):
         """Test successful authorization check"""
         key_id = "test-key-123"
@@ -114,13 +129,11 @@ class TestAuthorizationEngine:
         is_authorized = await auth_engine.check_authorization(key_id, caller_id)
         assert is_authorized is True
     
-    @pytest.mark.asyncio
     async def test_check_authorization_no_grant(self, auth_engine):
         """Test authorization check with no existing grant"""
         is_authorized = await auth_engine.check_authorization("nonexistent-key", "caller")
         assert is_authorized is False
     
-    @pytest.mark.asyncio
     async def test_check_authorization_expired_grant(self, auth_engine, sample_permissions):
         """Test authorization check with expired grant"""
         key_id = "test-key-123"
@@ -128,7 +141,7 @@ class TestAuthorizationEngine:
         owner_id = "owner-session-789"
         
         # Create grant that expires in the past
-        past_expiry = datetime.utcnow() - timedelta(hours=1)
+        past_expiry = NOW - timedelta(hours=1)
         await auth_engine.create_grant(
             key_id=key_id,
             caller_id=caller_id,
@@ -142,7 +155,6 @@ class TestAuthorizationEngine:
         is_authorized = await auth_engine.check_authorization(key_id, caller_id)
         assert is_authorized is False
     
-    @pytest.mark.asyncio
     async def test_get_grant_success(self, auth_engine, sample_permissions, future_expiry):
         """Test successful grant retrieval"""
         key_id = "test-key-123"
@@ -169,13 +181,11 @@ class TestAuthorizationEngine:
         assert grant.is_active is True
         assert not grant.is_expired()
     
-    @pytest.mark.asyncio
     async def test_get_grant_not_found(self, auth_engine):
         """Test grant retrieval when grant doesn't exist"""
         grant = await auth_engine.get_grant("nonexistent-key", "caller")
         assert grant is None
     
-    @pytest.mark.asyncio
     async def test_get_grant_expired(self, auth_engine, sample_permissions):
         """Test grant retrieval when grant is expired"""
         key_id = "test-key-123"
@@ -183,7 +193,7 @@ class TestAuthorizationEngine:
         owner_id = "owner-session-789"
         
         # Create expired grant
-        past_expiry = datetime.utcnow() - timedelta(hours=1)
+        past_expiry = NOW - timedelta(hours=1)
         await auth_engine.create_grant(
             key_id=key_id,
             caller_id=caller_id,
@@ -197,7 +207,6 @@ class TestAuthorizationEngine:
         grant = await auth_engine.get_grant(key_id, caller_id)
         assert grant is None
     
-    @pytest.mark.asyncio
     async def test_revoke_grant_success(self, auth_engine, sample_permissions, future_expiry):
         """Test successful grant revocation"""
         key_id = "test-key-123"
@@ -221,13 +230,11 @@ class TestAuthorizationEngine:
         is_authorized = await auth_engine.check_authorization(key_id, caller_id)
         assert is_authorized is False
     
-    @pytest.mark.asyncio
     async def test_revoke_grant_not_found(self, auth_engine):
         """Test grant revocation when grant doesn't exist"""
         with pytest.raises(ValueError, match="Grant not found or already inactive"):
             await auth_engine.revoke_grant("nonexistent-grant", "owner")
     
-    @pytest.mark.asyncio
     async def test_revoke_grant_wrong_owner(self, auth_engine, sample_permissions, future_expiry):
         """Test grant revocation by wrong owner"""
         key_id = "test-key-123"
@@ -248,7 +255,6 @@ class TestAuthorizationEngine:
         with pytest.raises(ValueError, match="Access denied: grant not owned by requester"):
             await auth_engine.revoke_grant(grant_id, wrong_owner)
     
-    @pytest.mark.asyncio
     async def test_revoke_grants_for_key(self, auth_engine, sample_permissions, future_expiry):
         """Test revoking all grants for a specific key"""
         key_id = "test-key-123"
@@ -258,8 +264,12 @@ class TestAuthorizationEngine:
         caller1 = "caller1"
         caller2 = "caller2"
         
-        await auth_engine.create_grant(key_id, caller1, sample_permissions, future_expiry, owner_id)
-        await auth_engine.create_grant(key_id, caller2, sample_permissions, future_expiry, owner_id)
+        await auth_engine.create_grants_bulk([
+            {"key_id": key_id, "caller_id": caller1, "permissions": sample_permissions,
+             "expires_at": future_expiry, "owner_id": owner_id},
+            {"key_id": key_id, "caller_id": caller2, "permissions": sample_permissions,
+             "expires_at": future_expiry, "owner_id": owner_id}
+        ])
         
         # Revoke all grants for the key
         revoked_count = await auth_engine.revoke_grants_for_key(key_id, owner_id)
@@ -269,7 +279,6 @@ class TestAuthorizationEngine:
         assert await auth_engine.check_authorization(key_id, caller1) is False
         assert await auth_engine.check_authorization(key_id, caller2) is False
     
-    @pytest.mark.asyncio
     async def test_cleanup_expired_grants(self, auth_engine, sample_permissions):
         """Test cleanup of expired grants"""
         key_id = "test-key-123"
@@ -277,7 +286,7 @@ class TestAuthorizationEngine:
         owner_id = "owner-session-789"
         
         # Create expired grant
-        past_expiry = datetime.utcnow() - timedelta(hours=1)
+        past_expiry = NOW - timedelta(hours=1)
         await auth_engine.create_grant(
             key_id=key_id,
             caller_id=caller_id,
@@ -288,7 +297,7 @@ class TestAuthorizationEngine:
         )
         
         # Create active grant
-        future_expiry = datetime.utcnow() + timedelta(days=1)
+        future_expiry = NOW + timedelta(days=1)
         await auth_engine.create_grant(
             key_id="active-key",
             caller_id="active-caller",
@@ -306,7 +315,6 @@ class TestAuthorizationEngine:
         # Verify active grant is still active
         assert await auth_engine.check_authorization("active-key", "active-caller") is True
     
-    @pytest.mark.asyncio
     async def test_list_grants_by_owner(self, auth_engine, sample_permissions, future_expiry):
         """Test listing grants by owner"""
         owner_id = "owner-session-789"
@@ -316,8 +324,12 @@ class TestAuthorizationEngine:
         caller2 = "caller2"
         
         # Create grants
-        grant_id1 = await auth_engine.create_grant(key_id1, caller1, sample_permissions, future_expiry, owner_id)
-        grant_id2 = await auth_engine.create_grant(key_id2, caller2, sample_permissions, future_expiry, owner_id)
+        grant_id1, grant_id2 = await auth_engine.create_grants_bulk([
+            {"key_id": key_id1, "caller_id": caller1, "permissions": sample_permissions,
+             "expires_at": future_expiry, "owner_id": owner_id},
+            {"key_id": key_id2, "caller_id": caller2, "permissions": sample_permissions,
+             "expires_at": future_expiry, "owner_id": owner_id}
+        ])
         
         # List grants
         grants = await auth_engine.list_grants_by_owner(owner_id)
@@ -340,20 +352,31 @@ class TestAuthorizationEngine:
             assert grant['is_active'] is True
             assert grant['is_expired'] is False
     
-    @pytest.mark.asyncio
+    async def test_create_grants_bulk_invalid_stores_nothing(self, auth_engine, sample_permissions, future_expiry):
+        """Test that one invalid entry rejects the whole bulk create"""
+        owner_id = "owner-session-789"
+        
+        with pytest.raises(ValueError, match="Caller ID cannot be empty"):
+            await auth_engine.create_grants_bulk([
+                {"key_id": "key1", "caller_id": "caller1", "permissions": sample_permissions,
+                 "expires_at": future_expiry, "owner_id": owner_id},
+                {"key_id": "key2", "caller_id": "", "permissions": sample_permissions,
+                 "expires_at": future_expiry, "owner_id": owner_id}
+            ])
+        
+        assert await auth_engine.list_grants_by_owner(owner_id) == []
+    
     async def test_list_grants_by_owner_empty(self, auth_engine):
         """Test listing grants for owner with no grants"""
         grants = await auth_engine.list_grants_by_owner("nonexistent-owner")
         assert grants == []
     
-    @pytest.mark.asyncio
     async def test_validate_coral_identity_success(self, auth_engine):
         """Test successful Coral identity validation"""
         session_id = "valid-session-12345678"
         caller_id = await auth_engine.validate_coral_identity(session_id)
         assert caller_id == session_id
     
-    @pytest.mark.asyncio
     async def test_validate_coral_identity_invalid(self, auth_engine):
         """Test Coral identity validation with invalid inputs"""
         # Empty session ID
@@ -364,7 +387,6 @@ class TestAuthorizationEngine:
         with pytest.raises(ValueError, match="Invalid session ID format"):
             await auth_engine.validate_coral_identity("short")
     
-    @pytest.mark.asyncio
     async def test_grant_replacement(self, auth_engine, sample_permissions, future_expiry):
         """Test that creating a new grant for same key/caller replaces the old one"""
         key_id = "test-key-123"
@@ -402,7 +424,6 @@ class TestAuthorizationEngine:
         assert grant.permissions == new_permissions
         assert grant.grant_id == grant_id2
     
-    @pytest.mark.asyncio
     async def test_database_initialization(self, temp_db):
         """Test that database is properly initialized"""
         # Create engine - should initialize database
@@ -412,7 +433,7 @@ class TestAuthorizationEngine:
         assert os.path.exists(temp_db)
         
         # Verify we can perform operations
-        future_expiry = datetime.utcnow() + timedelta(days=1)
+        future_expiry = NOW + timedelta(days=1)
         permissions = {"max_calls_per_day": 100}
         
         grant_id = await auth_engine.create_grant(
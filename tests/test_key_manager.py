@@ -4,45 +4,44 @@ Unit tests for KeyManager service
 
 import pytest
 import asyncio
-import tempfile
-import os
 from datetime import datetime
 from unittest.mock import Mock, patch, AsyncMock
 
 from sage.services.key_manager import KeyManager
+from sage.config.database import get_db_connection
 from sage.services.key_storage import KeyStorageService
 from sage.utils.encryption import EncryptionManager
 from sage.models.stored_key import StoredKey
 
 
+@pytest.fixture(scope="session")
+def encryption_manager():
+    """Create encryption manager once; key derivation is the slow part"""
+    return EncryptionManager()
+
+
+@pytest.fixture(scope="module")
+def storage_service(keys_db_path, encryption_manager):
+    """Create storage service on the module keys database"""
+    return KeyStorageService(encryption_manager=encryption_manager)
+
+
+@pytest.fixture(autouse=True)
+def _wipe(storage_service):
+    """Empty the shared keys table so every test starts from a clean database"""
+    with get_db_connection('keys') as conn:
+        conn.execute(f"DELETE FROM {storage_service._get_table_name()}")
+        conn.commit()
+
+
 class TestKeyManager:
     """Test cases for KeyManager class"""
     
-    @pytest.fixture
-    def temp_db(self):
-        """Create temporary database for testing"""
-        fd, path = tempfile.mkstemp(suffix='.db')
-        os.close(fd)
-        yield path
-        if os.path.exists(path):
-            os.unlink(path)
-    
-    @pytest.fixture
-    def encryption_manager(self):
-        """Create encryption manager for testing"""
-        return EncryptionManager()
-    
-    @pytest.fixture
-    def storage_service(self, temp_db, encryption_manager):
-        """Create storage service for testing"""
-        return KeyStorageService(db_path=temp_db, encryption_manager=encryption_manager)
-    
     @pytest.fixture
     def key_manager(self, storage_service, encryption_manager):
         """Create KeyManager instance for testing"""
         return KeyManager(storage_service=storage_service, encryption_manager=encryption_manager)
     
-    @pytest.mark.asyncio
     async def test_store_key_success(self, key_manager):
         """Test successful key storage"""
         key_name = "test-openai-key"
@@ -56,7 +55,6 @@ class TestKeyManager:
         assert isinstance(key_id, str)
         assert len(key_id) > 0
     
-    @pytest.mark.asyncio
     async def test_store_key_invalid_api_key(self, key_manager):
         """Test storing invalid API key"""
         key_name = "test-key"
@@ -67,7 +65,6 @@ class TestKeyManager:
         with pytest.raises(ValueError, match="Invalid API key format"):
             await key_manager.store_key(key_name, invalid_api_key, owner_id, coral_session_id)
     
-    @pytest.mark.asyncio
     async def test_store_key_empty_key_name(self, key_manager):
         """Test storing key with empty name"""
         key_name = ""
@@ -78,7 +75,6 @@ class TestKeyManager:
         with pytest.raises(ValueError, match="Key name cannot be empty"):
             await key_manager.store_key(key_name, api_key, owner_id, coral_session_id)
     
-    @pytest.mark.asyncio
     async def test_store_key_empty_owner_id(self, key_manager):
         """Test storing key with empty owner ID"""
         key_name = "test-key"
@@ -89,7 +85,6 @@ class TestKeyManager:
         with pytest.raises(ValueError, match="Owner ID cannot be empty"):
             await key_manager.store_key(key_name, api_key, owner_id, coral_session_id)
     
-    @pytest.mark.asyncio
     async def test_store_key_duplicate_name(self, key_manager):
         """Test storing key with duplicate name for same owner"""
         key_name = "duplicate-key"
@@ -104,7 +99,6 @@ class TestKeyManager:
         with pytest.raises(ValueError, match="Key name 'duplicate-key' already exists"):
             await key_manager.store_key(key_name, api_key, owner_id, coral_session_id)
     
-    @pytest.mark.asyncio
     async def test_retrieve_key_for_proxy_success(self, key_manager):
         """Test successful key retrieval for proxy"""
         key_name = "test-key"
@@ -120,7 +114,6 @@ class TestKeyManager:
         
         assert retrieved_key == api_key
     
-    @pytest.mark.asyncio
     async def test_retrieve_key_for_proxy_not_found(self, key_manager):
         """Test retrieving non-existent key"""
         non_existent_key_id = "non-existent-key-id"
@@ -128,7 +121,6 @@ class TestKeyManager:
         with pytest.raises(ValueError, match="Key not found"):
             await key_manager._retrieve_key_for_proxy(non_existent_key_id)
     
-    @pytest.mark.asyncio
     async def test_retrieve_key_for_proxy_inactive(self, key_manager):
         """Test retrieving inactive key"""
         key_name = "test-key"
@@ -143,7 +135,6 @@ class TestKeyManager:
         with pytest.raises(ValueError, match="Key is inactive"):
             await key_manager._retrieve_key_for_proxy(key_id)
     
-    @pytest.mark.asyncio
     async def test_list_keys_success(self, key_manager):
         """Test successful key listing"""
         owner_id = "coral-user-123"
@@ -166,13 +157,11 @@ class TestKeyManager:
         assert all('encrypted_key' not in key for key in keys)
         assert all('api_key' not in key for key in keys)
     
-    @pytest.mark.asyncio
     async def test_list_keys_empty_owner_id(self, key_manager):
         """Test listing keys with empty owner ID"""
         with pytest.raises(ValueError, match="Owner ID cannot be empty"):
             await key_manager.list_keys("")
     
-    @pytest.mark.asyncio
     async def test_rotate_key_success(self, key_manager):
         """Test successful key rotation"""
         key_name = "test-key"
@@ -192,7 +181,6 @@ class TestKeyManager:
         retrieved_key = await key_manager._retrieve_key_for_proxy(key_id)
         assert retrieved_key == new_api_key
     
-    @pytest.mark.asyncio
     async def test_rotate_key_invalid_new_key(self, key_manager):
         """Test rotating with invalid new key"""
         key_name = "test-key"
@@ -207,7 +195,6 @@ class TestKeyManager:
         with pytest.raises(ValueError, match="Invalid new API key format"):
             await key_manager.rotate_key(key_id, "", owner_id)
     
-    @pytest.mark.asyncio
     async def test_rotate_key_not_found(self, key_manager):
         """Test rotating non-existent key"""
         non_existent_key_id = "non-existent-key-id"
@@ -217,7 +204,6 @@ class TestKeyManager:
         with pytest.raises(ValueError, match="Key not found or access denied"):
             await key_manager.rotate_key(non_existent_key_id, new_api_key, owner_id)
     
-    @pytest.mark.asyncio
     async def test_rotate_key_wrong_owner(self, key_manager):
         """Test rotating key with wrong owner"""
         key_name = "test-key"
@@ -233,7 +219,6 @@ class TestKeyManager:
         with pytest.raises(ValueError, match="Key not found or access denied"):
             await key_manager.rotate_key(key_id, "sk-new123", wrong_owner_id)
     
-    @pytest.mark.asyncio
     async def test_revoke_key_success(self, key_manager):
         """Test successful key revocation"""
         key_name = "test-key"
@@ -252,7 +237,6 @@ class TestKeyManager:
         with pytest.raises(ValueError, match="Key is inactive"):
             await key_manager._retrieve_key_for_proxy(key_id)
     
-    @pytest.mark.asyncio
     async def test_revoke_key_not_found(self, key_manager):
         """Test revoking non-existent key"""
         non_existent_key_id = "non-existent-key-id"
@@ -261,7 +245,6 @@ class TestKeyManager:
         with pytest.raises(ValueError, match="Key not found or access denied"):
             await key_manager.revoke_key(non_existent_key_id, owner_id)
     
-    @pytest.mark.asyncio
     async def test_revoke_key_wrong_owner(self, key_manager):
         """Test revoking key with wrong owner"""
         key_name = "test-key"
@@ -277,7 +260,6 @@ class TestKeyManager:
         with pytest.raises(ValueError, match="Key not found or access denied"):
             await key_manager.revoke_key(key_id, wrong_owner_id)
     
-    @pytest.mark.asyncio
     async def test_verify_key_ownership_success(self, key_manager):
         """Test successful key ownership verification"""
         key_name = "test-key"
@@ -292,7 +274,6 @@ class TestKeyManager:
         is_owner = await key_manager.verify_key_ownership(key_id, owner_id)
         assert is_owner is True
     
-    @pytest.mark.asyncio
     async def test_verify_key_ownership_wrong_owner(self, key_manager):
         """Test key ownership verification with wrong owner"""
         key_name = "test-key"
@@ -308,13 +289,11 @@ class TestKeyManager:
         is_owner = await key_manager.verify_key_ownership(key_id, wrong_owner_id)
         assert is_owner is False
     
-    @pytest.mark.asyncio
     async def test_verify_key_ownership_empty_owner(self, key_manager):
         """Test key ownership verification with empty owner ID"""
         is_owner = await key_manager.verify_key_ownership("some-key-id", "")
         assert is_owner is False
     
-    @pytest.mark.asyncio
     async def test_get_key_metadata_success(self, key_manager):
         """Test successful key metadata retrieval"""
         key_name = "test-key"
@@ -340,7 +319,6 @@ class TestKeyManager:
         assert 'encrypted_key' not in metadata
         assert 'api_key' not in metadata
     
-    @pytest.mark.asyncio
     async def test_get_key_metadata_wrong_owner(self, key_manager):
         """Test key metadata retrieval with wrong owner"""
         key_name = "test-key"
@@ -356,7 +334,6 @@ class TestKeyManager:
         metadata = await key_manager.get_key_metadata(key_id, wrong_owner_id)
         assert metadata is None
     
-    @pytest.mark.asyncio
     async def test_get_key_metadata_empty_owner(self, key_manager):
         """Test key metadata retrieval with empty owner ID"""
         metadata = await key_manager.get_key_metadata("some-key-id", "")
@@ -367,22 +344,10 @@ class TestKeyManagerIntegration:
     """Integration tests for KeyManager with real storage"""
     
     @pytest.fixture
-    def temp_db(self):
-        """Create temporary database for testing"""
-        fd, path = tempfile.mkstemp(suffix='.db')
-        os.close(fd)
-        yield path
-        if os.path.exists(path):
-            os.unlink(path)
-    
-    @pytest.fixture
-    def key_manager(self, temp_db):
+    def key_manager(self, storage_service, encryption_manager):
         """Create KeyManager with real storage for integration testing"""
-        encryption_manager = EncryptionManager()
-        storage_service = KeyStorageService(db_path=temp_db, encryption_manager=encryption_manager)
         return KeyManager(storage_service=storage_service, encryption_manager=encryption_manager)
     
-    @pytest.mark.asyncio
     async def test_full_key_lifecycle(self, key_manager):
         """Test complete key lifecycle: store -> list -> rotate -> revoke"""
         key_name = "lifecycle-test-key"
@@ -425,7 +390,6 @@ class TestKeyManagerIntegration:
         keys = await key_manager.list_keys(owner_id)
         assert len(keys) == 0
     
-    @pytest.mark.asyncio
     async def test_multiple_owners_isolation(self, key_manager):
         """Test that keys are properly isolated between owners"""
         key_name = "shared-name"
@@ -4,36 +4,43 @@ Unit tests for key storage service
 
 import pytest
 import os
-import tempfile
 from datetime import datetime, timedelta
 
+from sage.config.database import get_db_connection
 from sage.models.stored_key import StoredKey
 from sage.services.key_storage import KeyStorageService
 from sage.utils.encryption import EncryptionManager
 
 
+@pytest.fixture(scope="session")
+def encryption_manager():
+    """Create encryption manager once; key derivation is the slow part"""
+    return EncryptionManager("test_key_for_storage")
+
+
+@pytest.fixture(scope="module")
+def storage_service(keys_db_path, encryption_manager):
+    """Create key storage service on the module keys database"""
+    return KeyStorageService(encryption_manager=encryption_manager)
+
+
+@pytest.fixture(autouse=True)
+def _wipe(storage_service):
+    """Empty the shared keys table so every test starts from a clean database"""
+    with get_db_connection('keys') as conn:
+        conn.execute(f"DELETE FROM {storage_service._get_table_name()}")
+        conn.commit()
+
+
 class TestKeyStorageService:
     """Test cases for KeyStorageService"""
     
     @pytest.fixture
-    def temp_db_path(self):
-        """Create temporary database file for testing"""
-        fd, path = tempfile.mkstemp(suffix='.db')
-        os.close(fd)
-        yield path
-        # Cleanup
-        if os.path.exists(path):
-            os.unlink(path)
-    
-    @pytest.fixture
-    def encryption_manager(self):
-        """Create encryption manager for testing"""
-        return EncryptionManager("test_key_for_storage")
-    
-    @pytest.fixture
-    def storage_service(self, temp_db_path, encryption_manager):
-        """Create key storage service for testing"""
-        return KeyStorageService(temp_db_path, encryption_manager)
+    def temp_db_path(self, tmp_path, use_keys_db):
+        """Point the keys database at a not-yet-created file under tmp_path"""
+        path = str(tmp_path / "keys.db")
+        use_keys_db(path)
+        return path
     
     @pytest.fixture
     def sample_stored_key(self, encryption_manager):
@@ -52,7 +59,7 @@ class TestKeyStorageService:
         """Test that initialization creates database and tables"""
         assert not os.path.exists(temp_db_path)
         
-        service = KeyStorageService(temp_db_path, encryption_manager)
+        service = KeyStorageService(encryption_manager=encryption_manager)
         
         assert os.path.exists(temp_db_path)
         
@@ -74,7 +81,6 @@ class TestKeyStorageService:
         assert retrieved.key_name == sample_stored_key.key_name
         assert retrieved.encrypted_key == sample_stored_key.encrypted_key
     
-    @pytest.mark.asyncio
     async def test_store_key_duplicate(self, storage_service, sample_stored_key):
         """Test storing duplicate key fails"""
         # Store first time
@@ -85,7 +91,6 @@ class TestKeyStorageService:
         result2 = await storage_service.store_key(sample_stored_key)
         assert result2 is False
     
-    @pytest.mark.asyncio
     async def test_store_key_invalid(self, storage_service):
         """Test storing invalid key fails"""
         # Create invalid stored key
@@ -103,7 +108,6 @@ class TestKeyStorageService:
         with pytest.raises(ValueError):
             await storage_service.store_key(invalid_key)
     
-    @pytest.mark.asyncio
     async def test_get_key_exists(self, storage_service, sample_stored_key):
         """Test retrieving existing key"""
         # Store key first
@@ -115,13 +119,11 @@ class TestKeyStorageService:
         assert retrieved.key_id == sample_stored_key.key_id
         assert retrieved.owner_id == sample_stored_key.owner_id
     
-    @pytest.mark.asyncio
     async def test_get_key_not_exists(self, storage_service):
         """Test retrieving non-existent key"""
         retrieved = await storage_service.get_key("non_existent_key")
         assert retrieved is None
     
-    @pytest.mark.asyncio
     async def test_get_keys_by_owner(self, storage_service, encryption_manager):
         """Test retrieving keys by owner"""
         owner_id = "coral_user_123"
@@ -163,7 +165,6 @@ class TestKeyStorageService:
         assert key2.key_id in key_ids
         assert key3.key_id not in key_ids
     
-    @pytest.mark.asyncio
     async def test_get_keys_by_owner_active_only(self, storage_service, encryption_manager):
         """Test retrieving only active keys by owner"""
         owner_id = "coral_user_123"
@@ -198,7 +199,6 @@ class TestKeyStorageService:
         all_keys = await storage_service.get_keys_by_owner(owner_id, active_only=False)
         assert len(all_keys) == 2
     
-    @pytest.mark.asyncio
     async def test_update_key(self, storage_service, sample_stored_key):
         """Test updating existing key"""
         # Store key first
@@ -215,13 +215,11 @@ class TestKeyStorageService:
         retrieved = await storage_service.get_key(sample_stored_key.key_id)
         assert retrieved.key_name == "Updated Key Name"
     
-    @pytest.mark.asyncio
     async def test_update_key_not_exists(self, storage_service, sample_stored_key):
         """Test updating non-existent key"""
         result = await storage_service.update_key(sample_stored_key)
         assert result is False
     
-    @pytest.mark.asyncio
     async def test_delete_key(self, storage_service, sample_stored_key):
         """Test deleting key"""
         # Store key first
@@ -235,13 +233,11 @@ class TestKeyStorageService:
         retrieved = await storage_service.get_key(sample_stored_key.key_id)
         assert retrieved is None
     
-    @pytest.mark.asyncio
     async def test_delete_key_not_exists(self, storage_service):
         """Test deleting non-existent key"""
         result = await storage_service.delete_key("non_existent_key")
         assert result is False
     
-    @pytest.mark.asyncio
     async def test_deactivate_key(self, storage_service, sample_stored_key):
         """Test deactivating key"""
         # Store key first
@@ -256,13 +252,11 @@ class TestKeyStorageService:
         assert retrieved is not None
         assert retrieved.is_active is False
     
-    @pytest.mark.asyncio
     async def test_deactivate_key_not_exists(self, storage_service):
         """Test deactivating non-existent key"""
         result = await storage_service.deactivate_key("non_existent_key")
         assert result is False
     
-    @pytest.mark.asyncio
     async def test_verify_key_ownership(self, storage_service, sample_stored_key):
         """Test verifying key ownership"""
         # Store key first
@@ -32,7 +32,6 @@ class TestLoggingService:
         """Create LoggingService instance with temporary database"""
         return LoggingService(db_path=temp_db)
     
-    @pytest.mark.asyncio
     async def test_database_initialization(self, logging_service):
         """Test that database is properly initialized"""
         # Database should be created and accessible
@@ -45,7 +44,6 @@ class TestLoggingService:
             assert 'audit_logs' in tables
             assert 'log_sequence' in tables
     
-    @pytest.mark.asyncio
     async def test_log_proxy_call_success(self, logging_service):
         """Test logging a successful proxy call"""
         caller_id = "caller-123"
@@ -86,7 +84,6 @@ class TestLoggingService:
         assert log['response_code'] == response_code
         assert log['error_message'] is None
     
-    @pytest.mark.asyncio
     async def test_log_proxy_call_with_error(self, logging_service):
         """Test logging a proxy call with error"""
         caller_id = "caller-123"
@@ -117,8 +114,36 @@ class TestLoggingService:
         log = logs[0]
         assert log['response_code'] == response_code
         assert log['error_message'] == error_message
-    
-    @pytest.mark.asyncio
+
+    async def test_log_proxy_calls_batch(self, logging_service):
+        """Test logging several proxy calls in one batch"""
+        calls = [
+            {
+                "caller_id": "caller-123",
+                "key_id": "key-456",
+                "method": "GET",
+                "endpoint": f"/api/v1/items/{i}",
+                "payload_size": 0,
+                "response_time": 10.0 + i,
+                "response_code": 200
+            }
+            for i in range(3)
+        ]
+
+        log_ids = await logging_service.log_proxy_calls(calls)
+
+        assert len(log_ids) == 3
+        logs = await logging_service.get_logs_for_key("key-456", "owner-123")
+        assert len(logs) == 3
+        assert {log['log_id'] for log in logs} == set(log_ids)
+        assert all(log['action'] == "proxy_call" for log in logs)
+
+        # An invalid entry rejects the whole batch
+        with pytest.raises(ValueError):
+            await logging_service.log_proxy_calls([calls[0], {**calls[1], "key_id": ""}])
+        logs = await logging_service.get_logs_for_key("key-456", "owner-123")
+        assert len(logs) == 3
+
     async def test_log_grant_access(self, logging_service):
         """Test logging an access grant operation"""
         caller_id = "owner-123"
@@ -146,7 +171,6 @@ class TestLoggingService:
         assert log['endpoint'] == f'/grant/{granted_to}'
         assert log['response_code'] == 200
     
-    @pytest.mark.asyncio
     async def test_log_rate_limit_blocked(self, logging_service):
         """Test logging a rate limit blocked attempt"""
         caller_id = "caller-123"
@@ -179,7 +203,6 @@ class TestLoggingService:
         assert log['response_code'] == 429
         assert f"{current_usage}/{limit}" in log['error_message']
     
-    @pytest.mark.asyncio
     async def test_log_authorization_failed(self, logging_service):
         """Test logging an authorization failure"""
         caller_id = "caller-123"
@@ -210,7 +233,6 @@ class TestLoggingService:
         assert log['response_code'] == 403
         assert log['error_message'] == reason
     
-    @pytest.mark.asyncio
     async def test_get_logs_for_key_with_filters(self, logging_service):
         """Test retrieving logs for a key with various filters"""
         key_id = "key-456"
@@ -241,7 +263,6 @@ class TestLoggingService:
         limited_logs = await logging_service.get_logs_for_key(key_id, owner_id, limit=1)
         assert len(limited_logs) == 1
     
-    @pytest.mark.asyncio
     async def test_get_logs_for_key_with_date_range(self, logging_service):
         """Test retrieving logs with date range filtering"""
         key_id = "key-456"
@@ -270,7 +291,6 @@ class TestLoggingService:
         )
         assert len(logs_out_of_range) == 0
     
-    @pytest.mark.asyncio
     async def test_get_logs_by_caller(self, logging_service):
         """Test retrieving logs by caller across multiple keys"""
         caller_id = "caller-123"
@@ -292,7 +312,6 @@ class TestLoggingService:
         assert len(key1_logs) == 1
         assert key1_logs[0]['key_id'] == key1
     
-    @pytest.mark.asyncio
     async def test_get_error_logs(self, logging_service):
         """Test retrieving error logs"""
         key_id = "key-456"
@@ -317,7 +336,6 @@ class TestLoggingService:
         assert len(key_error_logs) == 3
         assert all(log['key_id'] == key_id for log in key_error_logs)
     
-    @pytest.mark.asyncio
     async def test_get_usage_statistics(self, logging_service):
         """Test getting usage statistics for a key"""
         key_id = "key-456"
@@ -345,7 +363,6 @@ class TestLoggingService:
         assert stats['total_payload_size'] == 100 + 1024 + 512  # Sum of all proxy call payloads
         assert stats['unique_callers'] == 3  # caller1, caller2, owner_id
     
-    @pytest.mark.asyncio
     async def test_chronological_ordering(self, logging_service):
         """Test that logs are stored and retrieved in chronological order"""
         key_id = "key-456"
@@ -380,7 +397,6 @@ class TestLoggingService:
         
         assert timestamp1 >= timestamp2 >= timestamp3
     
-    @pytest.mark.asyncio
     async def test_tamper_resistant_storage(self, logging_service):
         """Test that logs are stored in tamper-resistant manner"""
         key_id = "key-456"
@@ -399,7 +415,6 @@ class TestLoggingService:
             cursor = conn.execute("SELECT COUNT(*) FROM log_sequence WHERE log_id = ?", (log_id,))
             assert cursor.fetchone()[0] == 1
     
-    @pytest.mark.asyncio
     async def test_cleanup_old_logs(self, logging_service):
         """Test cleaning up old audit logs"""
         key_id = "key-456"
@@ -426,7 +441,6 @@ class TestLoggingService:
         logs = await logging_service.get_logs_for_key(key_id, "owner-123")
         assert len(logs) == 0
     
-    @pytest.mark.asyncio
     async def test_input_validation(self, logging_service):
         """Test input validation for logging methods"""
         # Test empty caller_id
@@ -452,7 +466,6 @@ class TestLoggingService:
         with pytest.raises(ValueError, match="Limit must be between 1 and 1000"):
             await logging_service.get_logs_for_key("key-123", "owner-123", limit=1001)
     
-    @pytest.mark.asyncio
     async def test_privacy_protection(self, logging_service):
         """Test that sensitive payload content is not logged"""
         key_id = "key-456"
@@ -60,7 +60,6 @@ class TestMCPIntegration:
         
         return interface
     
-    @pytest.mark.asyncio
     async def test_complete_workflow(self, mcp_interface):
         """Test complete workflow: add key -> grant access -> proxy call -> list logs"""
         
@@ -176,7 +175,6 @@ class TestMCPIntegration:
         assert "logs" in result["data"]
         assert len(result["data"]["logs"]) > 0
     
-    @pytest.mark.asyncio
     async def test_unauthorized_access_flow(self, mcp_interface):
         """Test that unauthorized access is properly blocked"""
         
@@ -198,7 +196,6 @@ class TestMCPIntegration:
         assert result["success"] is False
         assert result["error"]["error_code"] == "UNAUTHORIZED"
     
-    @pytest.mark.asyncio
     async def test_rate_limit_enforcement(self, mcp_interface):
         """Test that rate limits are properly enforced"""
         
@@ -237,7 +234,6 @@ class TestMCPIntegration:
         assert result["error"]["error_code"] == "RATE_LIMIT_EXCEEDED"
         assert result["error"]["retry_after"] == 86400  # 24 hours
     
-    @pytest.mark.asyncio
     async def test_session_validation(self, mcp_interface):
         """Test Coral session validation"""
         
@@ -259,7 +255,6 @@ class TestMCPIntegration:
         with pytest.raises(ValueError):
             await mcp_interface.validate_coral_session("")
     
-    @pytest.mark.asyncio
     async def test_error_handling_and_logging(self, mcp_interface):
         """Test that errors are properly handled and logged"""
         
@@ -74,7 +74,6 @@ class TestMCPInterface:
         """Create MCP interface with mocked services"""
         return MCPInterface(**mock_services)
     
-    @pytest.mark.asyncio
     async def test_validate_coral_session_valid(self, mcp_interface):
         """Test valid Coral session validation"""
         session_id = "coral_session_123"
@@ -84,7 +83,6 @@ class TestMCPInterface:
         
         assert result == wallet_id
     
-    @pytest.mark.asyncio
     async def test_validate_coral_session_no_wallet(self, mcp_interface):
         """Test Coral session validation without wallet ID"""
         session_id = "coral_session_123"
@@ -93,7 +91,6 @@ class TestMCPInterface:
         
         assert result == session_id
     
-    @pytest.mark.asyncio
     async def test_validate_coral_session_invalid_format(self, mcp_interface):
         """Test invalid Coral session format"""
         session_id = "invalid_session_123"
@@ -101,7 +98,6 @@ class TestMCPInterface:
         with pytest.raises(ValueError, match="Invalid session ID format"):
             await mcp_interface.validate_coral_session(session_id)
     
-    @pytest.mark.asyncio
     async def test_validate_coral_session_empty(self, mcp_interface):
         """Test empty Coral session ID"""
         with pytest.raises(ValueError, match="Invalid session ID: empty or None"):
@@ -110,7 +106,6 @@ class TestMCPInterface:
         with pytest.raises(ValueError, match="Invalid session ID: empty or None"):
             await mcp_interface.validate_coral_session(None)
     
-    @pytest.mark.asyncio
     async def test_handle_mcp_request_invalid_structure(self, mcp_interface):
         """Test handling invalid MCP request structure"""
         request = "not a dict"
@@ -120,7 +115,6 @@ class TestMCPInterface:
         assert result["success"] is False
         assert result["error"]["error_code"] == "INVALID_REQUEST"
     
-    @pytest.mark.asyncio
     async def test_handle_mcp_request_missing_method(self, mcp_interface):
         """Test handling MCP request without method"""
         request = {"session_id": "coral_session_123", "params": {}}
@@ -130,7 +124,6 @@ class TestMCPInterface:
         assert result["success"] is False
         assert result["error"]["error_code"] == "MISSING_METHOD"
     
-    @pytest.mark.asyncio
     async def test_handle_mcp_request_invalid_session(self, mcp_interface):
         """Test handling MCP request with invalid session"""
         request = {
@@ -144,7 +137,6 @@ class TestMCPInterface:
         assert result["success"] is False
         assert result["error"]["error_code"] == "AUTH_FAILED"
     
-    @pytest.mark.asyncio
     async def test_handle_mcp_request_unknown_method(self, mcp_interface):
         """Test handling MCP request with unknown method"""
         request = {
@@ -158,7 +150,6 @@ class TestMCPInterface:
         assert result["success"] is False
         assert result["error"]["error_code"] == "UNKNOWN_METHOD"
     
-    @pytest.mark.asyncio
     async def test_handle_add_key_success(self, mcp_interface, mock_services):
         """Test successful add_key handling"""
         mock_services['key_manager'].store_key.return_value = "key_123"
@@ -181,7 +172,6 @@ class TestMCPInterface:
         )
         mock_services['logging_service'].log_proxy_call.assert_called_once()
     
-    @pytest.mark.asyncio
     async def test_handle_add_key_missing_params(self, mcp_interface):
         """Test add_key with missing parameters"""
         request = {
@@ -195,7 +185,6 @@ class TestMCPInterface:
         assert result["success"] is False
         assert result["error"]["error_code"] == "MISSING_PARAMS"
     
-    @pytest.mark.asyncio
     async def test_handle_grant_access_success(self, mcp_interface, mock_services):
         """Test successful grant_access handling"""
         mock_services['key_manager'].verify_key_ownership.return_value = True
@@ -221,7 +210,6 @@ class TestMCPInterface:
         )
         mock_services['authorization_engine'].create_grant.assert_called_once()
     
-    @pytest.mark.asyncio
     async def test_handle_grant_access_unauthorized(self, mcp_interface, mock_services):
         """Test grant_access with unauthorized key access"""
         mock_services['key_manager'].verify_key_ownership.return_value = False
@@ -240,7 +228,6 @@ class TestMCPInterface:
         assert result["success"] is False
         assert result["error"]["error_code"] == "UNAUTHORIZED"
     
-    @pytest.mark.asyncio
     async def test_handle_proxy_call_success(self, mcp_interface, mock_services):
         """Test successful proxy_call handling"""
         from sage.models.access_grant import AccessGrant
@@ -292,7 +279,6 @@ class TestMCPInterface:
         mock_services['policy_engine'].increment_usage.assert_called_once()
         mock_services['logging_service'].log_proxy_call.assert_called_once()
     
-    @pytest.mark.asyncio
     async def test_handle_proxy_call_unauthorized(self, mcp_interface, mock_services):
         """Test proxy_call with unauthorized access"""
         mock_services['authorization_engine'].check_authorization.return_value = False
@@ -312,7 +298,6 @@ class TestMCPInterface:
         assert result["error"]["error_code"] == "UNAUTHORIZED"
         mock_services['logging_service'].log_authorization_failed.assert_called_once()
     
-    @pytest.mark.asyncio
     async def test_handle_proxy_call_rate_limited(self, mcp_interface, mock_services):
         """Test proxy_call with rate limit exceeded"""
         from sage.models.access_grant import AccessGrant
@@ -350,7 +335,6 @@ class TestMCPInterface:
         assert result["error"]["retry_after"] == 86400  # 24 hours
         mock_services['logging_service'].log_rate_limit_blocked.assert_called_once()
     
-    @pytest.mark.asyncio
     async def test_handle_list_logs_success(self, mcp_interface, mock_services):
         """Test successful list_logs handling"""
         mock_services['key_manager'].verify_key_ownership.return_value = True
@@ -377,7 +361,6 @@ class TestMCPInterface:
             "key_123", "coral_session_123"
         )
     
-    @pytest.mark.asyncio
     async def test_handle_list_logs_unauthorized(self, mcp_interface, mock_services):
         """Test list_logs with unauthorized key access"""
         mock_services['key_manager'].verify_key_ownership.return_value = False
@@ -393,7 +376,6 @@ class TestMCPInterface:
         assert result["success"] is False
         assert result["error"]["error_code"] == "UNAUTHORIZED"
     
-    @pytest.mark.asyncio
     async def test_handle_exception_in_request(self, mcp_interface, mock_services):
         """Test handling unexpected exceptions"""
         mock_services['key_manager'].store_key.side_effect = Exception("Database error")
@@ -44,7 +44,6 @@ class TestPolicyEngine:
             granted_by="owner-789"
         )
     
-    @pytest.mark.asyncio
     async def test_database_initialization(self, policy_engine):
         """Test that database is properly initialized"""
         # Database should be created and accessible
@@ -56,7 +55,6 @@ class TestPolicyEngine:
             tables = [row[0] for row in cursor.fetchall()]
             assert 'usage_counters' in tables
     
-    @pytest.mark.asyncio
     async def test_increment_usage_new_counter(self, policy_engine):
         """Test incrementing usage creates new counter"""
         key_id = "test-key-123"
@@ -78,7 +76,6 @@ class TestPolicyEngine:
         assert stats[0]['total_payload_size'] == payload_size
         assert stats[0]['average_response_time'] == response_time
     
-    @pytest.mark.asyncio
     async def test_increment_usage_existing_counter(self, policy_engine):
         """Test incrementing usage updates existing counter"""
         key_id = "test-key-123"
@@ -101,7 +98,6 @@ class TestPolicyEngine:
         assert stats[0]['total_payload_size'] == 800
         assert stats[0]['average_response_time'] == 150.0  # (100 + 200) / 2
     
-    @pytest.mark.asyncio
     async def test_check_rate_limit_within_limit(self, policy_engine, sample_grant):
         """Test rate limit check when within limit"""
         key_id = sample_grant.key_id
@@ -115,7 +111,6 @@ class TestPolicyEngine:
         within_limit = await policy_engine.check_rate_limit(key_id, caller_id, sample_grant)
         assert within_limit is True
     
-    @pytest.mark.asyncio
     async def test_check_rate_limit_exceeded(self, policy_engine, sample_grant):
         """Test rate limit check when limit exceeded"""
         key_id = sample_grant.key_id
@@ -129,7 +124,6 @@ class TestPolicyEngine:
         within_limit = await policy_engine.check_rate_limit(key_id, caller_id, sample_grant)
         assert within_limit is False
     
-    @pytest.mark.asyncio
     async def test_check_rate_limit_at_limit(self, policy_engine, sample_grant):
         """Test rate limit check when exactly at limit"""
         key_id = sample_grant.key_id
@@ -143,7 +137,6 @@ class TestPolicyEngine:
         within_limit = await policy_engine.check_rate_limit(key_id, caller_id, sample_grant)
         assert within_limit is False
     
-    @pytest.mark.asyncio
     async def test_check_rate_limit_invalid_params(self, policy_engine, sample_grant):
         """Test rate limit check with invalid parameters"""
         # Empty key_id
@@ -158,7 +151,6 @@ class TestPolicyEngine:
         result = await policy_engine.check_rate_limit("key", "caller", None)
         assert result is False
     
-    @pytest.mark.asyncio
     async def test_check_rate_limit_invalid_grant_permissions(self, policy_engine):
         """Test rate limit check with invalid grant permissions"""
         # Grant with zero max calls
@@ -178,13 +170,11 @@ class TestPolicyEngine:
         result = await policy_engine.check_rate_limit("test-key", "caller", grant)
         assert result is False
     
-    @pytest.mark.asyncio
     async def test_get_current_usage_no_usage(self, policy_engine):
         """Test getting current usage when no usage exists"""
         usage = await policy_engine.get_current_usage("nonexistent-key", "nonexistent-caller")
         assert usage == 0
     
-    @pytest.mark.asyncio
     async def test_get_current_usage_with_date(self, policy_engine):
         """Test getting current usage for specific date"""
         key_id = "test-key-123"
@@ -212,7 +202,6 @@ class TestPolicyEngine:
         usage = await policy_engine.get_current_usage(key_id, caller_id)
         assert usage == 0
     
-    @pytest.mark.asyncio
     async def test_reset_daily_counters(self, policy_engine):
         """Test resetting daily counters"""
         key_id = "test-key-123"
@@ -235,7 +224,6 @@ class TestPolicyEngine:
         usage = await policy_engine.get_current_usage(key_id, caller_id)
         assert usage == 0
     
-    @pytest.mark.asyncio
     async def test_cleanup_old_counters(self, policy_engine):
         """Test cleaning up old usage counters"""
         key_id = "test-key-123"
@@ -277,7 +265,6 @@ class TestPolicyEngine:
         assert len(stats) == 1
         assert stats[0]['date'] == recent_date.isoformat()
     
-    @pytest.mark.asyncio
     async def test_get_usage_stats_filtered(self, policy_engine):
         """Test getting usage statistics with filters"""
         key_id = "test-key-123"
@@ -301,7 +288,6 @@ class TestPolicyEngine:
         assert len(caller2_stats) == 1
         assert caller2_stats[0]['caller_id'] == caller2
     
-    @pytest.mark.asyncio
     async def test_get_usage_stats_date_range(self, policy_engine):
         """Test getting usage statistics with date range"""
         key_id = "test-key-123"
@@ -355,7 +341,6 @@ class TestPolicyEngine:
         )
         assert len(all_stats) == 2
     
-    @pytest.mark.asyncio
     async def test_get_rate_limit_status(self, policy_engine, sample_grant):
         """Test getting detailed rate limit status"""
         key_id = sample_grant.key_id
@@ -376,7 +361,6 @@ class TestPolicyEngine:
         assert status['rate_limit_exceeded'] is False
         assert 'reset_time' in status
     
-    @pytest.mark.asyncio
     async def test_get_rate_limit_status_exceeded(self, policy_engine, sample_grant):
         """Test getting rate limit status when exceeded"""
         key_id = sample_grant.key_id
@@ -393,7 +377,6 @@ class TestPolicyEngine:
         assert status['remaining_calls'] == 0
         assert status['rate_limit_exceeded'] is True
     
-    @pytest.mark.asyncio
     async def test_per_caller_per_key_isolation(self, policy_engine):
         """Test that rate limits are isolated per caller per key"""
         key1 = "key-123"
@@ -444,14 +427,12 @@ class TestPolicyEngine:
         assert await policy_engine.get_current_usage(key1, caller2) == 12
         assert await policy_engine.get_current_usage(key2, caller2) == 0  # No usage
     
-    @pytest.mark.asyncio
     async def test_update_policy_placeholder(self, policy_engine):
         """Test policy update placeholder functionality"""
         # For MVP, this is just a placeholder
         result = await policy_engine.update_policy("key-123", {"max_calls": 200}, "owner-456")
         assert result is True
     
-    @pytest.mark.asyncio
     async def test_increment_usage_invalid_params(self, policy_engine):
         """Test increment usage with invalid parameters"""
         # Should handle gracefully without errors
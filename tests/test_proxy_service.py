@@ -26,7 +26,6 @@ class TestProxyService:
         response.text = AsyncMock(return_value='{"result": "success"}')
         return response
     
-    @pytest.mark.asyncio
     async def test_inject_api_key_openai(self, proxy_service):
         """Test API key injection for OpenAI"""
         headers = {}
@@ -37,7 +36,6 @@ class TestProxyService:
         
         assert result["Authorization"] == "Bearer sk-test123"
     
-    @pytest.mark.asyncio
     async def test_inject_api_key_anthropic(self, proxy_service):
         """Test API key injection for Anthropic"""
         headers = {}
@@ -48,7 +46,6 @@ class TestProxyService:
         
         assert result["x-api-key"] == "sk-ant-test123"
     
-    @pytest.mark.asyncio
     async def test_inject_api_key_github(self, proxy_service):
         """Test API key injection for GitHub"""
         headers = {}
@@ -59,7 +56,6 @@ class TestProxyService:
         
         assert result["Authorization"] == "token ghp_test123"
     
-    @pytest.mark.asyncio
     async def test_inject_api_key_default(self, proxy_service):
         """Test default API key injection"""
         headers = {}
@@ -70,7 +66,6 @@ class TestProxyService:
         
         assert result["Authorization"] == "Bearer test123"
     
-    @pytest.mark.asyncio
     async def test_inject_api_key_preserves_existing(self, proxy_service):
         """Test that existing headers are preserved"""
         headers = {"User-Agent": "TestAgent", "Content-Type": "application/json"}
@@ -83,7 +78,6 @@ class TestProxyService:
         assert result["Content-Type"] == "application/json"
         assert result["Authorization"] == "Bearer test123"
     
-    @pytest.mark.asyncio
     async def test_make_proxied_call_success(self, proxy_service, mock_response):
         """Test successful proxied call"""
         with patch('aiohttp.ClientSession.request') as mock_request:
@@ -106,7 +100,6 @@ class TestProxyService:
             assert response_time >= 0  # Allow for 0 or positive response time
             assert payload_size == 0  # GET request has no body
     
-    @pytest.mark.asyncio
     async def test_make_proxied_call_with_body(self, proxy_service, mock_response):
         """Test proxied call with request body"""
         with patch('aiohttp.ClientSession.request') as mock_request:
@@ -130,7 +123,23 @@ class TestProxyService:
             assert call_args[1]["url"] == "https://api.example.com/data"
             assert "Authorization" in call_args[1]["headers"]
     
-    @pytest.mark.asyncio
+    async def test_make_proxied_call_with_raw_body(self, proxy_service, mock_response):
+        """Test that a raw bytes body is forwarded without re-encoding"""
+        with patch('aiohttp.ClientSession.request') as mock_request:
+            mock_request.return_value.__aenter__.return_value = mock_response
+            
+            body = b'{"message": "Hello, world!"}'
+            result, response_time, payload_size = await proxy_service.make_proxied_call(
+                target_url="https://api.example.com/data",
+                method="POST",
+                body=body,
+                api_key="test123"
+            )
+            
+            assert result["status_code"] == 200
+            assert payload_size == len(body)
+            assert mock_request.call_args[1]["data"] is body
+    
     async def test_make_proxied_call_invalid_url(self, proxy_service):
         """Test proxied call with invalid URL"""
         with pytest.raises(ValueError, match="Invalid URL"):
@@ -140,7 +149,6 @@ class TestProxyService:
                 api_key="test123"
             )
     
-    @pytest.mark.asyncio
     async def test_make_proxied_call_timeout(self, proxy_service):
         """Test proxied call timeout"""
         with patch('aiohttp.ClientSession.request') as mock_request:
@@ -153,7 +161,6 @@ class TestProxyService:
                     api_key="test123"
                 )
     
-    @pytest.mark.asyncio
     async def test_make_proxied_call_non_json_response(self, proxy_service):
         """Test proxied call with non-JSON response"""
         mock_response = MagicMock()
@@ -173,7 +180,6 @@ class TestProxyService:
             assert result["status_code"] == 200
             assert result["data"] == {"raw_response": "Plain text response"}
     
-    @pytest.mark.asyncio
     async def test_measure_performance(self, proxy_service):
         """Test performance measurement"""
         import time
@@ -189,7 +195,6 @@ class TestProxyService:
         assert metrics["payload_size_bytes"] == 1024
         assert "timestamp" in metrics
     
-    @pytest.mark.asyncio
     async def test_session_management(self, proxy_service):
         """Test HTTP session management"""
         # Initially no session
@@ -208,7 +213,21 @@ class TestProxyService:
         await proxy_service.close()
         assert proxy_service._session.closed
     
-    @pytest.mark.asyncio
+    async def test_open_creates_pooled_session(self):
+        """Test that open() creates the session with the configured pool limits"""
+        proxy_service = ProxyService(max_connections=5, max_connections_per_host=2)
+        
+        await proxy_service.open()
+        session = proxy_service._session
+        assert session is not None
+        assert session.connector.limit == 5
+        assert session.connector.limit_per_host == 2
+        
+        # Later calls reuse the same session
+        assert await proxy_service._get_session() is session
+        
+        await proxy_service.close()
+    
     async def test_close_no_session(self, proxy_service):
         """Test closing when no session exists"""
         # Should not raise an error
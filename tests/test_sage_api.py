@@ -0,0 +1,98 @@
+"""
+Tests for the Sage API's memoized key lists
+"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+import sage_api
+from sage.sage_mcp import SageMCP
+
+
+SESSION = "coral_owner_session_123"
+KEY = {"key_id": "key-456", "key_name": "test-key"}
+
+
+@pytest.fixture
+def key_manager():
+    """Key manager stub whose list_keys result tests can change"""
+    manager = AsyncMock()
+    manager.list_keys.return_value = [KEY]
+    manager.store_key.return_value = "key-789"
+    manager.revoke_key.return_value = True
+    return manager
+
+
+@pytest.fixture
+def sage(tmp_path, monkeypatch, key_manager):
+    """SageMCP wired to the API's key-list memo, with databases under tmp_path"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sage_api, "_KEYS_CACHE_TTL", 30.0)
+    monkeypatch.setattr(sage_api, "_KEYS_CACHE", {})
+    sage = SageMCP(key_manager=key_manager, logging_service=AsyncMock())
+    sage.on_keys_changed = sage_api._invalidate_keys_cache
+    return sage
+
+
+async def test_key_list_is_memoized(sage, key_manager):
+    """Test that repeated lookups for a session reuse the first result"""
+    assert await sage_api._list_keys_cached(sage, SESSION) == [KEY]
+    assert await sage_api._list_keys_cached(sage, SESSION) == [KEY]
+    assert key_manager.list_keys.await_count == 1
+
+
+async def test_add_key_invalidates_memo(sage, key_manager):
+    """Test that adding a key makes the next lookup include it"""
+    await sage_api._list_keys_cached(sage, SESSION)
+    new_key = {"key_id": "key-789", "key_name": "new-key"}
+    key_manager.list_keys.return_value = [KEY, new_key]
+
+    await sage.add_key("new-key", "sk-test", SESSION)
+
+    assert await sage_api._list_keys_cached(sage, SESSION) == [KEY, new_key]
+
+
+async def test_revoke_key_invalidates_memo(sage, key_manager):
+    """Test that a revoked key disappears from the next lookup"""
+    await sage_api._list_keys_cached(sage, SESSION)
+    key_manager.list_keys.return_value = []
+
+    assert await sage.revoke_key(KEY["key_id"], SESSION) is True
+
+    assert await sage_api._list_keys_cached(sage, SESSION) == []
+
+
+async def test_mcp_add_key_invalidates_memo(sage, key_manager):
+    """Test that a key added through an MCP request invalidates the memo too"""
+    await sage_api._list_keys_cached(sage, SESSION)
+    new_key = {"key_id": "key-789", "key_name": "new-key"}
+    key_manager.list_keys.return_value = [KEY, new_key]
+
+    response = await sage.handle_mcp_request({
+        "method": "add_key",
+        "params": {"key_name": "new-key", "api_key": "sk-test"},
+        "session_id": SESSION
+    })
+
+    assert response["success"] is True
+    assert await sage_api._list_keys_cached(sage, SESSION) == [KEY, new_key]
+
+
+async def test_failed_lookup_is_not_memoized(sage, key_manager):
+    """Test that a transient list_keys failure is retried on the next lookup"""
+    key_manager.list_keys.side_effect = RuntimeError("database unavailable")
+    assert await sage_api._list_keys_cached(sage, SESSION) == []
+
+    key_manager.list_keys.side_effect = None
+    assert await sage_api._list_keys_cached(sage, SESSION) == [KEY]
+
+
+async def test_memo_is_off_without_ttl(sage, key_manager, monkeypatch):
+    """Test that every lookup reaches the key manager when the memo is disabled"""
+    monkeypatch.setattr(sage_api, "_KEYS_CACHE_TTL", 0.0)
+
+    await sage_api._list_keys_cached(sage, SESSION)
+    await sage_api._list_keys_cached(sage, SESSION)
+
+    assert key_manager.list_keys.await_count == 2
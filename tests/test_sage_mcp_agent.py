@@ -0,0 +1,50 @@
+"""
+Tests for the Sage agent's in-process tool wiring
+"""
+
+import re
+
+import orjson
+import pytest
+
+pytest.importorskip("langchain_core")
+
+from sage_mcp_agent_fixed import AGENT_SYSTEM_PROMPT_INPROC, get_inproc_tools
+from sage_mcp_server import SageMCPServer
+
+
+@pytest.fixture
+def sage_server(tmp_path, monkeypatch):
+    """SageMCPServer with its databases under tmp_path"""
+    monkeypatch.chdir(tmp_path)
+    return SageMCPServer()
+
+
+def test_inproc_tools_match_server_tools(sage_server):
+    """Test that every server tool becomes an agent tool with the server's argument schema"""
+    tools = get_inproc_tools(sage_server)
+
+    assert [tool.name for tool in tools] == [tool.name for tool in sage_server._tool_list]
+    store = next(tool for tool in tools if tool.name == "store_api_key")
+    assert set(store.args) == {"key_name", "api_key", "owner_session"}
+
+
+def test_inproc_prompt_names_only_inproc_tools(sage_server):
+    """Test that the in-process system prompt points the model only at tools it can call"""
+    prompt_tools = set(re.findall(r"Use the (\w+) tool", AGENT_SYSTEM_PROMPT_INPROC))
+
+    assert prompt_tools
+    assert prompt_tools <= {tool.name for tool in sage_server._tool_list}
+
+
+async def test_inproc_tool_calls_server(sage_server):
+    """Test that invoking an in-process tool runs the server's handler"""
+    async def list_keys(owner_session):
+        return [{"key_id": "key-456", "key_name": "test-key"}]
+    sage_server._sage_list_keys = list_keys
+
+    tool = next(tool for tool in get_inproc_tools(sage_server) if tool.name == "list_my_keys")
+    result = orjson.loads(await tool.ainvoke({"owner_session": "owner-123"}))
+
+    assert result["success"] is True
+    assert result["keys"] == [{"key_id": "key-456", "key_name": "test-key"}]
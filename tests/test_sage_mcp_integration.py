@@ -74,7 +74,6 @@ async def sage_mcp(temp_databases):
 class TestSageMCPIntegration:
     """Integration tests for complete SageMCP workflows"""
     
-    @pytest.mark.asyncio
     async def test_complete_workflow_agent_a_to_agent_b(self, sage_mcp):
         """
         Test complete workflow: Agent A stores key → grants access to Agent B → Agent B makes calls
@@ -163,7 +162,6 @@ class TestSageMCPIntegration:
         assert proxy_log['key_id'] == key_id
         assert proxy_log['response_code'] == 200
     
-    @pytest.mark.asyncio
     async def test_rate_limiting_workflow(self, sage_mcp):
         """
         Test rate limiting: Agent B hits rate limit after exceeding max_calls_per_day
@@ -240,7 +238,6 @@ class TestSageMCPIntegration:
         assert rate_limit_log['caller_id'] == agent_b_session
         assert rate_limit_log['response_code'] == 429
     
-    @pytest.mark.asyncio
     async def test_authorization_failure_workflow(self, sage_mcp):
         """
         Test authorization failure: Agent C tries to use key without grant
@@ -279,7 +276,6 @@ class TestSageMCPIntegration:
         assert auth_fail_log['caller_id'] == agent_c_session
         assert auth_fail_log['response_code'] == 403
     
-    @pytest.mark.asyncio
     async def test_key_revocation_workflow(self, sage_mcp):
         """
         Test key revocation: Agent A revokes key, Agent B can no longer use it
@@ -337,7 +333,6 @@ class TestSageMCPIntegration:
         
         assert "access denied" in str(exc_info.value).lower()
     
-    @pytest.mark.asyncio
     async def test_grant_expiration_workflow(self, sage_mcp):
         """
         Test grant expiration: Grant expires and Agent B loses access
@@ -381,7 +376,6 @@ class TestSageMCPIntegration:
         
         assert "access denied" in str(exc_info.value).lower()
     
-    @pytest.mark.asyncio
     async def test_error_handling_and_logging(self, sage_mcp):
         """
         Test comprehensive error handling and privacy-aware logging
@@ -446,7 +440,6 @@ class TestSageMCPIntegration:
         error_logs = [log for log in logs if log.get('error_message') is not None]
         assert len(error_logs) >= 1
     
-    @pytest.mark.asyncio
     async def test_mcp_protocol_integration(self, sage_mcp):
         """
         Test MCP protocol request handling
@@ -515,7 +508,6 @@ class TestSageMCPIntegration:
         assert "logs" in response["data"]
         assert len(response["data"]["logs"]) >= 1
     
-    @pytest.mark.asyncio
     async def test_usage_statistics_and_cleanup(self, sage_mcp):
         """
         Test usage statistics and cleanup operations
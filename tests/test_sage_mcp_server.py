@@ -0,0 +1,195 @@
+"""
+Tests for the Sage MCP server: queued audit logging, batching and argument validation
+"""
+
+import asyncio
+
+import orjson
+import pytest
+
+from sage.services.logging_service import LoggingService
+from sage_mcp_server import SageMCPServer
+
+
+def _proxy_log(logging_service, key_id="key-456"):
+    """Build a validated proxy_call audit log entry"""
+    return logging_service._new_log_entry(
+        caller_id="caller-123",
+        key_id=key_id,
+        action="proxy_call",
+        method="GET",
+        endpoint="/api/v1/items",
+        payload_size=0,
+        response_time=10.0,
+        response_code=200
+    )
+
+
+@pytest.fixture
+async def server(tmp_path, monkeypatch):
+    """SageMCPServer with its audit worker running and databases under tmp_path"""
+    monkeypatch.chdir(tmp_path)
+    server = SageMCPServer()
+    server.sage.logging_service = LoggingService(db_path=str(tmp_path / "audit.db"))
+    server._audit_task = asyncio.create_task(server._audit_worker())
+    yield server
+    server._audit_task.cancel()
+    try:
+        await server._audit_task
+    except asyncio.CancelledError:
+        pass
+
+
+async def _count_logs(server, key_id="key-456"):
+    """Number of audit logs for key_id, read through the cached view_audit_logs tool"""
+    result = await server._dispatch("view_audit_logs", {"key_id": key_id, "owner_session": "owner-123"})
+    return orjson.loads(result.content[0].text)["count"]
+
+
+async def test_queued_logs_invalidate_cached_reads(server):
+    """Test that a cached audit log read sees rows written later by the audit worker"""
+    logging_service = server.sage.logging_service
+
+    async def list_logs(key_id, filters, owner_session):
+        return await logging_service.get_logs_for_key(key_id, owner_session)
+    server._sage_list_logs = list_logs
+
+    assert await _count_logs(server) == 0
+
+    server._audit_queue.put_nowait(_proxy_log(logging_service))
+    await server._audit_queue.join()
+
+    assert await _count_logs(server) == 1
+
+
+async def test_failed_batch_is_retried_per_entry(server):
+    """Test that one unwritable entry does not drop the rest of its batch"""
+    logging_service = server.sage.logging_service
+    good = _proxy_log(logging_service)
+    written = _proxy_log(logging_service)
+    await logging_service.write_log_entries([written])
+
+    # Re-inserting an existing log_id fails the batch write
+    server._audit_queue.put_nowait(good)
+    server._audit_queue.put_nowait(written)
+    await server._audit_queue.join()
+
+    logs = await logging_service.get_logs_for_key("key-456", "owner-123")
+    assert {log["log_id"] for log in logs} == {good.log_id, written.log_id}
+
+
+async def test_result_links_are_not_cached(server, monkeypatch):
+    """Test that a large read result is linked afresh instead of served from the read cache"""
+    monkeypatch.setattr("sage_mcp_server._INLINE_MAX_BYTES", 1)
+
+    async def list_keys(owner_session):
+        return [{"key_id": "key-456", "key_name": "test-key"}]
+    server._sage_list_keys = list_keys
+
+    links = []
+    for _ in range(2):
+        result = await server._dispatch("list_my_keys", {"owner_session": "owner-123"})
+        links.append(orjson.loads(result.content[0].text)["resource"])
+
+    assert links[0] != links[1]
+    assert not server._read_cache
+
+
+def _texts(result):
+    """Decode the JSON text blocks of a CallToolResult"""
+    return [orjson.loads(block.text) for block in result.content]
+
+
+async def test_batch_mixed_results(server):
+    """Test that a batch reports each call's result and fails only as a whole when all calls fail"""
+    async def list_keys(owner_session):
+        return [{"key_id": "key-456", "key_name": "test-key"}]
+    async def revoke_key(key_id, owner_session):
+        raise RuntimeError("database unavailable")
+    server._sage_list_keys = list_keys
+    server._sage_revoke_key = revoke_key
+
+    result = await server._dispatch("batch", {"invocations": [
+        {"tool_name": "list_my_keys", "arguments": {"owner_session": "owner-123"}},
+        {"tool_name": "revoke_api_key", "arguments": {"key_id": "key-456", "owner_session": "owner-123"}}
+    ]})
+
+    listed, revoked = _texts(result)
+    assert not result.isError
+    assert listed["success"] is True
+    assert listed["count"] == 1
+    assert revoked == {"success": False, "error": "database unavailable"}
+
+
+async def test_batch_rejects_nested_batch(server):
+    """Test that a nested batch call fails on its own without running"""
+    result = await server._dispatch("batch", {"invocations": [
+        {"tool_name": "batch", "arguments": {"invocations": []}}
+    ]})
+
+    assert result.isError
+    assert _texts(result) == [{
+        "success": False,
+        "tool_name": "batch",
+        "error": "batch calls cannot be nested"
+    }]
+
+
+async def test_batch_runs_calls_concurrently_under_semaphore(server):
+    """Test that batched calls overlap, but never more than the semaphore allows"""
+    server._batch_semaphore = asyncio.Semaphore(2)
+    running = 0
+    peak = 0
+
+    async def list_keys(owner_session):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return []
+    server._sage_list_keys = list_keys
+
+    result = await server._dispatch("batch", {"invocations": [
+        {"tool_name": "list_my_keys", "arguments": {"owner_session": f"owner-{i}"}}
+        for i in range(4)
+    ]})
+
+    assert not result.isError
+    assert len(result.content) == 4
+    assert peak == 2
+
+
+async def test_invalid_arguments_are_rejected(server):
+    """Test that arguments failing the tool schema never reach the handler"""
+    async def add_key(**kwargs):
+        raise AssertionError("handler must not run")
+    server._sage_add_key = add_key
+
+    result = await server._dispatch("store_api_key", {"key_name": "test-key", "owner_session": "owner-123"})
+
+    assert result.isError
+    error = _texts(result)[0]
+    assert error["success"] is False
+    assert error["error"].startswith("Invalid arguments for store_api_key: ")
+    assert "api_key" in error["error"]
+
+
+async def test_schema_defaults_are_filled_in(server):
+    """Test that omitted arguments with schema defaults reach the handlers with those defaults"""
+    seen = {}
+
+    async def list_logs(key_id, filters, owner_session):
+        seen["filters"] = filters
+        return []
+    async def get_usage_stats(key_id, owner_session, days):
+        seen["days"] = days
+        return {}
+    server._sage_list_logs = list_logs
+    server._sage_get_usage_stats = get_usage_stats
+
+    args = {"key_id": "key-456", "owner_session": "owner-123"}
+    assert not (await server._dispatch("view_audit_logs", dict(args))).isError
+    assert not (await server._dispatch("get_usage_statistics", dict(args))).isError
+
+    assert seen == {"filters": {"limit": 50}, "days": 7}